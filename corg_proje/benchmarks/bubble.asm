@@ -0,0 +1,30 @@
+# 200 elemanlı diziyi sözde rastgele doldurup bubble sort ile sıralar (lw/sw ağırlıklı)
+# Varsayılan 512 byte bellek yetmez: python mips_cli.py benchmarks/bubble.asm --memory-size 65536
+        addi $s0, $zero, 200      # eleman sayısı
+        sll $s1, $s0, 2           # dizi boyutu (byte)
+        addi $t9, $zero, 1023     # değer maskesi
+        addi $t0, $zero, 0        # adres
+        addi $t1, $zero, 7        # x
+fill:   sll $t2, $t1, 2
+        add $t1, $t2, $t1         # x = 5x + 13 (mod 1024)
+        addi $t1, $t1, 13
+        and $t1, $t1, $t9
+        sw $t1, 0($t0)
+        addi $t0, $t0, 4
+        bne $t0, $s1, fill
+        addi $s2, $s1, -4         # bu turda karşılaştırılacak son adres
+outer:  addi $t0, $zero, 0
+        addi $s3, $zero, 0        # takas yapıldı mı
+inner:  lw $t1, 0($t0)
+        lw $t2, 4($t0)
+        slt $t3, $t2, $t1
+        beq $t3, $zero, noswap
+        sw $t2, 0($t0)
+        sw $t1, 4($t0)
+        addi $s3, $zero, 1
+noswap: addi $t0, $t0, 4
+        bne $t0, $s2, inner
+        addi $s2, $s2, -4
+        beq $s2, $zero, done
+        bne $s3, $zero, outer
+done:   halt
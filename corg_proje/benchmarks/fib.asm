@@ -0,0 +1,27 @@
+# Özyinelemeli fibonacci(18) = 2584; jal/jr ve yığın kullanır (sonuç $s0'da)
+# Varsayılan 512 byte bellek yetmez: python mips_cli.py benchmarks/fib.asm --memory-size 65536
+        addi $sp, $zero, 32764
+        addi $a0, $zero, 18
+        jal fib
+        add $s0, $v0, $zero
+        j done
+fib:    addi $t1, $zero, 2
+        slt $t0, $a0, $t1
+        beq $t0, $zero, recurse
+        add $v0, $a0, $zero       # fib(0) = 0, fib(1) = 1
+        jr $ra
+recurse: addi $sp, $sp, -12
+        sw $ra, 0($sp)
+        sw $a0, 4($sp)
+        addi $a0, $a0, -1
+        jal fib                   # fib(n - 1)
+        sw $v0, 8($sp)
+        lw $a0, 4($sp)
+        addi $a0, $a0, -2
+        jal fib                   # fib(n - 2)
+        lw $t0, 8($sp)
+        add $v0, $v0, $t0
+        lw $ra, 0($sp)
+        addi $sp, $sp, 12
+        jr $ra
+done:   halt
@@ -0,0 +1,9 @@
+# Sayaç döngüsü: 10 x 20000 iterasyon, sadece ALU ve dallanma
+        addi $s0, $zero, 10
+outer:  addi $t0, $zero, 20000
+inner:  addi $t0, $t0, -1
+        addi $t1, $t1, 3
+        bne $t0, $zero, inner
+        addi $s0, $s0, -1
+        bne $s0, $zero, outer
+        halt
@@ -0,0 +1,19 @@
+# 4 KiB'lık bloğu 0 adresinden 4096 adresine 16 kez kopyalar (en az 8 KiB bellek gerekir)
+# Varsayılan 512 byte bellek yetmez: python mips_cli.py benchmarks/memcpy.asm --memory-size 65536
+        addi $s1, $zero, 4096     # hedef
+        addi $s2, $zero, 4096     # boyut (byte)
+        addi $t0, $zero, 0
+fill:   add $t1, $t0, $t0
+        sw $t1, 0($t0)
+        addi $t0, $t0, 4
+        bne $t0, $s2, fill
+        addi $s3, $zero, 16       # tekrar sayısı
+repeat: addi $t0, $zero, 0
+copy:   lw $t1, 0($t0)
+        add $t2, $t0, $s1
+        sw $t1, 0($t2)
+        addi $t0, $t0, 4
+        bne $t0, $s2, copy
+        addi $s3, $s3, -1
+        bne $s3, $zero, repeat
+        halt
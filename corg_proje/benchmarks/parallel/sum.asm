@@ -0,0 +1,17 @@
+# Paralel toplam (mips_multicore): hart $a0, 1..200000 arasında $a0 + 1'den başlayıp $a1 adımla ilerleyen
+# sayıları toplar ve kendi toplamını ll/sc ile 0 adresindeki ortak toplama ekler.
+# Hart sayısından bağımsız sonuç: mem[0] = 200000 * 200001 / 2 mod 2^32 = -1474736480
+        addi $t0, $a0, 1
+        addi $t1, $zero, 25000
+        sll $t1, $t1, 3
+        add $t2, $zero, $zero
+loop:   slt $t3, $t1, $t0
+        bne $t3, $zero, done
+        add $t2, $t2, $t0
+        add $t0, $t0, $a1
+        j loop
+done:   ll $t4, 0($zero)
+        add $t4, $t4, $t2
+        sc $t4, 0($zero)
+        beq $t4, $zero, done
+        halt
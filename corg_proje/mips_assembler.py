@@ -0,0 +1,299 @@
+# İki geçişli assembler.
+# 1. geçiş (parse_source) etiketleri çözer; 2. geçiş her satırı çözülmüş komuta ve 32 bitlik makine koduna
+# çevirip paketlenmiş bir array('I') içine yazar. Sonuç kaynak metnin özetine (hash) göre önbelleğe alınır,
+# değişmeyen bir program tekrar kodlanmaz. reassemble, düzenlenmiş kaynağı önceki programa göre artımlı olarak
+# assemble eder: yalnızca değişen satırlar ve yeri değişen etiketlere başvuran satırlar yeniden kodlanır.
+# Assemble edilmiş program ikili imaj (.bin) olarak kaydedilip yüklenebilir.
+# Kullanım: python mips_assembler.py program.asm [-o program.bin]
+import argparse
+import hashlib
+import json
+import struct
+import sys
+from array import array
+from collections import OrderedDict
+
+from mips_core import ExecutionError, parse_line, split_source
+from mips_isa import (FIELDS, IMM_MAX, IMM_MIN, JUMP_FORMAT, NOP_INSTRUCTION, OP_INVALID, OP_NOP, PURE_WRITE_FORMATS,
+                      REGIMM, SPECIAL, SPECIAL2, UIMM_MAX, decode_instruction, label_reference, op_encodings,
+                      op_formats, op_names, register_names)
+
+NOP_WORD = 0  # sll $zero, $zero, 0
+FIELD_SHIFTS = {"rs": 21, "rt": 16, "rd": 11, "sa": 6}  # Register ve kaydırma alanlarının bit konumları
+# (opcode, funct) -> op kimliği. funct SPECIAL/SPECIAL2'de funct alanı, REGIMM'de rt alanıdır; diğerlerinde None.
+word_ops = {encoding: op for op, encoding in op_encodings.items()}
+
+IMAGE_MAGIC = b"MIPSIMG2"  # MIPSIMG1 simülatörün eski opcode numaralarını kullanıyordu
+IMAGE_HEADER = struct.Struct("<8sII")  # magic, word sayısı, metadata uzunluğu
+CACHE_SIZE = 32  # Önbellekte tutulan en fazla program sayısı
+
+
+class AssemblyError(Exception):
+    pass
+
+
+class AssembledProgram:
+    def __init__(self, lines, labels, decoded, words, errors, digest=None, source_lines=None, line_labels=None,
+                 references=None):
+        self.lines = lines  # Etiketsiz kaynak satırları (Instruction Memory içeriği)
+        self.labels = labels
+        self.decoded = decoded  # Machine'in çalıştırdığı (op, a, b, c) komutları
+        self.words = words  # array('I'): satır başına bir makine kodu
+        self.errors = errors  # satır indeksi -> hata mesajı (o satırın word'ü 0'dır)
+        self.digest = digest
+        # Artımlı assemble için (imajdan yüklenen programlarda None): ham kaynak satırları,
+        # satırda tanımlanan etiket ve satırın başvurduğu etiket (label_reference)
+        self.source_lines = source_lines
+        self.line_labels = line_labels
+        self.references = references
+
+
+# Çözülmüş bir komutu pc satırındaki 32 bitlik word'e çevirir (gerçek MIPS32 kodlaması).
+# R-Type: opcode|rs|rt|rd|shamt|funct  I-Type: opcode|rs|rt|imm16  J-Type: opcode|hedef26
+# Dallanmalar bir sonraki komuta göre uzaklık (hedef - pc - 1), atlamalar komut indeksi olarak kodlanır.
+def encode(inst, pc=0):
+    op, a, b, c = inst
+    if op == OP_NOP:
+        return NOP_WORD
+    elif op == OP_INVALID:
+        raise AssemblyError(a)
+    opcode, funct = op_encodings[op]
+    form = op_formats[op]
+    word = opcode << 26
+    if opcode == REGIMM:
+        word |= funct << 16
+    elif funct is not None:
+        word |= funct
+    for field, value in zip(FIELDS[form], (a, b, c)):
+        if field in FIELD_SHIFTS:
+            word |= value << FIELD_SHIFTS[field]
+        elif field == "uimm":
+            if not 0 <= value <= UIMM_MAX:
+                raise AssemblyError(f"Immediate 16 bite sığmıyor: {value}")
+            word |= value
+        elif field in ("imm", "offset"):
+            if not IMM_MIN <= value <= IMM_MAX:
+                raise AssemblyError(f"Immediate 16 bite sığmıyor: {value}")
+            word |= value & 0xFFFF
+        elif field == "label":
+            if value < 0:
+                raise AssemblyError("Etiket bulunamadı")
+            if form == JUMP_FORMAT:
+                word |= value & 0x3FFFFFF
+                continue
+            offset = value - pc - 1
+            if not IMM_MIN <= offset <= IMM_MAX:
+                raise AssemblyError(f"Dallanma hedefi 16 bite sığmıyor: {value}")
+            word |= offset & 0xFFFF
+    return word
+
+
+def word_op(word):
+    opcode = word >> 26
+    if opcode == SPECIAL or opcode == SPECIAL2:
+        return word_ops.get((opcode, word & 63))
+    elif opcode == REGIMM:
+        return word_ops.get((opcode, (word >> 16) & 31))
+    return word_ops.get((opcode, None))
+
+
+# Word'ün alanları (biçimlerdeki adlarıyla); label dallanmada mutlak hedef, atlamada komut indeksidir
+def word_fields(word, op, pc):
+    imm = ((word & 0xFFFF) ^ 0x8000) - 0x8000
+    return {
+        "rs": (word >> 21) & 31, "rt": (word >> 16) & 31, "rd": (word >> 11) & 31, "sa": (word >> 6) & 31,
+        "imm": imm, "offset": imm, "uimm": word & 0xFFFF,
+        "label": word & 0x3FFFFFF if op_formats[op] == JUMP_FORMAT else pc + 1 + imm,
+    }
+
+
+# encode'un tersi: pc satırındaki 32 bitlik word'ü Machine'in çalıştırdığı (op, a, b, c) biçimine çevirir
+def decode_word(word, pc=0):
+    op = word_op(word)
+    if op is None:
+        return (OP_INVALID, "Geçersiz komut kodu", 0, 0)
+    form = op_formats[op]
+    values = word_fields(word, op, pc)
+    fields = FIELDS[form]
+    inst = (op,) + tuple(values[field] if field else 0 for field in fields) + (0,) * (3 - len(fields))
+    return NOP_INSTRUCTION if form in PURE_WRITE_FORMATS and inst[1] == 0 else inst  # $zero'ya yazanlar etkisiz
+
+
+# Word'ü okunabilir komut metnine çevirir; targets verilirse (satır -> etiket) hedefler etiket adıyla yazılır
+def disassemble(word, targets=None, pc=0):
+    op = word_op(word)
+    if op is None:
+        return f".word 0x{word:08x}"
+    if word == NOP_WORD:
+        return "nop"
+    values = word_fields(word, op, pc)
+    targets = targets or {}
+    operands = []
+    for kind in op_formats[op].split(", "):
+        if kind in ("rd", "rs", "rt"):
+            operands.append(register_names[values[kind]])
+        elif kind == "offset(rs)":
+            operands.append(f"{values['offset']}({register_names[values['rs']]})")
+        elif kind == "label":
+            operands.append(str(targets.get(values[kind], values[kind])))
+        elif kind:
+            operands.append(str(values[kind]))
+    return f"{op_names[op]} {', '.join(operands)}".strip()
+
+
+_cache = OrderedDict()  # kaynak özeti -> AssembledProgram
+
+
+def _remember(program):
+    _cache[program.digest] = program
+    if len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+    return program
+
+
+# Kaynağı assemble eder; aynı kaynak daha önce assemble edildiyse önbellekteki sonucu döndürür
+def assemble(source, capacity=512):
+    digest = hashlib.sha1(source.encode("utf-8")).hexdigest()
+    program = _cache.get(digest)
+    if program is not None:
+        _cache.move_to_end(digest)
+        return program
+
+    source_lines = split_source(source, capacity)  # 1. geçiş
+    line_labels, lines = [], []
+    for line in source_lines:
+        label, text = parse_line(line)
+        line_labels.append(label)
+        lines.append(text)
+    labels = {label: i for i, label in enumerate(line_labels) if label is not None}
+    decoded = [decode_instruction(line, labels) for line in lines]  # 2. geçiş
+    words = array("I", bytes(4 * len(lines)))
+    errors = {}
+    for i, inst in enumerate(decoded):
+        try:
+            words[i] = encode(inst, i)
+        except AssemblyError as e:
+            errors[i] = str(e)
+    references = [label_reference(line) for line in lines]
+    return _remember(AssembledProgram(lines, labels, decoded, words, errors, digest, source_lines, line_labels,
+                                      references))
+
+
+# Kaynağı bir önceki programa göre artımlı assemble eder. Baştaki ve sondaki değişmemiş satırlar olduğu gibi
+# alınır; yalnızca aradaki düzenlenmiş satırlar ile yeri değişen (ya da eklenen/silinen) bir etikete başvuran
+# satırlar yeniden çözülüp kodlanır. (program, changed) döndürür: changed yeniden çözülen satırların yeni
+# indeksleridir; önceki program yoksa (ya da imajdan yüklendiyse) tam assemble yapılır ve changed None olur.
+def reassemble(previous, source, capacity=512):
+    if previous is None or previous.source_lines is None:
+        return assemble(source, capacity), None
+    digest = hashlib.sha1(source.encode("utf-8")).hexdigest()
+    if digest == previous.digest:
+        return previous, []
+    source_lines = split_source(source, capacity)
+    old_lines = previous.source_lines
+    common = min(len(source_lines), len(old_lines))
+    prefix = 0
+    while prefix < common and source_lines[prefix] == old_lines[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < common - prefix and source_lines[-1 - suffix] == old_lines[-1 - suffix]:
+        suffix += 1
+    end = len(source_lines) - suffix  # Yeni programda düzenlenmiş aralık: [prefix, end)
+    old_end = len(old_lines) - suffix
+    shift = end - old_end  # Sondaki satırların indeks kayması
+
+    middle = [parse_line(line) for line in source_lines[prefix:end]]
+    line_labels = previous.line_labels[:prefix] + [label for label, _ in middle] + previous.line_labels[old_end:]
+    lines = previous.lines[:prefix] + [text for _, text in middle] + previous.lines[old_end:]
+    labels = {label: i for i, label in enumerate(line_labels) if label is not None}
+    references = (previous.references[:prefix] + [label_reference(text) for _, text in middle] +
+                  previous.references[old_end:])
+    decoded = previous.decoded[:prefix] + [None] * (end - prefix) + previous.decoded[old_end:]
+    words = previous.words[:prefix] + array("I", bytes(4 * (end - prefix))) + previous.words[old_end:]
+    errors = {}
+    for i, message in previous.errors.items():
+        if i < prefix:
+            errors[i] = message
+        elif i >= old_end:
+            errors[i + shift] = message
+
+    # Hedefi değişen dallanma/atlama komutları da yeniden çözülür
+    moved = {name for name in labels.keys() | previous.labels.keys() if labels.get(name) != previous.labels.get(name)}
+    changed = list(range(prefix, end))
+    if moved or shift:
+        # Dallanmalar pc'ye göre kodlandığından kayan sondaki satırlar hedefleri aynı kalsa da yeniden kodlanır
+        changed += [i for i, name in enumerate(references) if name is not None and not prefix <= i < end and
+                    (name in moved or shift and i >= end)]
+    for i in changed:
+        inst = decoded[i] = decode_instruction(lines[i], labels)
+        errors.pop(i, None)
+        try:
+            words[i] = encode(inst, i)
+        except AssemblyError as e:
+            words[i] = 0
+            errors[i] = str(e)
+    program = AssembledProgram(lines, labels, decoded, words, errors, digest, source_lines, line_labels, references)
+    return _remember(program), sorted(changed)
+
+
+# Machine Code ekranı için bir satırın ikili gösterimi
+def format_machine_code(program, i):
+    if i in program.errors:
+        return f"ERROR ({program.lines[i]}): {program.errors[i]}"
+    return f"{program.words[i]:032b}"
+
+
+# İmaj: başlık + little-endian word'ler + JSON metadata (etiketler ve kaynak satırları).
+# Metadata isteğe bağlıdır; başka araçların ürettiği, sadece word içeren imajlar da yüklenebilir.
+def save_image(program, path):
+    words = array("I", program.words)
+    if sys.byteorder == "big":
+        words.byteswap()
+    metadata = json.dumps({"labels": program.labels, "lines": program.lines}, ensure_ascii=False).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(IMAGE_HEADER.pack(IMAGE_MAGIC, len(words), len(metadata)))
+        f.write(words.tobytes())
+        f.write(metadata)
+
+
+def load_image(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < IMAGE_HEADER.size:
+        raise ExecutionError(f"Geçersiz imaj dosyası: {path}")
+    magic, count, metadata_length = IMAGE_HEADER.unpack_from(data)
+    if magic != IMAGE_MAGIC or len(data) != IMAGE_HEADER.size + 4 * count + metadata_length:
+        raise ExecutionError(f"Geçersiz imaj dosyası: {path}")
+    words = array("I")
+    words.frombytes(data[IMAGE_HEADER.size:IMAGE_HEADER.size + 4 * count])
+    if sys.byteorder == "big":
+        words.byteswap()
+    metadata = json.loads(data[IMAGE_HEADER.size + 4 * count:].decode("utf-8")) if metadata_length else {}
+    labels = metadata.get("labels", {})
+    # Komutlar kaynak metinden değil doğrudan word'lerden çözülür; kaynak yoksa ekran için disassemble edilir
+    decoded = [decode_word(word, i) for i, word in enumerate(words)]
+    lines = metadata.get("lines")
+    if lines is None:
+        targets = {index: label for label, index in labels.items()}
+        lines = [disassemble(word, targets, i) for i, word in enumerate(words)]
+    return AssembledProgram(lines, labels, decoded, words, {})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="MIPS kaynağını makine koduna çevirir.")
+    parser.add_argument("source", help="Assemble edilecek .asm dosyası")
+    parser.add_argument("-o", "--output", help="İkili imajın yazılacağı .bin dosyası")
+    args = parser.parse_args(argv)
+
+    with open(args.source, encoding="utf-8") as f:
+        program = assemble(f.read())
+    for i, line in enumerate(program.lines):
+        if line:
+            print(f"{i:03}: {format_machine_code(program, i)}  {line}")
+    if args.output:
+        save_image(program, args.output)
+    return 1 if program.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
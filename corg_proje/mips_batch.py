@@ -0,0 +1,160 @@
+# Çok sayıda programı (öğrenci ödevleri, regresyon testleri) bir süreç havuzunda paralel çalıştırıp
+# beklenen son register/bellek değerleriyle karşılaştırır ve özet rapor yazar.
+# Girdi bir klasör (içindeki tüm .asm/.bin dosyaları, beklenen değer olmadan) ya da bir manifest olabilir.
+# Manifest örneği (dosya yolları manifestin bulunduğu klasöre göredir):
+#   {"defaults": {"max_steps": 1000000, "timeout": 5},
+#    "programs": [{"file": "odev1.asm",
+#                  "inputs": {"registers": {"$a0": 10}, "memory": {"0": 7}, "stdin": "3 4"},
+#                  "expected": {"registers": {"$v0": 55}, "memory": {"0x10": 3}, "output": "7"}}]}
+# stdin read int syscall'larının okuyacağı sayılar, output programın syscall'larla yazdığı metindir.
+# Kullanım: python mips_batch.py programlar/ [--jobs 8] [-o rapor.json]
+#           python mips_batch.py manifest.json --max-steps 100000 --timeout 2
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from mips_cli import ENGINES, load_file
+from mips_core import ExecutionError, Machine, Memory, register_index, to_signed
+from mips_memory import PagedMemory
+from mips_watchdog import Watchdog, run_guarded
+
+CHUNK = 20000  # Süre sınırı kontrolleri arasında çalıştırılan komut sayısı
+DEFAULTS = {"max_steps": 1000000, "timeout": 10.0, "engine": "interp", "memory_size": 512, "paged": False,
+            "detect_loops": True}
+
+
+def address_of(key):
+    return int(key, 0) if isinstance(key, str) else key
+
+
+# Manifest ya da klasörü, her biri tek bir programı tanımlayan sözlüklere çevirir
+def load_cases(path, overrides):
+    if os.path.isdir(path):
+        defaults = {}
+        programs = [{"file": os.path.join(path, name)} for name in sorted(os.listdir(path))
+                    if name.endswith((".asm", ".bin"))]
+    else:
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+        if isinstance(manifest, list):
+            manifest = {"programs": manifest}
+        defaults = manifest.get("defaults", {})
+        base = os.path.dirname(os.path.abspath(path))
+        programs = [dict(entry, file=os.path.join(base, entry["file"])) for entry in manifest["programs"]]
+    cases = []
+    for entry in programs:
+        case = dict(DEFAULTS)
+        case.update(defaults)
+        case.update(entry)
+        case.update(overrides)  # Komut satırı seçenekleri manifesti ezer
+        cases.append(case)
+    return cases
+
+
+# Beklenen değerlerle son durumu karşılaştırır; farkları liste olarak döndürür
+def compare(machine, expected):
+    mismatches = []
+    for name, value in expected.get("registers", {}).items():
+        actual = to_signed(machine.registers[register_index[name]])
+        if actual != value:
+            mismatches.append({"register": name, "expected": value, "actual": actual})
+    for key, value in expected.get("memory", {}).items():
+        actual = to_signed(machine.memory.load_word(address_of(key)))
+        if actual != value:
+            mismatches.append({"address": address_of(key), "expected": value, "actual": actual})
+    if "output" in expected and machine.console.text() != expected["output"]:
+        mismatches.append({"output": True, "expected": expected["output"], "actual": machine.console.text()})
+    return mismatches
+
+
+# Süreç havuzunda çalışan iş: tek bir programı bütçeleri içinde çalıştırır
+def run_case(case):
+    memory = PagedMemory() if case["paged"] else Memory(case["memory_size"])
+    machine = Machine(memory=memory)
+    result = {"file": case["file"], "status": "pass", "error": None, "steps": 0, "wall_time": 0.0,
+              "mismatches": []}
+    engine = ENGINES[case["engine"]]
+    watchdog = None
+    start = time.perf_counter()
+    try:
+        load_file(machine, case["file"], case["engine"])
+        inputs = case.get("inputs", {})
+        for name, value in inputs.get("registers", {}).items():
+            machine.registers[register_index[name]] = value & 0xFFFFFFFF
+        for key, value in inputs.get("memory", {}).items():
+            machine.memory.store_word(address_of(key), value & 0xFFFFFFFF)
+        machine.console.set_input(inputs.get("stdin", ""))
+        watchdog = Watchdog(machine, case["max_steps"], case["timeout"], case["detect_loops"])
+        run_guarded(machine, engine, watchdog, CHUNK)
+        result["mismatches"] = compare(machine, case.get("expected", {}))
+        if result["mismatches"]:
+            result["status"] = "fail"
+    except (ExecutionError, OSError, KeyError, ValueError) as e:
+        result["status"] = watchdog.reason if watchdog is not None and watchdog.reason else "error"
+        result["error"] = str(e) if not isinstance(e, KeyError) else f"Bilinmeyen register: {e.args[0]}"
+    result["steps"] = machine.steps
+    result["wall_time"] = time.perf_counter() - start
+    return result
+
+
+def run_batch(cases, jobs=None):
+    start = time.perf_counter()
+    if jobs == 1:
+        results = [run_case(case) for case in cases]
+    else:
+        workers = jobs or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Küçük programlarda süreçler arası iletişimi azaltmak için işler gruplar halinde gönderilir
+            results = list(executor.map(run_case, cases, chunksize=max(1, len(cases) // (8 * workers))))
+    summary = {status: 0 for status in ("pass", "fail", "error", "timeout", "budget", "loop")}
+    for result in results:
+        summary[result["status"]] += 1
+    return {
+        "total": len(results),
+        "summary": summary,
+        "wall_time": time.perf_counter() - start,
+        "instructions": sum(result["steps"] for result in results),
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Programları paralel çalıştırıp beklenen değerlerle karşılaştırır.")
+    parser.add_argument("source", help="Programların bulunduğu klasör ya da JSON manifest")
+    parser.add_argument("--jobs", type=int, default=None, help="Süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument("--max-steps", type=int, help="Program başına komut bütçesi")
+    parser.add_argument("--timeout", type=float, help="Program başına süre bütçesi (saniye)")
+    parser.add_argument("--engine", choices=sorted(ENGINES), help="Çalıştırma motoru")
+    parser.add_argument("--memory-size", type=int, help="Veri belleği boyutu (byte)")
+    parser.add_argument("--paged", action="store_true", default=None, help="Sayfalı 32 bit bellek kullan")
+    parser.add_argument("--no-loop-detection", dest="detect_loops", action="store_false", default=None,
+                        help="Sonsuz döngü tespitini kapat")
+    parser.add_argument("-o", "--output", help="Raporun yazılacağı JSON dosyası (varsayılan: standart çıktı)")
+    args = parser.parse_args(argv)
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs en az 1 olmalı")
+
+    names = ("max_steps", "timeout", "engine", "memory_size", "paged", "detect_loops")
+    overrides = {name: getattr(args, name) for name in names if getattr(args, name) is not None}
+    try:
+        cases = load_cases(args.source, overrides)
+    except (OSError, ValueError, KeyError) as e:
+        parser.error(f"Manifest okunamadı: {e}")
+    report = run_batch(cases, args.jobs)
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        summary = ", ".join(f"{status}: {count}" for status, count in report["summary"].items())
+        print(f"{report['total']} program, {report['wall_time']:.2f} s ({summary})")
+    else:
+        print(text)
+    return 0 if report["summary"]["pass"] == report["total"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
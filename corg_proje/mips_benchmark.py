@@ -0,0 +1,127 @@
+# benchmarks/ klasöründeki hazır iş yüklerini GUI açmadan her motorla çalıştırıp ölçer.
+# Her (iş yükü, motor) çifti için çalışan komut sayısı, en iyi duvar saati süresi, saniyedeki komut sayısı
+# ve tracemalloc ile ölçülen en yüksek Python bellek kullanımı JSON olarak yazdırılır. Son durumun özeti
+# (state_digest) motorlar arasında karşılaştırılır; farklı sonuç veren motor "consistent": false olarak görünür.
+# Kullanım: python mips_benchmark.py [--workload fib ...] [--engine block ...] [--repeat 3] [-o sonuc.json]
+import argparse
+import hashlib
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+from mips_assembler import assemble
+from mips_cli import ENGINES
+from mips_core import ExecutionError, Machine, Memory
+
+BENCHMARK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks")
+MEMORY_SIZE = 64 * 1024  # İş yükleri en fazla 32 KiB yığın + 8 KiB veri kullanır
+
+
+def workload_names():
+    return sorted(name[:-4] for name in os.listdir(BENCHMARK_DIR) if name.endswith(".asm"))
+
+
+def read_workload(name):
+    with open(os.path.join(BENCHMARK_DIR, name + ".asm"), encoding="utf-8") as f:
+        return f.read()
+
+
+def state_digest(machine):
+    return hashlib.sha1(json.dumps(machine.state(), sort_keys=True).encode("utf-8")).hexdigest()
+
+
+# İş yükünü taze bir makinede bir kez çalıştırır; (makine, süre) döndürür.
+# Assemble ve yükleme süreye dahil değildir, blok motorunun çeviri süresi dahildir.
+def run_once(program, engine):
+    machine = Machine(memory=Memory(MEMORY_SIZE))
+    machine.load_program(program.lines, program.labels, program.decoded, program.words)
+    start = time.perf_counter()
+    ENGINES[engine](machine)
+    elapsed = time.perf_counter() - start
+    if not machine.finished:
+        raise ExecutionError("Program bitmedi")
+    return machine, elapsed
+
+
+def measure(name, engine, repeat=3, memory=True):
+    source = read_workload(name)
+    program = assemble(source, max(512, len(source.split("\n"))))
+    if program.errors:
+        line, message = min(program.errors.items())
+        raise ExecutionError(f"{name}: Assemble hatası (satır {line}): {message}")
+    times = []
+    for _ in range(repeat):
+        machine, elapsed = run_once(program, engine)
+        times.append(elapsed)
+    best = min(times)
+    result = {
+        "workload": name,
+        "engine": engine,
+        "instructions": machine.steps,
+        "wall_time": best,
+        "mean_wall_time": sum(times) / len(times),
+        "ips": machine.steps / best if best else 0.0,
+        "state_digest": state_digest(machine),
+    }
+    if memory:
+        # tracemalloc çalışmayı yavaşlattığından bellek ayrı bir çalıştırmada ölçülür
+        tracemalloc.start()
+        try:
+            run_once(program, engine)
+            result["peak_memory"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def run_suite(workloads, engines, repeat=3, memory=True):
+    results = []
+    for name in workloads:
+        rows = [measure(name, engine, repeat, memory) for engine in engines]
+        reference = rows[0]["state_digest"]
+        for row in rows:
+            row["consistent"] = row["state_digest"] == reference
+            row["speedup"] = row["ips"] / rows[0]["ips"] if rows[0]["ips"] else 0.0  # İlk motora göre
+        results.extend(rows)
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def main(argv=None):
+    names = workload_names()
+    parser = argparse.ArgumentParser(description="Hazır MIPS iş yükleriyle motorların hızını ölçer.")
+    parser.add_argument("--workload", action="append", choices=names, help="Sadece bu iş yükü (tekrarlanabilir)")
+    parser.add_argument("--engine", action="append", choices=sorted(ENGINES),
+                        help="Sadece bu motor (tekrarlanabilir); ilk motor hızlanma için referanstır")
+    parser.add_argument("--repeat", type=int, default=3, help="Her ölçümün tekrar sayısı (en iyisi raporlanır)")
+    parser.add_argument("--no-memory", action="store_true", help="Bellek kullanımını ölçme")
+    parser.add_argument("-o", "--output", help="JSON sonucun yazılacağı dosya (varsayılan: standart çıktı)")
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat en az 1 olmalı")
+
+    engines = args.engine or ["interp", "block", "words"]
+    try:
+        report = run_suite(args.workload or names, engines, args.repeat, not args.no_memory)
+    except ExecutionError as e:
+        print(e, file=sys.stderr)
+        return 1
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0 if all(row["consistent"] for row in report["results"]) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
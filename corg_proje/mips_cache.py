@@ -0,0 +1,191 @@
+# Veri belleğinin önüne takılan yapılandırılabilir önbellek modeli.
+# Cache, Memory arayüzünü uygular: veriler her zaman arkadaki bellekte tutulur, önbellek yalnızca
+# etiketleri (tag) ve dirty bitlerini izleyerek isabet/ıska istatistiklerini hesaplar.
+# Doğrudan eşlemeli (ways=1), N yollu ve tam ilişkili (ways=satır sayısı) yapılar; LRU, FIFO ve
+# rastgele değiştirme; write-back ve write-through yazma politikaları desteklenir. next_level ile
+# ikinci bir önbellek seviyesi bağlanabilir: L1'in ıskaları ve geri yazmaları L2'ye erişim olarak sayılır.
+import random
+
+REPLACEMENT_POLICIES = ("lru", "fifo", "random")
+WRITE_POLICIES = ("write-back", "write-through")
+
+
+class Cache:
+    def __init__(self, memory, size=1024, block_size=16, ways=1, replacement="lru", write_policy="write-back",
+                 write_allocate=None, next_level=None, name="L1", seed=0):
+        if replacement not in REPLACEMENT_POLICIES:
+            raise ValueError(f"Geçersiz değiştirme politikası: {replacement}")
+        if write_policy not in WRITE_POLICIES:
+            raise ValueError(f"Geçersiz yazma politikası: {write_policy}")
+        # Bölmelerden önce denetlenir: sıfır blok ya da yol sayısı ZeroDivisionError vermemeli
+        if block_size < 4 or block_size & (block_size - 1):
+            raise ValueError(f"Blok boyutu 2'nin kuvveti ve en az 4 olmalı: {block_size}")
+        if ways < 1:
+            raise ValueError(f"Yol sayısı en az 1 olmalı: {ways}")
+        if size < block_size:
+            raise ValueError(f"Önbellek boyutu blok boyutundan küçük olamaz: {size}")
+        lines = size // block_size
+        if lines % ways:
+            raise ValueError(f"Satır sayısı ({lines}) yol sayısına ({ways}) bölünmeli")
+        self.memory = memory
+        self.size = size
+        self.block_size = block_size
+        self.ways = ways
+        self.set_count = lines // ways
+        self.replacement = replacement
+        self.write_back = write_policy == "write-back"
+        # Varsayılan: write-back ile write-allocate, write-through ile no-write-allocate
+        self.write_allocate = self.write_back if write_allocate is None else write_allocate
+        self.next_level = next_level
+        self.name = name
+        self.offset_bits = block_size.bit_length() - 1
+        self.random = random.Random(seed)
+        self.invalidate()
+        self.reset_stats()
+
+    # Veri ve register başlangıç değerleri gibi diğer her şey arkadaki bellekten gelir
+    def __getattr__(self, name):
+        if name == "memory":  # Kurulum bitmeden yapılan erişimlerde sonsuz özyinelemeyi önler
+            raise AttributeError(name)
+        return getattr(self.memory, name)
+
+    def __len__(self):
+        return len(self.memory)
+
+    def invalidate(self):
+        self.sets = [{} for _ in range(self.set_count)]  # Her küme: tag -> dirty (ekleme sırası = yaş)
+
+    def reset_stats(self):
+        self.reads = 0
+        self.writes = 0
+        self.read_misses = 0
+        self.write_misses = 0
+        self.writebacks = 0
+        self.evictions = 0
+
+    # Bir adrese erişimi önbellekte işler ve istatistikleri günceller
+    def access(self, address, is_write):
+        block = address >> self.offset_bits
+        lines = self.sets[block % self.set_count]
+        tag = block // self.set_count
+        if is_write:
+            self.writes += 1
+        else:
+            self.reads += 1
+
+        if tag in lines:  # İsabet
+            if self.replacement == "lru":
+                lines[tag] = lines.pop(tag)  # En yeni kullanılan sona taşınır
+            if is_write:
+                if self.write_back:
+                    lines[tag] = True
+                elif self.next_level is not None:
+                    self.next_level.access(address, True)
+            return True
+
+        # Iska
+        if is_write:
+            self.write_misses += 1
+        else:
+            self.read_misses += 1
+        if is_write and not self.write_allocate:
+            if self.next_level is not None:
+                self.next_level.access(address, True)
+            return False
+
+        if len(lines) >= self.ways:
+            if self.replacement == "random":
+                victim = self.random.choice(list(lines))
+            else:
+                victim = next(iter(lines))  # LRU ve FIFO için en eski satır
+            self.evictions += 1
+            if lines.pop(victim):
+                self.writebacks += 1
+                if self.next_level is not None:
+                    victim_block = victim * self.set_count + block % self.set_count
+                    self.next_level.access(victim_block << self.offset_bits, True)
+        if self.next_level is not None:
+            self.next_level.access(block << self.offset_bits, False)  # Bloğu alt seviyeden getir
+        lines[tag] = is_write and self.write_back
+        if is_write and not self.write_back and self.next_level is not None:
+            self.next_level.access(address, True)
+        return False
+
+    def load_word(self, address):
+        value = self.memory.load_word(address)  # Geçersiz adresler istatistiğe girmeden hata verir
+        self.access(address, False)
+        return value
+
+    def store_word(self, address, value):
+        self.memory.store_word(address, value)
+        self.access(address, True)
+
+    def load_byte(self, address):
+        value = self.memory.load_byte(address)
+        self.access(address, False)
+        return value
+
+    def store_byte(self, address, value):
+        self.memory.store_byte(address, value)
+        self.access(address, True)
+
+    def clear(self):
+        self.memory.clear()
+        self.invalidate()
+        if self.next_level is not None:
+            self.next_level.invalidate()
+
+    def stats(self):
+        accesses = self.reads + self.writes
+        misses = self.read_misses + self.write_misses
+        return {
+            "name": self.name,
+            "config": {
+                "size": self.size, "block_size": self.block_size, "ways": self.ways,
+                "replacement": self.replacement,
+                "write_policy": "write-back" if self.write_back else "write-through",
+                "write_allocate": self.write_allocate,
+            },
+            "accesses": accesses,
+            "hits": accesses - misses,
+            "misses": misses,
+            "miss_rate": misses / accesses if accesses else 0.0,
+            "reads": self.reads,
+            "read_misses": self.read_misses,
+            "writes": self.writes,
+            "write_misses": self.write_misses,
+            "writebacks": self.writebacks,
+            "evictions": self.evictions,
+        }
+
+
+# Tüm seviyelerin istatistiklerini L1'den başlayarak liste halinde döndürür
+def cache_report(cache):
+    report = []
+    while cache is not None:
+        report.append(cache.stats())
+        cache = cache.next_level
+    return report
+
+
+# "size=1024,block=16,ways=2,replacement=lru,write=write-back" biçimindeki tanımı Cache argümanlarına çevirir
+def parse_cache_spec(spec):
+    names = {"size": "size", "block": "block_size", "ways": "ways", "replacement": "replacement",
+             "write": "write_policy", "allocate": "write_allocate"}
+    kwargs = {}
+    for item in filter(None, spec.split(",")):
+        key, _, value = item.partition("=")
+        if key not in names:
+            raise ValueError(f"Bilinmeyen önbellek seçeneği: {key}")
+        if key in ("size", "block", "ways"):
+            value = int(value)
+        elif key == "allocate":
+            value = value.lower() in ("1", "true", "yes")
+        kwargs[names[key]] = value
+    return kwargs
+
+
+# L1 (ve isteğe bağlı L2) önbelleğini belleğin önüne takar ve L1'i döndürür
+def build_hierarchy(memory, l1_spec, l2_spec=None):
+    l2 = Cache(memory, name="L2", **parse_cache_spec(l2_spec)) if l2_spec else None
+    return Cache(memory, next_level=l2, name="L1", **parse_cache_spec(l1_spec))
@@ -0,0 +1,194 @@
+# .asm dosyalarını (ya da mips_assembler ile üretilmiş .bin imajlarını) GUI açmadan çalıştırır ve son makine durumunu JSON olarak yazdırır.
+# Kullanım: python mips_cli.py program.asm [program2.asm ...] [--max-steps N] [--engine step|interp|block|words]
+import argparse
+import json
+import sys
+
+from mips_assembler import assemble, load_image
+from mips_cache import Cache, build_hierarchy, cache_report, parse_cache_spec
+from mips_core import Console, ExecutionError, Machine, Memory, run_steps
+from mips_debug import BreakpointHit, Debugger, debug_engine
+from mips_decoder import run_words
+from mips_memory import PagedMemory
+from mips_pipeline import PipelineModel, run_timed
+from mips_profile import Profiler, run_profiled
+from mips_trace import COMPRESSIONS, TraceWriter, run_traced
+from mips_translate import run_blocks
+from mips_watchdog import Watchdog, run_guarded
+
+ENGINES = {
+    "step": run_steps,  # Her komut için Machine.step (GUI'deki Step ile aynı yol)
+    "interp": Machine.run,  # Komut komut yorumlayıcı
+    "block": run_blocks,  # Temel blokları Python fonksiyonlarına çeviren motor
+    "words": run_words,  # 32 bitlik makine kodunu opcode tablosuyla çalıştıran motor
+}
+
+
+# .asm kaynağını assemble eder ya da .bin imajını okur
+def read_program(path, capacity, engine):
+    if path.endswith(".bin"):
+        return load_image(path)
+    with open(path, encoding="utf-8") as f:
+        program = assemble(f.read(), capacity)
+    if engine == "words" and program.errors:
+        line, message = min(program.errors.items())
+        raise ExecutionError(f"Assemble hatası (satır {line}): {message}")
+    return program
+
+
+def load_file(machine, path, engine):
+    program = read_program(path, len(machine.instruction_memory), engine)
+    machine.load_program(program.lines, program.labels, program.decoded, program.words)
+
+
+# timing verilirse (PipelineModel) program zamanlama modeliyle komut komut çalıştırılır ve motor yok sayılır
+# profile verilirse (Profiler) program profil katmanıyla komut komut çalıştırılır
+# trace verilirse (TraceWriter) çalışan her komut iz dosyasına yazılır
+# l1/l2 verilirse ("size=1024,block=16,ways=2" gibi) veri belleğinin önüne önbellek takılır
+# time_limit ya da detect_loops verilirse motor, mips_watchdog bekçisiyle parçalar halinde çalıştırılır
+# debugger verilirse (mips_debug) breakpoint/watchpoint'te durulur ve nedeni "break" alanına yazılır
+# input_text read int syscall'larının okuyacağı sayılardır; programın çıktısı "output" alanına yazılır
+def run_file(path, max_steps=None, engine="interp", memory_size=512, byteorder="little", paged=False,
+             timing=None, l1=None, l2=None, profile=None, trace=None, time_limit=None, detect_loops=False,
+             debugger=None, input_text=""):
+    memory = PagedMemory(byteorder) if paged else Memory(memory_size, byteorder)
+    if l1:
+        memory = build_hierarchy(memory, l1, l2)
+    machine = Machine(memory=memory, console=Console(input_text))
+    result = {"file": path, "error": None}
+    try:
+        load_file(machine, path, engine)
+        if timing is not None:
+            run_timed(machine, timing, max_steps)
+        elif profile is not None:
+            run_profiled(machine, profile, max_steps)
+        elif trace is not None:
+            run_traced(machine, trace, max_steps)
+        else:
+            if debugger:
+                debugger.resume_at = None  # Önceki dosyadaki durma noktası
+            run = debug_engine(debugger) if debugger else ENGINES[engine]
+            if time_limit is not None or detect_loops:
+                run_guarded(machine, run, Watchdog(machine, max_steps, time_limit, detect_loops))
+            else:
+                run(machine, max_steps)
+        if not machine.finished:
+            result["error"] = f"Komut sınırına ulaşıldı: {max_steps}"
+    except BreakpointHit as e:
+        result["break"] = str(e)
+    except (ExecutionError, OSError, ValueError) as e:
+        result["error"] = str(e)
+    result.update(machine.state())
+    if timing is not None:
+        result["timing"] = timing.report(machine.instruction_memory)
+    if profile is not None:
+        result["profile"] = profile.report(machine.decoded_program, machine.instruction_memory)
+    if l1:
+        result["cache"] = cache_report(memory)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="MIPS programlarını GUI olmadan çalıştırır.")
+    parser.add_argument("files", nargs="+", help="Çalıştırılacak .asm ya da .bin dosyaları")
+    parser.add_argument("--max-steps", type=int, default=None, help="Program başına en fazla komut sayısı")
+    parser.add_argument("--engine", choices=sorted(ENGINES), default="interp", help="Çalıştırma motoru")
+    parser.add_argument("--time-limit", type=float, default=None, help="Program başına süre sınırı (saniye)")
+    parser.add_argument("--detect-loops", action="store_true",
+                        help="Makine durumu tekrarlanınca (sonsuz döngü) çalışmayı durdur")
+    parser.add_argument("--input", metavar="PATH",
+                        help="read int syscall'larının okuyacağı girdi dosyası (- : standart girdi)")
+    parser.add_argument("--memory-size", type=int, default=512, help="Veri belleği boyutu (byte)")
+    parser.add_argument("--big-endian", action="store_true", help="Word'leri big-endian sırayla sakla")
+    parser.add_argument("--paged", action="store_true",
+                        help="Tüm 32 bit adres alanını kapsayan sayfalı bellek kullan ($sp = 0x7fffeffc)")
+    parser.add_argument("--timing", action="store_true",
+                        help="5 aşamalı pipeline modeliyle çevrim, CPI ve bekleme istatistiklerini raporla")
+    parser.add_argument("--no-forwarding", action="store_true", help="Zamanlama modelinde forwarding kapalı")
+    parser.add_argument("--branch-in-id", action="store_true",
+                        help="Zamanlama modelinde dallanmalar EX yerine ID aşamasında çözülür")
+    parser.add_argument("--break", dest="breakpoints", action="append", default=[], metavar="PC|LABEL",
+                        help="Bu komut çalışmadan önce dur (tekrarlanabilir)")
+    parser.add_argument("--watch", action="append", default=[], metavar="SPEC",
+                        help='Watchpoint, ör. "mem[0x10]" ya da "$t0 == 10" (tekrarlanabilir)')
+    parser.add_argument("--profile", action="store_true",
+                        help="pc/opcode sayıları, dallanmalar, bellek aralıkları ve sıcak döngüleri raporla")
+    parser.add_argument("--region-size", type=int, default=256, help="Profilde load/store aralık boyutu (byte)")
+    parser.add_argument("--folded", metavar="PATH",
+                        help="jal/jr çağrı yığınlarını flamegraph için katlanmış (folded) biçimde yaz")
+    parser.add_argument("--trace", metavar="PATH",
+                        help="Her komut için ikili iz kaydı yaz (.gz/.xz/.bz2 uzantısı sıkıştırır)")
+    parser.add_argument("--trace-compression", choices=["auto", "none"] + sorted(filter(None, COMPRESSIONS)),
+                        default="auto", help="İz dosyasının sıkıştırması (varsayılan: uzantıya göre)")
+    parser.add_argument("--l1", metavar="SPEC",
+                        help="Veri önbelleği, ör. size=1024,block=16,ways=2,replacement=lru,write=write-back")
+    parser.add_argument("--l2", metavar="SPEC", help="İkinci seviye önbellek (--l1 ile birlikte)")
+    args = parser.parse_args(argv)
+    if args.l2 and not args.l1:
+        parser.error("--l2 için --l1 de verilmeli")
+    if sum(map(bool, (args.timing, args.profile or args.folded, args.trace))) > 1:
+        parser.error("--timing, --profile/--folded ve --trace birlikte kullanılamaz")
+    if (args.folded or args.trace) and len(args.files) != 1:
+        parser.error("--folded ve --trace tek dosya ile kullanılabilir")
+    debugger = Debugger()
+    try:
+        for spec in args.breakpoints:
+            debugger.add_breakpoint(spec)
+        for spec in args.watch:
+            debugger.add_watch(spec)
+    except ValueError as e:
+        parser.error(str(e))
+    if debugger and (args.timing or args.profile or args.folded or args.trace):
+        parser.error("--break/--watch, --timing, --profile ve --trace ile birlikte kullanılamaz")
+    if args.region_size <= 0 or args.region_size & (args.region_size - 1):
+        parser.error("--region-size 2'nin kuvveti olmalı")
+    for spec in (args.l1, args.l2):
+        if spec:
+            try:
+                Cache(Memory(), **parse_cache_spec(spec))  # Hatalı tanımları çalıştırmadan önce yakala
+            except (TypeError, ValueError) as e:
+                parser.error(str(e))
+
+    input_text = ""
+    if args.input:
+        try:
+            if args.input == "-":
+                input_text = sys.stdin.read()
+            else:
+                with open(args.input, encoding="utf-8") as f:
+                    input_text = f.read()
+        except OSError as e:
+            parser.error(str(e))
+
+    failed = False
+    for path in args.files:
+        timing = None
+        if args.timing:
+            timing = PipelineModel(forwarding=not args.no_forwarding, branch_in_id=args.branch_in_id)
+        profile = Profiler(args.region_size) if args.profile or args.folded else None
+        trace = None
+        if args.trace:
+            compression = None if args.trace_compression == "none" else args.trace_compression
+            try:
+                trace = TraceWriter(args.trace, compression)
+            except OSError as e:
+                parser.error(str(e))
+        try:
+            result = run_file(path, args.max_steps, args.engine, args.memory_size,
+                              "big" if args.big_endian else "little", args.paged, timing, args.l1, args.l2, profile,
+                              trace, args.time_limit, args.detect_loops, debugger or None, input_text)
+        finally:
+            if trace is not None:
+                trace.close()
+        if args.folded:
+            with open(args.folded, "w", encoding="utf-8") as f:
+                f.write(profile.folded_stacks())
+            if not args.profile:
+                del result["profile"]
+        failed = failed or result["error"] is not None
+        print(json.dumps(result, ensure_ascii=False))  # Dosya başına bir JSON satırı
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,803 @@
+# Tkinter'dan bağımsız MIPS simülasyon çekirdeği.
+# Tüm makine durumu (register'lar, bellek, yüklü program, pc) Machine nesnesinde tutulur;
+# GUI (mips_simulator.py) ve komut satırı (mips_cli.py) bu sınıfın üzerine kuruludur.
+import hashlib
+import struct
+import sys
+from array import array
+
+from mips_isa import (A0, HI, LO, OP_ADD, OP_ADDI, OP_ADDIU, OP_ADDU, OP_AND, OP_ANDI, OP_BEQ, OP_BGEZ, OP_BGTZ,
+                      OP_BLEZ, OP_BLTZ, OP_BNE, OP_COUNT, OP_DIV, OP_DIVU, OP_HALT, OP_INVALID, OP_J, OP_JAL, OP_JALR,
+                      OP_JR, OP_LB, OP_LBU, OP_LH, OP_LHU, OP_LL, OP_LUI, OP_LW, OP_MFHI, OP_MFLO, OP_MTHI, OP_MTLO,
+                      OP_MUL, OP_MULT, OP_MULTU, OP_NOP, OP_NOR, OP_OR, OP_ORI, OP_SB, OP_SC, OP_SH, OP_SLL, OP_SLLV,
+                      OP_SLT, OP_SLTI, OP_SLTIU, OP_SLTU, OP_SRA, OP_SRAV, OP_SRL, OP_SRLV, OP_SUB, OP_SUBU, OP_SW,
+                      OP_SYSCALL, OP_XOR, OP_XORI, RA, REGISTER_COUNT, V0, decode_instruction, expand_pseudo,
+                      register_index, register_names)
+
+MASK = 0xFFFFFFFF  # Register'lar 32 bit işaretsiz olarak tutulur, sonuçlar bu maskeyle sarılır
+SIGN = 0x80000000  # (x ^ SIGN) karşılaştırması işaretsiz değerleri işaretli sıralar
+SNAPSHOT_PAGE_BITS = 12
+SNAPSHOT_PAGE_SIZE = 1 << SNAPSHOT_PAGE_BITS  # Anlık görüntülerde belleğin kopyalanıp paylaşıldığı parça boyutu
+
+
+# 32 bitlik işaretsiz değeri işaretli tamsayıya çevirir (ekran ve JSON çıktısı için)
+def to_signed(value):
+    return value - 0x100000000 if value & SIGN else value
+
+
+# SPIM uyumlu syscall servis numaraları ($v0)
+SYS_PRINT_INT, SYS_PRINT_STRING, SYS_READ_INT, SYS_SBRK, SYS_EXIT, SYS_PRINT_CHAR = 1, 4, 5, 9, 10, 11
+
+
+class ExecutionError(Exception):
+    pass
+
+
+# Kaynak metni Instruction Memory satırlarına böler. Sözde komutlar (li, move, blt, ...) burada gerçek komut
+# satırlarına açılır; birden çok komuta açılanlar (ör. 32 bitlik li) sonraki satırları kaydırır.
+def split_source(source, capacity=512):
+    lines = []
+    for line in source.strip().split("\n"):
+        label, text = parse_line(line)
+        expansion = expand_pseudo(text)
+        if expansion is None:
+            lines.append(line)
+            continue
+        if label is not None:
+            expansion[0] = f"{label}: {expansion[0]}"  # Etiket açılımın ilk komutunu gösterir
+        lines.extend(expansion)
+    if len(lines) > capacity:
+        raise ExecutionError("Instruction Memory kapasitesini aştınız!")
+    return lines
+
+
+# Tek satırdan yorumu atar ve etiketi ayırır: (etiket ya da None, komut metni)
+def parse_line(line):
+    line = line.split("#")[0].strip()  # Yorumları at
+    if ":" in line:  # Eğer bir etiket varsa
+        label, line = line.split(":", 1)
+        return label.strip(), line.strip()
+    return None, line
+
+
+# Kaynak metni satırlara ayırır (yorumlar ve etiketler atılır) ve etiketlerin satır numaralarını bulur.
+# Assembler'ın birinci geçişi de budur.
+def parse_source(source, capacity=512):
+    lines = split_source(source, capacity)
+    labels = {}
+    for i, line in enumerate(lines):
+        label, lines[i] = parse_line(line)
+        if label is not None:
+            labels[label] = i  # Etiketin bulunduğu satırı kaydet
+    return lines, labels
+
+
+# Byte adreslenebilir veri belleği. Word erişimleri 4 byte hizalı olmalıdır;
+# byteorder "little" ya da "big" olabilir.
+class Memory:
+    initial_registers = {}  # Bu bellek düzeninde Machine'in başlangıçta ayarlayacağı register'lar
+
+    # buffer verilirse (ör. multiprocessing.shared_memory) bellek onun üzerinde kurulur
+    def __init__(self, size=512, byteorder="little", buffer=None):
+        if size % 4:
+            raise ValueError("Bellek boyutu 4'ün katı olmalı")
+        self.data = buffer if buffer is not None else bytearray(size)
+        self.byteorder = byteorder
+        self.size = size
+        # sbrk ile ayrılan heap belleğin ikinci yarısından başlar (ilk yarı veriler, sonu yığın için)
+        self.heap_start = size // 2 & ~7
+        self.heap_limit = size
+        # Makinenin kendi byte sırasıyla aynıysa word'lere doğrudan memoryview üzerinden erişilir
+        self.words = memoryview(self.data).cast("I") if byteorder == sys.byteorder else None
+        self.word_struct = struct.Struct("<I" if byteorder == "little" else ">I")
+        # Son anlık görüntüden (snapshot_base) beri yazılan sayfalar; snapshot_pages yalnızca bunları kopyalar
+        self.dirty = set()
+        self.snapshot_base = None
+
+    def __len__(self):
+        return self.size
+
+    def check(self, address, width):
+        if address + width > self.size:  # Bellek sınırı kontrolü (adresler işaretsiz)
+            raise ExecutionError(f"Geçersiz bellek adresi: {address}")
+        if address % width:
+            raise ExecutionError(f"Hizalanmamış bellek adresi: {address}")
+
+    def load_word(self, address):
+        if address & 3 or address + 4 > self.size:
+            self.check(address, 4)
+        if self.words is not None:
+            return self.words[address >> 2]
+        return self.word_struct.unpack_from(self.data, address)[0]
+
+    def store_word(self, address, value):
+        if address & 3 or address + 4 > self.size:
+            self.check(address, 4)
+        self.dirty.add(address >> SNAPSHOT_PAGE_BITS)
+        if self.words is not None:
+            self.words[address >> 2] = value
+        else:
+            self.word_struct.pack_into(self.data, address, value)
+
+    def load_byte(self, address):
+        self.check(address, 1)
+        return self.data[address]
+
+    def store_byte(self, address, value):
+        self.check(address, 1)
+        self.dirty.add(address >> SNAPSHOT_PAGE_BITS)
+        self.data[address] = value & 0xFF
+
+    # Tüm sayfalar değiştiği için sonraki anlık görüntü belleğin tamamını karşılaştırır
+    def clear(self):
+        self.data[:] = bytes(self.size)
+        self.snapshot_base = None
+
+    # Sıfır olmayan word'leri (adres, değer) olarak verir
+    def nonzero_words(self):
+        for address in range(0, self.size, 4):
+            if self.data[address:address + 4] != b"\0\0\0\0":
+                yield address, self.load_word(address)
+
+    # Ekranlar için byte'ları yan etkisiz okur (önbellek istatistiklerine ve hizalama kontrolüne girmez)
+    def read(self, address, length):
+        return bytes(self.data[address:address + length])
+
+    # Bellek içeriğinin kısa özeti (aynı içerik -> aynı özet)
+    def digest(self):
+        return hashlib.blake2b(self.data, digest_size=16).digest()
+
+    # Belleği sayfa numarası -> bytes olarak kopyalar. previous (önceki anlık görüntünün sayfaları) verilirse
+    # değişmemiş sayfalar onunla paylaşılır, böylece sık alınan görüntüler sadece değişen sayfalar kadar yer tutar.
+    # previous bu belleğin son görüntüsü (ya da son geri yüklenen görüntü) ise yalnızca o zamandan beri yazılan
+    # sayfalar kopyalanır; aksi halde tüm sayfalar previous ile karşılaştırılır.
+    def snapshot_pages(self, previous=None):
+        view = memoryview(self.data)
+        if previous is not None and previous is self.snapshot_base:
+            pages = dict(previous)
+            numbers = self.dirty
+        else:
+            pages = {}
+            numbers = range((self.size + SNAPSHOT_PAGE_SIZE - 1) // SNAPSHOT_PAGE_SIZE)
+        for number in numbers:
+            start = number * SNAPSHOT_PAGE_SIZE
+            page = bytes(view[start:start + SNAPSHOT_PAGE_SIZE])
+            old = previous.get(number) if previous else None
+            pages[number] = old if old == page else page
+        self.dirty = set()
+        self.snapshot_base = pages
+        return pages
+
+    def restore_pages(self, pages):
+        for number, page in pages.items():
+            start = number * SNAPSHOT_PAGE_SIZE
+            self.data[start:start + len(page)] = page
+        self.dirty = set()
+        self.snapshot_base = pages
+
+
+# syscall'ların konsolu. Yazılan metin parça parça listede biriktirilir; GUI ve komut satırı onu toplu
+# olarak okur, böylece çok yazdıran programlar her karakterde ekranı güncellemez. Run bir işçi iş
+# parçacığındayken GUI yalnızca listeye eklenenleri okur. read int girdisi önceden verilen metnin
+# boşlukla ayrılmış sözcüklerinden sırayla alınır; bu sayede çalıştırma tekrarlanabilir kalır.
+class Console:
+    def __init__(self, input_text=""):
+        self.chunks = []  # Yazılan metin parçaları
+        self.length = 0  # Yazılan toplam karakter
+        self.set_input(input_text)
+
+    def set_input(self, text):
+        self.tokens = text.split()
+        self.position = 0  # Sıradaki okunacak sözcük
+
+    # Çıktıyı siler ve girdiyi başa sarar (girdi metni korunur)
+    def clear(self):
+        self.chunks = []
+        self.length = 0
+        self.position = 0
+
+    def write(self, text):
+        self.chunks.append(text)
+        self.length += len(text)
+
+    def read_int(self):
+        if self.position >= len(self.tokens):
+            raise ExecutionError("Okunacak girdi kalmadı")
+        token = self.tokens[self.position]
+        try:
+            value = int(token)
+        except ValueError:
+            raise ExecutionError(f"Geçersiz tamsayı girdisi: {token}") from None
+        self.position += 1
+        return value
+
+    def text(self):
+        return "".join(self.chunks)
+
+    # Anlık görüntüler için (çıktı uzunluğu, girdi konumu)
+    def state(self):
+        return self.length, self.position
+
+    # Konsolu bir anlık görüntüdeki durumuna döndürür; sonradan yazılan çıktı kesilir
+    def restore(self, state):
+        length, self.position = state
+        if length < self.length:
+            text = self.text()[:length]
+            self.chunks = [text] if text else []
+            self.length = length
+
+
+# Makinenin bir andaki tam durumu. Program listeleri yüklemede yeniden oluşturulduğundan kopyalanmadan
+# paylaşılır; bellek sayfaları Memory.snapshot_pages ile önceki görüntüyle paylaşılarak saklanır.
+class Snapshot:
+    def __init__(self, machine, previous=None):
+        self.registers = array("I", machine.registers)
+        self.pages = machine.memory.snapshot_pages(previous.pages if previous is not None else None)
+        self.pc = machine.pc
+        self.realistic_pc = machine.realistic_pc
+        self.steps = machine.steps
+        self.heap = machine.heap
+        self.console = machine.console.state()
+        self.instruction_memory = machine.instruction_memory
+        self.decoded_program = machine.decoded_program
+        self.text_words = machine.text_words
+        self.program_length = machine.program_length
+        self.labels = machine.labels
+
+
+# Yarım word erişimleri iki byte erişimiyle yapılır (bellek sınıflarının hepsi load_byte/store_byte sunar)
+def load_half(memory, address):
+    if address & 1:
+        raise ExecutionError(f"Hizalanmamış bellek adresi: {address}")
+    first, second = memory.load_byte(address), memory.load_byte(address + 1)
+    return first | second << 8 if memory.byteorder == "little" else first << 8 | second
+
+
+def store_half(memory, address, value):
+    if address & 1:
+        raise ExecutionError(f"Hizalanmamış bellek adresi: {address}")
+    low, high = value & 0xFF, (value >> 8) & 0xFF
+    if memory.byteorder == "little":
+        memory.store_byte(address, low)
+        memory.store_byte(address + 1, high)
+    else:
+        memory.store_byte(address, high)
+        memory.store_byte(address + 1, low)
+
+
+# İşaretli bölme: bölüm sıfıra doğru yuvarlanır, kalan bölünenin işaretini alır (MIPS div gibi)
+def divide(dividend, divisor):
+    if divisor == 0:
+        raise ExecutionError("Sıfıra bölme")
+    quotient = abs(dividend) // abs(divisor)
+    if (dividend < 0) != (divisor < 0):
+        quotient = -quotient
+    return quotient, dividend - quotient * divisor
+
+
+# Komut işleyicileri: (makine, register'lar, pc, a, b, c) alır ve bir sonraki pc'yi döndürür.
+# a, b, c alanlarının anlamı komutun biçimine göredir (mips_isa.FIELDS). Machine.execute ve Machine.run
+# bunları op kimliğiyle indekslenen EXECUTE tablosundan çağırır.
+def _nop(m, r, pc, a, b, c):
+    return pc + 1
+
+
+def _add(m, r, pc, a, b, c):
+    r[a] = (r[b] + r[c]) & MASK
+    return pc + 1
+
+
+def _sub(m, r, pc, a, b, c):
+    r[a] = (r[b] - r[c]) & MASK
+    return pc + 1
+
+
+def _and(m, r, pc, a, b, c):
+    r[a] = r[b] & r[c]
+    return pc + 1
+
+
+def _or(m, r, pc, a, b, c):
+    r[a] = r[b] | r[c]
+    return pc + 1
+
+
+def _xor(m, r, pc, a, b, c):
+    r[a] = r[b] ^ r[c]
+    return pc + 1
+
+
+def _nor(m, r, pc, a, b, c):
+    r[a] = ~(r[b] | r[c]) & MASK
+    return pc + 1
+
+
+def _slt(m, r, pc, a, b, c):
+    r[a] = 1 if r[b] ^ SIGN < r[c] ^ SIGN else 0
+    return pc + 1
+
+
+def _sltu(m, r, pc, a, b, c):
+    r[a] = 1 if r[b] < r[c] else 0
+    return pc + 1
+
+
+def _mul(m, r, pc, a, b, c):
+    r[a] = (to_signed(r[b]) * to_signed(r[c])) & MASK
+    return pc + 1
+
+
+def _sll(m, r, pc, a, b, c):
+    r[a] = (r[b] << c) & MASK
+    return pc + 1
+
+
+def _srl(m, r, pc, a, b, c):
+    r[a] = r[b] >> c
+    return pc + 1
+
+
+def _sra(m, r, pc, a, b, c):
+    r[a] = (to_signed(r[b]) >> c) & MASK
+    return pc + 1
+
+
+def _sllv(m, r, pc, a, b, c):
+    r[a] = (r[b] << (r[c] & 31)) & MASK
+    return pc + 1
+
+
+def _srlv(m, r, pc, a, b, c):
+    r[a] = r[b] >> (r[c] & 31)
+    return pc + 1
+
+
+def _srav(m, r, pc, a, b, c):
+    r[a] = (to_signed(r[b]) >> (r[c] & 31)) & MASK
+    return pc + 1
+
+
+def _mult(m, r, pc, a, b, c):
+    product = to_signed(r[a]) * to_signed(r[b])
+    r[HI], r[LO] = (product >> 32) & MASK, product & MASK
+    return pc + 1
+
+
+def _multu(m, r, pc, a, b, c):
+    product = r[a] * r[b]
+    r[HI], r[LO] = product >> 32, product & MASK
+    return pc + 1
+
+
+def _div(m, r, pc, a, b, c):
+    quotient, remainder = divide(to_signed(r[a]), to_signed(r[b]))
+    r[HI], r[LO] = remainder & MASK, quotient & MASK
+    return pc + 1
+
+
+def _divu(m, r, pc, a, b, c):
+    quotient, remainder = divide(r[a], r[b])
+    r[HI], r[LO] = remainder, quotient
+    return pc + 1
+
+
+def _mfhi(m, r, pc, a, b, c):
+    r[a] = r[HI]
+    return pc + 1
+
+
+def _mflo(m, r, pc, a, b, c):
+    r[a] = r[LO]
+    return pc + 1
+
+
+def _mthi(m, r, pc, a, b, c):
+    r[HI] = r[a]
+    return pc + 1
+
+
+def _mtlo(m, r, pc, a, b, c):
+    r[LO] = r[a]
+    return pc + 1
+
+
+def _addi(m, r, pc, a, b, c):
+    r[a] = (r[b] + c) & MASK
+    return pc + 1
+
+
+def _slti(m, r, pc, a, b, c):
+    r[a] = 1 if r[b] ^ SIGN < (c & MASK) ^ SIGN else 0
+    return pc + 1
+
+
+def _sltiu(m, r, pc, a, b, c):
+    r[a] = 1 if r[b] < c & MASK else 0
+    return pc + 1
+
+
+def _andi(m, r, pc, a, b, c):
+    r[a] = r[b] & c
+    return pc + 1
+
+
+def _ori(m, r, pc, a, b, c):
+    r[a] = r[b] | c
+    return pc + 1
+
+
+def _xori(m, r, pc, a, b, c):
+    r[a] = r[b] ^ c
+    return pc + 1
+
+
+def _lui(m, r, pc, a, b, c):
+    r[a] = c << 16
+    return pc + 1
+
+
+def _lw(m, r, pc, a, b, c):
+    value = m.memory.load_word((r[b] + c) & MASK)
+    if a:
+        r[a] = value
+    return pc + 1
+
+
+def _lb(m, r, pc, a, b, c):
+    value = m.memory.load_byte((r[b] + c) & MASK)
+    if a:
+        r[a] = ((value ^ 0x80) - 0x80) & MASK
+    return pc + 1
+
+
+def _lbu(m, r, pc, a, b, c):
+    value = m.memory.load_byte((r[b] + c) & MASK)
+    if a:
+        r[a] = value
+    return pc + 1
+
+
+def _lh(m, r, pc, a, b, c):
+    value = load_half(m.memory, (r[b] + c) & MASK)
+    if a:
+        r[a] = ((value ^ 0x8000) - 0x8000) & MASK
+    return pc + 1
+
+
+def _lhu(m, r, pc, a, b, c):
+    value = load_half(m.memory, (r[b] + c) & MASK)
+    if a:
+        r[a] = value
+    return pc + 1
+
+
+def _sw(m, r, pc, a, b, c):
+    m.memory.store_word((r[b] + c) & MASK, r[a])
+    return pc + 1
+
+
+def _sb(m, r, pc, a, b, c):
+    m.memory.store_byte((r[b] + c) & MASK, r[a])
+    return pc + 1
+
+
+def _sh(m, r, pc, a, b, c):
+    store_half(m.memory, (r[b] + c) & MASK, r[a])
+    return pc + 1
+
+
+def _ll(m, r, pc, a, b, c):
+    value = m.load_linked((r[b] + c) & MASK)
+    if a:
+        r[a] = value
+    return pc + 1
+
+
+def _sc(m, r, pc, a, b, c):
+    success = m.store_conditional((r[b] + c) & MASK, r[a])
+    if a:
+        r[a] = success
+    return pc + 1
+
+
+def _branch(m, pc, target):
+    if target < 0:
+        raise ExecutionError(f"Etiket bulunamadı: {m.instruction_memory[pc].split()[-1]}")
+    return target
+
+
+def _beq(m, r, pc, a, b, c):
+    return _branch(m, pc, c) if r[a] == r[b] else pc + 1
+
+
+def _bne(m, r, pc, a, b, c):
+    return _branch(m, pc, c) if r[a] != r[b] else pc + 1
+
+
+def _blez(m, r, pc, a, b, c):
+    return _branch(m, pc, c) if r[a] & SIGN or not r[a] else pc + 1
+
+
+def _bgtz(m, r, pc, a, b, c):
+    return _branch(m, pc, c) if not r[a] & SIGN and r[a] else pc + 1
+
+
+def _bltz(m, r, pc, a, b, c):
+    return _branch(m, pc, c) if r[a] & SIGN else pc + 1
+
+
+def _bgez(m, r, pc, a, b, c):
+    return _branch(m, pc, c) if not r[a] & SIGN else pc + 1
+
+
+def _j(m, r, pc, a, b, c):
+    return _branch(m, pc, a)
+
+
+def _jal(m, r, pc, a, b, c):
+    target = _branch(m, pc, a)
+    r[RA] = pc + 1  # Return Address
+    return target
+
+
+def _jr(m, r, pc, a, b, c):
+    return r[a]
+
+
+def _jalr(m, r, pc, a, b, c):
+    target = r[b]  # rd ile rs aynı olabilir: hedef yazmadan önce okunur
+    if a:
+        r[a] = pc + 1
+    return target
+
+
+def _syscall(m, r, pc, a, b, c):
+    return m.syscall(pc)
+
+
+def _halt(m, r, pc, a, b, c):
+    return pc  # Çalıştırma döngüleri halt'ta zaten durur
+
+
+def _invalid(m, r, pc, a, b, c):
+    raise ExecutionError(f"{a}: {m.instruction_memory[pc]}")
+
+
+EXECUTE = [_invalid] * OP_COUNT  # op kimliği -> işleyici
+for _op, _handler in {
+    OP_NOP: _nop, OP_ADD: _add, OP_ADDU: _add, OP_SUB: _sub, OP_SUBU: _sub, OP_AND: _and, OP_OR: _or, OP_XOR: _xor,
+    OP_NOR: _nor, OP_SLT: _slt, OP_SLTU: _sltu, OP_MUL: _mul, OP_SLL: _sll, OP_SRL: _srl, OP_SRA: _sra,
+    OP_SLLV: _sllv, OP_SRLV: _srlv, OP_SRAV: _srav, OP_MULT: _mult, OP_MULTU: _multu, OP_DIV: _div,
+    OP_DIVU: _divu, OP_MFHI: _mfhi, OP_MFLO: _mflo, OP_MTHI: _mthi, OP_MTLO: _mtlo, OP_ADDI: _addi,
+    OP_ADDIU: _addi, OP_SLTI: _slti, OP_SLTIU: _sltiu, OP_ANDI: _andi, OP_ORI: _ori, OP_XORI: _xori,
+    OP_LUI: _lui, OP_LW: _lw, OP_LB: _lb, OP_LBU: _lbu, OP_LH: _lh, OP_LHU: _lhu, OP_SW: _sw, OP_SB: _sb,
+    OP_SH: _sh, OP_LL: _ll, OP_SC: _sc, OP_BEQ: _beq, OP_BNE: _bne, OP_BLEZ: _blez, OP_BGTZ: _bgtz,
+    OP_BLTZ: _bltz, OP_BGEZ: _bgez, OP_J: _j, OP_JAL: _jal, OP_JR: _jr, OP_JALR: _jalr, OP_SYSCALL: _syscall,
+    OP_HALT: _halt, OP_INVALID: _invalid,
+}.items():
+    EXECUTE[_op] = _handler
+
+
+class Machine:
+    def __init__(self, memory_size=512, instruction_memory_size=512, byteorder="little", memory=None, console=None):
+        self.registers = array("I", [0] * REGISTER_COUNT)  # Register numarasıyla indekslenir
+        self.memory = memory if memory is not None else Memory(memory_size, byteorder)
+        self.console = console if console is not None else Console()
+        self.heap = self.memory.heap_start  # sbrk'nın döndüreceği sıradaki heap adresi
+        self.link = None  # ll ile rezerve edilen (adres, belirteç); sc sonrası silinir
+        self.instruction_memory = [""] * instruction_memory_size
+        self.decoded_program = []  # load sırasında bir kez çözülmüş komutlar
+        self.text_words = None  # Varsa programın 32 bitlik makine kodu (mips_decoder bunu çalıştırır)
+        self.program_length = 0  # Son dolu satırdan bir sonrası; pc buraya ulaşınca program biter
+        self.labels = {}  # Label'ların satır numaralarını tutar
+        self.pc = 0  # Program Counter (komut indeksi)
+        self.realistic_pc = 0  # Donanımsal PC (byte adresi)
+        self.steps = 0  # Çalıştırılan komut sayısı
+        self.block_cache = {}  # mips_translate: başlangıç pc'si -> (blok fonksiyonu, komut sayısı)
+        self.set_initial_registers()
+
+    # Register'ları ve belleği sıfırlar; yüklü program korunur
+    def reset(self):
+        self.registers[:] = array("I", [0] * REGISTER_COUNT)
+        self.memory.clear()
+        self.set_initial_registers()
+        self.rewind()
+
+    # pc'yi, adım sayacını, heap'i, ll rezervasyonunu ve konsolu başa alır
+    def rewind(self):
+        self.pc = 0
+        self.realistic_pc = 0
+        self.steps = 0
+        self.heap = self.memory.heap_start
+        self.link = None
+        self.console.clear()
+
+    # Bellek düzeninin beklediği $sp/$gp gibi başlangıç değerlerini yazar
+    def set_initial_registers(self):
+        for name, value in self.memory.initial_registers.items():
+            self.registers[register_index[name]] = value
+
+    # Kaynak metni Instruction Memory'ye yükler ve komutları bir kez çözer
+    def load(self, source):
+        lines, labels = parse_source(source, len(self.instruction_memory))
+        self.load_program(lines, labels)
+
+    # Satırları ve etiketleri (ve varsa önceden çözülmüş komutları ve makine kodunu) Instruction Memory'ye yükler
+    def load_program(self, lines, labels, decoded=None, words=None):
+        if len(lines) > len(self.instruction_memory):
+            raise ExecutionError("Instruction Memory kapasitesini aştınız!")
+        self.labels = dict(labels)
+        self.rewind()
+        self.instruction_memory = list(lines) + [""] * (len(self.instruction_memory) - len(lines))
+        self.block_cache = {}  # Yeni programda eski çevrilmiş bloklar geçersiz
+
+        # Tüm etiketler bilindiğine göre komutları bir kez çöz; çalıştırma sadece bu listeyi okur
+        if decoded is None:
+            decoded = [decode_instruction(line, self.labels) for line in lines]
+        self.decoded_program = list(decoded)
+        self.text_words = words
+        self.program_length = max((i + 1 for i, line in enumerate(lines) if line), default=0)
+
+    # Artımlı assemble sonrası (mips_assembler.reassemble) programı yalnızca changed satırlarını değiştirerek
+    # yükler. Listeler kopyalanıp öyle değiştirilir (eski anlık görüntüler eski programı görmeye devam eder).
+    # Etiketler aynı kaldıysa çevrilmiş bloklardan sadece değişen bir satırı içerenler atılır. Satır sayısı
+    # değiştiyse load_program ile tam yükleme yapılır. Makine durumu load_program'daki gibi başa alınır.
+    def patch_program(self, lines, labels, decoded, words, changed):
+        if len(lines) != len(self.decoded_program):
+            self.load_program(lines, labels, decoded, words)
+            return
+        if labels != self.labels:  # Blok sınırları etiketlere bağlı
+            self.block_cache = {}
+            self.labels = dict(labels)
+        for start, (_, length) in list(self.block_cache.items()):
+            if any(start <= i < start + max(length, 1) for i in changed):
+                del self.block_cache[start]
+        self.instruction_memory = list(self.instruction_memory)
+        self.decoded_program = list(self.decoded_program)
+        for i in changed:
+            self.instruction_memory[i] = lines[i]
+            self.decoded_program[i] = decoded[i]
+        self.text_words = words
+        self.program_length = max((i + 1 for i, line in enumerate(lines) if line), default=0)
+        self.rewind()
+
+    @property
+    def finished(self):
+        return not 0 <= self.pc < self.program_length or self.decoded_program[self.pc][0] == OP_HALT
+
+    # Komutu işleyici tablosundan (EXECUTE) çalıştırır ve bir sonraki pc'yi döndürür
+    def execute(self, pc, inst):
+        op, a, b, c = inst
+        return EXECUTE[op](self, self.registers, pc, a, b, c)
+
+    # SPIM uyumlu sistem çağrısı: servis $v0'dan, argüman $a0'dan okunur; bir sonraki pc'yi döndürür.
+    # exit programı bitirmek için pc'yi programın sonuna taşır.
+    def syscall(self, pc):
+        registers = self.registers
+        service = registers[V0]
+        argument = registers[A0]
+        if service == SYS_PRINT_INT:
+            self.console.write(str(to_signed(argument)))
+        elif service == SYS_PRINT_STRING:
+            self.console.write(self.read_string(argument))
+        elif service == SYS_READ_INT:
+            registers[V0] = self.console.read_int() & MASK
+        elif service == SYS_SBRK:
+            end = self.heap + ((to_signed(argument) + 3) & ~3)  # Word hizalı ayır
+            if not self.memory.heap_start <= end <= self.memory.heap_limit:
+                raise ExecutionError(f"sbrk: heap sınırı aşıldı ({to_signed(argument)} byte)")
+            registers[V0] = self.heap
+            self.heap = end
+        elif service == SYS_EXIT:
+            return self.program_length
+        elif service == SYS_PRINT_CHAR:
+            self.console.write(chr(argument & 0xFF))
+        else:
+            raise ExecutionError(f"Geçersiz syscall: {to_signed(service)} (pc {pc})")
+        return pc + 1
+
+    # ll: word'ü okur ve adresi rezerve eder. Çok çekirdekli bellekler (mips_multicore) rezervasyonları
+    # load_linked/store_conditional ile kendileri izler; tek çekirdekte araya başka yazan olmadığından
+    # aynı adrese yapılan sc her zaman başarılıdır.
+    def load_linked(self, address):
+        load_linked = getattr(self.memory, "load_linked", None)
+        if load_linked is None:
+            value, token = self.memory.load_word(address), None
+        else:
+            value, token = load_linked(address)
+        self.link = (address, token)
+        return value
+
+    # sc: rezervasyon hâlâ geçerliyse yazar ve 1, değilse 0 döndürür
+    def store_conditional(self, address, value):
+        link, self.link = self.link, None
+        if link is None or link[0] != address:
+            return 0
+        store_conditional = getattr(self.memory, "store_conditional", None)
+        if store_conditional is None:
+            self.memory.store_word(address, value)
+            return 1
+        return 1 if store_conditional(address, value, link[1]) else 0
+
+    # Bellekteki sıfırla biten byte dizisini metne çevirir
+    def read_string(self, address):
+        load_byte = self.memory.load_byte
+        data = bytearray()
+        while True:
+            byte = load_byte(address & MASK)
+            if not byte:
+                return data.decode("utf-8", errors="replace")
+            data.append(byte)
+            address += 1
+
+    # Tek komut çalıştırır; program bitmişse False döner
+    def step(self):
+        if self.finished:
+            return False
+        self.pc = self.execute(self.pc, self.decoded_program[self.pc])
+        self.realistic_pc = self.pc * 4
+        self.steps += 1
+        return True
+
+    # Program bitene ya da max_steps komut çalışana kadar çalıştırır; çalışan komut sayısını döndürür
+    def run(self, max_steps=None):
+        handlers = EXECUTE
+        registers = self.registers
+        program = self.decoded_program
+        program_length = self.program_length
+        limit = -1 if max_steps is None else max_steps
+        pc = self.pc
+        count = 0
+        try:
+            while count != limit and 0 <= pc < program_length:
+                op, a, b, c = program[pc]
+                if op == OP_HALT:  # Halt komutu
+                    break
+                pc = handlers[op](self, registers, pc, a, b, c)
+                count += 1
+        finally:
+            self.pc = pc
+            self.realistic_pc = pc * 4
+            self.steps += count
+        return count
+
+    # Anlık görüntü alır; previous verilirse değişmemiş bellek sayfaları onunla paylaşılır
+    def snapshot(self, previous=None):
+        return Snapshot(self, previous)
+
+    def restore(self, snapshot):
+        self.registers[:] = snapshot.registers
+        self.memory.restore_pages(snapshot.pages)
+        self.pc = snapshot.pc
+        self.realistic_pc = snapshot.realistic_pc
+        self.steps = snapshot.steps
+        self.heap = snapshot.heap
+        self.link = None
+        self.console.restore(snapshot.console)
+        if snapshot.decoded_program is not self.decoded_program:  # Başka bir programın görüntüsü
+            self.instruction_memory = snapshot.instruction_memory
+            self.decoded_program = snapshot.decoded_program
+            self.text_words = snapshot.text_words
+            self.program_length = snapshot.program_length
+            self.labels = snapshot.labels
+            self.block_cache = {}
+
+    # Makine durumunu JSON'a yazılabilir sözlük olarak döndürür (bellekte yalnızca sıfır olmayan word'ler)
+    def state(self):
+        return {
+            "registers": dict({name: to_signed(value) for name, value in zip(register_names, self.registers)},
+                              hi=to_signed(self.registers[HI]), lo=to_signed(self.registers[LO])),
+            "memory": {str(address): to_signed(value) for address, value in self.memory.nonzero_words()},
+            "pc": self.pc,
+            "realistic_pc": self.realistic_pc,
+            "steps": self.steps,
+            "output": self.console.text(),
+        }
+
+
+# Machine.step'i tekrar tekrar çağıran motor (GUI'deki Step düğmesinin yolu); mips_difftest bunu referans alır
+def run_steps(machine, max_steps=None):
+    count = 0
+    while count != max_steps and machine.step():
+        count += 1
+    return count
@@ -0,0 +1,154 @@
+# Breakpoint ve watchpoint'ler.
+# run_debug, Machine.run ile aynı döngüdür; tek farkı her komutta pc ile indekslenen bir bayrak dizisine
+# (bytearray) bakmasıdır. Bayrak yalnızca breakpoint olan, izlenen bir register'a yazan ya da izlenen bellek
+# varken store (sw/sh/sb/sc) olan komutlarda 1'dir; diğer komutlar tek bir indeksleme maliyetiyle normal hızda çalışır.
+# Breakpoint/watchpoint yoksa normal motorlar kullanılır ve hiçbir ek maliyet olmaz.
+#   Breakpoint: "12" (komut indeksi) ya da "loop" (etiket) — komut çalışmadan önce durur
+#   Watchpoint: "mem[0x10]" (word değişince) ya da "$t0 == 10" (==, !=, <, <=, >, >=) — komuttan sonra durur
+import operator
+import re
+
+from mips_core import MASK, OP_HALT, register_index, to_signed
+from mips_isa import STORE_OPS, operands
+
+COMPARISONS = {"==": operator.eq, "!=": operator.ne, "<": operator.lt, "<=": operator.le, ">": operator.gt,
+               ">=": operator.ge}
+MEMORY_WATCH = re.compile(r"mem\[\s*(\w+)\s*\]$")
+REGISTER_WATCH = re.compile(r"(\$\w+)\s*(==|!=|<=|>=|<|>)\s*(-?\w+)$")
+
+
+class BreakpointHit(Exception):
+    pass
+
+
+class Debugger:
+    def __init__(self):
+        self.breakpoints = set()  # Komut indeksleri ve etiket adları
+        self.watched_addresses = set()
+        self.conditions = []  # (register numarası, karşılaştırma, değer, metin)
+        self.resume_at = None  # (pc, adım): bu noktadaki breakpoint'te yeniden durma
+        self.prepared = (None, None, None)  # (program, bayraklar, breakpoint pc'leri); program değişince yenilenir
+
+    def __bool__(self):
+        return bool(self.breakpoints or self.watched_addresses or self.conditions)
+
+    def add_breakpoint(self, spec):
+        spec = spec.strip()
+        self.breakpoints.add(int(spec) if spec.isdigit() else spec)
+
+    def add_watch(self, spec):
+        spec = spec.strip()
+        match = MEMORY_WATCH.match(spec)
+        if match:
+            address = int(match.group(1), 0)
+            if address & 3:
+                raise ValueError(f"Hizalanmamış bellek adresi: {address}")
+            self.watched_addresses.add(address)
+            return
+        match = REGISTER_WATCH.match(spec)
+        if not match or match.group(1) not in register_index:
+            raise ValueError(f"Geçersiz watchpoint: {spec}")
+        name, comparison, value = match.groups()
+        self.conditions.append((register_index[name], COMPARISONS[comparison], int(value, 0), spec))
+
+    # Virgülle ayrılmış breakpoint ve watchpoint listelerinden (GUI alanları) hata ayıklayıcı kurar
+    @classmethod
+    def parse(cls, breakpoints="", watches=""):
+        debugger = cls()
+        for spec in filter(str.strip, breakpoints.split(",")):
+            debugger.add_breakpoint(spec)
+        for spec in filter(str.strip, watches.split(",")):
+            debugger.add_watch(spec)
+        return debugger
+
+    # Etiketleri çözülmüş breakpoint pc'leri; bulunamayan etiket hata verir
+    def breakpoint_pcs(self, labels):
+        pcs = set()
+        for spec in self.breakpoints:
+            if isinstance(spec, int):
+                pcs.add(spec)
+            elif spec in labels:
+                pcs.add(labels[spec])
+            else:
+                raise ValueError(f"Etiket bulunamadı: {spec}")
+        return pcs
+
+    # pc -> 1: bu komutta yavaş yol (breakpoint ya da watchpoint kontrolü) gerekir.
+    # Motor parçalar halinde çağrıldığından sonuç aynı program için saklanır.
+    def prepare(self, machine):
+        program = machine.decoded_program
+        if self.prepared[0] is program:
+            return self.prepared[1], self.prepared[2]
+        breakpoints = self.breakpoint_pcs(machine.labels)
+        flags = bytearray(len(program))
+        for pc in breakpoints:
+            if 0 <= pc < len(flags):
+                flags[pc] = 1
+        watched_registers = {reg for reg, _, _, _ in self.conditions}
+        for pc, inst in enumerate(program):
+            if operands(inst)[3] in watched_registers or (self.watched_addresses and inst[0] in STORE_OPS):
+                flags[pc] = 1
+        self.prepared = (program, flags, breakpoints)
+        return flags, breakpoints
+
+
+# Machine.run gibi çalışır; bir breakpoint ya da watchpoint tetiklenince BreakpointHit verir
+def run_debug(machine, debugger, max_steps=None):
+    program = machine.decoded_program
+    program_length = machine.program_length
+    registers = machine.registers
+    memory = machine.memory
+    execute = machine.execute
+    flags, breakpoints = debugger.prepare(machine)
+    watched = debugger.watched_addresses
+    conditions = debugger.conditions
+    limit = -1 if max_steps is None else max_steps
+    pc = machine.pc
+    count = 0
+    hit = None
+    try:
+        while count != limit and 0 <= pc < program_length:
+            inst = program[pc]
+            if inst[0] == OP_HALT:
+                break
+            if not flags[pc]:
+                pc = execute(pc, inst)
+                count += 1
+                continue
+            if pc in breakpoints and debugger.resume_at != (pc, machine.steps + count):
+                hit = f"Breakpoint: pc {pc} ({machine.instruction_memory[pc]})"
+                break
+            address = old = None
+            if inst[0] in STORE_OPS and watched:
+                address = (registers[inst[2]] + inst[3]) & MASK & ~3  # sb/sh adresin bulunduğu word'ü değiştirir
+                if address in watched:
+                    old = memory.load_word(address)
+            current = pc
+            pc = execute(pc, inst)
+            count += 1
+            if old is not None and memory.load_word(address) != old:
+                hit = (f"Watchpoint: mem[{address}] {to_signed(old)} -> {to_signed(memory.load_word(address))} "
+                       f"(pc {current}: {machine.instruction_memory[current]})")
+                break
+            dest = operands(inst)[3]
+            for reg, compare, value, text in conditions:
+                if reg == dest and compare(to_signed(registers[reg]), value):
+                    hit = f"Watchpoint: {text} (pc {current}: {machine.instruction_memory[current]})"
+                    break
+            if hit is not None:
+                break
+    finally:
+        machine.pc = pc
+        machine.realistic_pc = pc * 4
+        machine.steps += count
+    if hit is not None:
+        debugger.resume_at = (pc, machine.steps)  # Devam edilince aynı breakpoint'te tekrar durulmaz
+        raise BreakpointHit(hit)
+    return count
+
+
+# Motor sözleşmesine (machine, max_steps) uyan, debugger'a bağlı run_debug
+def debug_engine(debugger):
+    def engine(machine, max_steps=None):
+        return run_debug(machine, debugger, max_steps)
+    return engine
@@ -0,0 +1,396 @@
+# 32 bitlik makine kodunu doğrudan çalıştıran motor.
+# Instruction Memory'deki word'ler getirilir ve opcode alanına göre önceden hazırlanmış işleyici
+# (handler) tablosundan tek bir indeksleme ile dağıtılır; kaynak metne hiç ihtiyaç duyulmaz. R-Type komutlar
+# (opcode 0, SPECIAL) funct alanıyla ikinci bir tablodan dağıtılır.
+# Her işleyici (registers, memory, pc, word) alır, alanları word'den çıkarır ve bir sonraki pc'yi döndürür.
+from mips_core import MASK, SIGN, ExecutionError, RA, divide, load_half, store_half, to_signed
+from mips_isa import (HI, LO, OP_ADD, OP_ADDI, OP_ADDIU, OP_ADDU, OP_AND, OP_ANDI, OP_BEQ, OP_BGTZ, OP_BLEZ, OP_BNE,
+                      OP_DIV, OP_DIVU, OP_HALT, OP_J, OP_JAL, OP_JALR, OP_JR, OP_LB, OP_LBU, OP_LH, OP_LHU, OP_LL,
+                      OP_LUI, OP_LW, OP_MFHI, OP_MFLO, OP_MTHI, OP_MTLO, OP_MULT, OP_MULTU, OP_NOR, OP_OR, OP_ORI,
+                      OP_SB, OP_SC, OP_SH, OP_SLL, OP_SLLV, OP_SLT, OP_SLTI, OP_SLTIU, OP_SLTU, OP_SRA, OP_SRAV,
+                      OP_SRL, OP_SRLV, OP_SUB, OP_SUBU, OP_SW, OP_SYSCALL, OP_XOR, OP_XORI, REGIMM, SPECIAL,
+                      SPECIAL2, op_encodings)
+
+HALTED = -1  # halt işleyicisinin döndürdüğü özel pc
+MACHINE = -2  # Komutu Machine.execute'a bırakan işleyicilerin (syscall, ll, sc) döndürdüğü özel pc
+
+
+def _imm(word):
+    return ((word & 0xFFFF) ^ 0x8000) - 0x8000  # İşaret genişletmeli 16 bit immediate
+
+
+def _add(r, mem, pc, w):
+    rd = (w >> 11) & 31
+    if rd:
+        r[rd] = (r[(w >> 21) & 31] + r[(w >> 16) & 31]) & MASK
+    return pc + 1
+
+
+def _sub(r, mem, pc, w):
+    rd = (w >> 11) & 31
+    if rd:
+        r[rd] = (r[(w >> 21) & 31] - r[(w >> 16) & 31]) & MASK
+    return pc + 1
+
+
+def _and(r, mem, pc, w):
+    rd = (w >> 11) & 31
+    if rd:
+        r[rd] = r[(w >> 21) & 31] & r[(w >> 16) & 31]
+    return pc + 1
+
+
+def _or(r, mem, pc, w):
+    rd = (w >> 11) & 31
+    if rd:
+        r[rd] = r[(w >> 21) & 31] | r[(w >> 16) & 31]
+    return pc + 1
+
+
+def _xor(r, mem, pc, w):
+    rd = (w >> 11) & 31
+    if rd:
+        r[rd] = r[(w >> 21) & 31] ^ r[(w >> 16) & 31]
+    return pc + 1
+
+
+def _nor(r, mem, pc, w):
+    rd = (w >> 11) & 31
+    if rd:
+        r[rd] = ~(r[(w >> 21) & 31] | r[(w >> 16) & 31]) & MASK
+    return pc + 1
+
+
+def _slt(r, mem, pc, w):
+    rd = (w >> 11) & 31
+    if rd:
+        r[rd] = 1 if r[(w >> 21) & 31] ^ SIGN < r[(w >> 16) & 31] ^ SIGN else 0
+    return pc + 1
+
+
+def _sltu(r, mem, pc, w):
+    rd = (w >> 11) & 31
+    if rd:
+        r[rd] = 1 if r[(w >> 21) & 31] < r[(w >> 16) & 31] else 0
+    return pc + 1
+
+
+def _sll(r, mem, pc, w):
+    rd = (w >> 11) & 31
+    if rd:
+        r[rd] = (r[(w >> 16) & 31] << ((w >> 6) & 31)) & MASK
+    return pc + 1
+
+
+def _srl(r, mem, pc, w):
+    rd = (w >> 11) & 31
+    if rd:
+        r[rd] = r[(w >> 16) & 31] >> ((w >> 6) & 31)
+    return pc + 1
+
+
+def _sra(r, mem, pc, w):
+    rd = (w >> 11) & 31
+    if rd:
+        r[rd] = (to_signed(r[(w >> 16) & 31]) >> ((w >> 6) & 31)) & MASK
+    return pc + 1
+
+
+def _sllv(r, mem, pc, w):
+    rd = (w >> 11) & 31
+    if rd:
+        r[rd] = (r[(w >> 16) & 31] << (r[(w >> 21) & 31] & 31)) & MASK
+    return pc + 1
+
+
+def _srlv(r, mem, pc, w):
+    rd = (w >> 11) & 31
+    if rd:
+        r[rd] = r[(w >> 16) & 31] >> (r[(w >> 21) & 31] & 31)
+    return pc + 1
+
+
+def _srav(r, mem, pc, w):
+    rd = (w >> 11) & 31
+    if rd:
+        r[rd] = (to_signed(r[(w >> 16) & 31]) >> (r[(w >> 21) & 31] & 31)) & MASK
+    return pc + 1
+
+
+def _mfhi(r, mem, pc, w):
+    rd = (w >> 11) & 31
+    if rd:
+        r[rd] = r[HI]
+    return pc + 1
+
+
+def _mflo(r, mem, pc, w):
+    rd = (w >> 11) & 31
+    if rd:
+        r[rd] = r[LO]
+    return pc + 1
+
+
+def _mthi(r, mem, pc, w):
+    r[HI] = r[(w >> 21) & 31]
+    return pc + 1
+
+
+def _mtlo(r, mem, pc, w):
+    r[LO] = r[(w >> 21) & 31]
+    return pc + 1
+
+
+def _mult(r, mem, pc, w):
+    product = to_signed(r[(w >> 21) & 31]) * to_signed(r[(w >> 16) & 31])
+    r[HI], r[LO] = (product >> 32) & MASK, product & MASK
+    return pc + 1
+
+
+def _multu(r, mem, pc, w):
+    product = r[(w >> 21) & 31] * r[(w >> 16) & 31]
+    r[HI], r[LO] = product >> 32, product & MASK
+    return pc + 1
+
+
+def _div(r, mem, pc, w):
+    quotient, remainder = divide(to_signed(r[(w >> 21) & 31]), to_signed(r[(w >> 16) & 31]))
+    r[HI], r[LO] = remainder & MASK, quotient & MASK
+    return pc + 1
+
+
+def _divu(r, mem, pc, w):
+    quotient, remainder = divide(r[(w >> 21) & 31], r[(w >> 16) & 31])
+    r[HI], r[LO] = remainder, quotient
+    return pc + 1
+
+
+def _jr(r, mem, pc, w):
+    return r[(w >> 21) & 31]
+
+
+def _jalr(r, mem, pc, w):
+    target = r[(w >> 21) & 31]  # rd ile rs aynı olabilir: hedef yazmadan önce okunur
+    rd = (w >> 11) & 31
+    if rd:
+        r[rd] = pc + 1
+    return target
+
+
+def _addi(r, mem, pc, w):
+    rt = (w >> 16) & 31
+    if rt:
+        r[rt] = (r[(w >> 21) & 31] + _imm(w)) & MASK
+    return pc + 1
+
+
+def _slti(r, mem, pc, w):
+    rt = (w >> 16) & 31
+    if rt:
+        r[rt] = 1 if r[(w >> 21) & 31] ^ SIGN < (_imm(w) & MASK) ^ SIGN else 0
+    return pc + 1
+
+
+def _sltiu(r, mem, pc, w):
+    rt = (w >> 16) & 31
+    if rt:
+        r[rt] = 1 if r[(w >> 21) & 31] < _imm(w) & MASK else 0
+    return pc + 1
+
+
+def _andi(r, mem, pc, w):
+    rt = (w >> 16) & 31
+    if rt:
+        r[rt] = r[(w >> 21) & 31] & (w & 0xFFFF)
+    return pc + 1
+
+
+def _ori(r, mem, pc, w):
+    rt = (w >> 16) & 31
+    if rt:
+        r[rt] = r[(w >> 21) & 31] | (w & 0xFFFF)
+    return pc + 1
+
+
+def _xori(r, mem, pc, w):
+    rt = (w >> 16) & 31
+    if rt:
+        r[rt] = r[(w >> 21) & 31] ^ (w & 0xFFFF)
+    return pc + 1
+
+
+def _lui(r, mem, pc, w):
+    rt = (w >> 16) & 31
+    if rt:
+        r[rt] = (w & 0xFFFF) << 16
+    return pc + 1
+
+
+def _lw(r, mem, pc, w):
+    value = mem.load_word((r[(w >> 21) & 31] + _imm(w)) & MASK)
+    rt = (w >> 16) & 31
+    if rt:
+        r[rt] = value
+    return pc + 1
+
+
+def _lb(r, mem, pc, w):
+    value = mem.load_byte((r[(w >> 21) & 31] + _imm(w)) & MASK)
+    rt = (w >> 16) & 31
+    if rt:
+        r[rt] = ((value ^ 0x80) - 0x80) & MASK
+    return pc + 1
+
+
+def _lbu(r, mem, pc, w):
+    value = mem.load_byte((r[(w >> 21) & 31] + _imm(w)) & MASK)
+    rt = (w >> 16) & 31
+    if rt:
+        r[rt] = value
+    return pc + 1
+
+
+def _lh(r, mem, pc, w):
+    value = load_half(mem, (r[(w >> 21) & 31] + _imm(w)) & MASK)
+    rt = (w >> 16) & 31
+    if rt:
+        r[rt] = ((value ^ 0x8000) - 0x8000) & MASK
+    return pc + 1
+
+
+def _lhu(r, mem, pc, w):
+    value = load_half(mem, (r[(w >> 21) & 31] + _imm(w)) & MASK)
+    rt = (w >> 16) & 31
+    if rt:
+        r[rt] = value
+    return pc + 1
+
+
+def _sw(r, mem, pc, w):
+    mem.store_word((r[(w >> 21) & 31] + _imm(w)) & MASK, r[(w >> 16) & 31])
+    return pc + 1
+
+
+def _sb(r, mem, pc, w):
+    mem.store_byte((r[(w >> 21) & 31] + _imm(w)) & MASK, r[(w >> 16) & 31])
+    return pc + 1
+
+
+def _sh(r, mem, pc, w):
+    store_half(mem, (r[(w >> 21) & 31] + _imm(w)) & MASK, r[(w >> 16) & 31])
+    return pc + 1
+
+
+# Dallanma hedefleri bir sonraki komuta göre işaretli uzaklıktır
+def _beq(r, mem, pc, w):
+    return pc + 1 + _imm(w) if r[(w >> 21) & 31] == r[(w >> 16) & 31] else pc + 1
+
+
+def _bne(r, mem, pc, w):
+    return pc + 1 + _imm(w) if r[(w >> 21) & 31] != r[(w >> 16) & 31] else pc + 1
+
+
+def _blez(r, mem, pc, w):
+    value = r[(w >> 21) & 31]
+    return pc + 1 + _imm(w) if value & SIGN or not value else pc + 1
+
+
+def _bgtz(r, mem, pc, w):
+    value = r[(w >> 21) & 31]
+    return pc + 1 + _imm(w) if value and not value & SIGN else pc + 1
+
+
+# bltz/bgez (REGIMM) komutu rt alanı ayırır
+def _regimm(r, mem, pc, w):
+    condition = (w >> 16) & 31
+    if condition > 1:
+        return _invalid(r, mem, pc, w)
+    return pc + 1 + _imm(w) if bool(r[(w >> 21) & 31] & SIGN) != condition else pc + 1
+
+
+# SPECIAL2 içinde yalnızca mul vardır
+def _special2(r, mem, pc, w):
+    if w & 63 != 2:
+        return _invalid(r, mem, pc, w)
+    rd = (w >> 11) & 31
+    if rd:
+        r[rd] = (to_signed(r[(w >> 21) & 31]) * to_signed(r[(w >> 16) & 31])) & MASK
+    return pc + 1
+
+
+def _j(r, mem, pc, w):
+    return w & 0x3FFFFFF
+
+
+def _jal(r, mem, pc, w):
+    r[RA] = pc + 1  # Return Address
+    return w & 0x3FFFFFF
+
+
+def _halt(r, mem, pc, w):
+    return HALTED
+
+
+# Makinenin durumuna (konsol, heap, ll rezervasyonu) dokunan komutlar
+def _machine(r, mem, pc, w):
+    return MACHINE
+
+
+def _invalid(r, mem, pc, w):
+    raise ExecutionError(f"Geçersiz komut kodu: 0x{w:08x}")
+
+
+# op kimliği -> işleyici; tablolar modül yüklenirken mips_isa'daki kodlamalardan bir kez kurulur.
+# R-Type komutlar (SPECIAL) funct alanına göre funct_handlers'tan, diğerleri opcode'a göre opcode_handlers'tan
+# çalıştırılır; REGIMM (bltz/bgez) ve SPECIAL2 (mul) kendi alanlarını işleyicinin içinde ayırır.
+handlers_by_op = {
+    OP_ADD: _add, OP_ADDU: _add, OP_SUB: _sub, OP_SUBU: _sub, OP_AND: _and, OP_OR: _or, OP_XOR: _xor, OP_NOR: _nor,
+    OP_SLT: _slt, OP_SLTU: _sltu, OP_SLL: _sll, OP_SRL: _srl, OP_SRA: _sra, OP_SLLV: _sllv, OP_SRLV: _srlv,
+    OP_SRAV: _srav, OP_MFHI: _mfhi, OP_MFLO: _mflo, OP_MTHI: _mthi, OP_MTLO: _mtlo, OP_MULT: _mult,
+    OP_MULTU: _multu, OP_DIV: _div, OP_DIVU: _divu, OP_JR: _jr, OP_JALR: _jalr, OP_SYSCALL: _machine,
+    OP_HALT: _halt, OP_ADDI: _addi, OP_ADDIU: _addi, OP_SLTI: _slti, OP_SLTIU: _sltiu, OP_ANDI: _andi,
+    OP_ORI: _ori, OP_XORI: _xori, OP_LUI: _lui, OP_LW: _lw, OP_LB: _lb, OP_LBU: _lbu, OP_LH: _lh, OP_LHU: _lhu,
+    OP_SW: _sw, OP_SB: _sb, OP_SH: _sh, OP_LL: _machine, OP_SC: _machine, OP_BEQ: _beq, OP_BNE: _bne,
+    OP_BLEZ: _blez, OP_BGTZ: _bgtz, OP_J: _j, OP_JAL: _jal,
+}
+opcode_handlers = [_invalid] * 64
+funct_handlers = [_invalid] * 64
+for _op, _handler in handlers_by_op.items():
+    _opcode, _funct = op_encodings[_op]
+    if _opcode == SPECIAL:
+        funct_handlers[_funct] = _handler
+    else:
+        opcode_handlers[_opcode] = _handler
+opcode_handlers[REGIMM] = _regimm
+opcode_handlers[SPECIAL2] = _special2
+
+
+# machine.text_words içindeki makine kodunu çalıştırır; Machine.run ile aynı sözleşme
+def run_words(machine, max_steps=None):
+    words = machine.text_words
+    if words is None:
+        raise ExecutionError("Yüklü programın makine kodu yok")
+    handlers = opcode_handlers
+    functs = funct_handlers
+    registers = machine.registers
+    memory = machine.memory
+    program_length = machine.program_length
+    limit = -1 if max_steps is None else max_steps
+    pc = machine.pc
+    count = 0
+    try:
+        while count != limit and 0 <= pc < program_length:
+            word = words[pc]
+            opcode = word >> 26
+            next_pc = (handlers[opcode] if opcode else functs[word & 63])(registers, memory, pc, word)
+            if next_pc < 0:
+                if next_pc == HALTED:
+                    break
+                next_pc = machine.execute(pc, machine.decoded_program[pc])
+            pc = next_pc
+            count += 1
+    finally:
+        machine.pc = pc
+        machine.realistic_pc = pc * 4
+        machine.steps += count
+    return count
@@ -0,0 +1,177 @@
+# Motorlar arası farklılık testi (differential testing).
+# Aynı program her motorla (step, interp, block, words) ayrı bir makinede interval komutluk parçalar halinde
+# çalıştırılır; her parçadan sonra makine durumunun özeti (register'lar, pc, realistic_pc, adım sayısı, bellek,
+# heap, konsol çıktısı ve girdi konumu) ilk motorunkiyle karşılaştırılır. Özetler ayrışırsa iki makine son
+# eşleşen noktadaki anlık görüntülerine döndürülüp ikili arama ile durumların ilk ayrıştığı adım bulunur ve o
+# adımda çalışan komut ile farklı register/bellek değerleri raporlanır. Blok motoru bir bloğu bütün olarak
+# çalıştırdığından ayrışma o motor için hatalı bloğun son komutunda görülür.
+# Kullanım: python mips_difftest.py program.asm [...] [--engine words ...] [--interval 1000] [--max-steps N]
+import argparse
+import hashlib
+import json
+import sys
+
+from mips_cli import ENGINES, read_program
+from mips_core import Console, ExecutionError, Machine, Memory
+from mips_memory import PagedMemory
+
+DEFAULT_ENGINES = ["step", "interp", "block", "words"]  # İlki referanstır
+
+
+def state_key(machine):
+    h = hashlib.blake2b(machine.registers.tobytes(), digest_size=16)
+    h.update(machine.memory.digest())
+    position = machine.console.position
+    h.update(repr((machine.pc, machine.realistic_pc, machine.steps, machine.heap, position)).encode())
+    h.update(machine.console.text().encode())
+    return h.digest()
+
+
+def new_machine(program, memory_size=512, paged=False, input_text=""):
+    memory = PagedMemory() if paged else Memory(memory_size)
+    capacity = max(512, len(program.lines))
+    machine = Machine(memory=memory, instruction_memory_size=capacity, console=Console(input_text))
+    machine.load_program(program.lines, program.labels, program.decoded, program.words)
+    return machine
+
+
+# Motoru en fazla count komut çalıştırır; hata olursa mesajını döndürür
+def advance(machine, engine, count):
+    try:
+        engine(machine, count)
+    except ExecutionError as e:
+        return str(e)
+    return None
+
+
+# İki makinenin son durumları arasındaki farklar
+def differences(reference, other):
+    first, second = reference.state(), other.state()
+    diff = {}
+    for field in ("pc", "realistic_pc", "steps", "output"):
+        if first[field] != second[field]:
+            diff[field] = [first[field], second[field]]
+    for field in ("registers", "memory"):
+        keys = sorted(first[field].keys() | second[field].keys(), key=lambda key: (len(key), key))
+        changed = {key: [first[field].get(key, 0), second[field].get(key, 0)] for key in keys
+                   if first[field].get(key, 0) != second[field].get(key, 0)}
+        if changed:
+            diff[field] = changed
+    return diff
+
+
+# Anlık görüntülerden (start adımı, ikisinde de aynı) başlayıp durumların ilk ayrıştığı adımı ikili arama ile
+# bulur; end adımında ayrıştıkları bilinmektedir
+def locate(machines, engines, snapshots, start, end):
+    def probe(steps):
+        keys = []
+        errors = []
+        for machine, engine, snapshot in zip(machines, engines, snapshots):
+            machine.restore(snapshot)
+            errors.append(advance(machine, engine, steps - start))
+            keys.append((state_key(machine), errors[-1] is not None))
+        return keys[0] == keys[1], errors
+
+    low, high = start, end
+    while high - low > 1:
+        middle = (low + high) // 2
+        if probe(middle)[0]:
+            low = middle
+        else:
+            high = middle
+    probe(low)
+    reference = machines[0]
+    pc = reference.pc
+    instruction = reference.instruction_memory[pc] if 0 <= pc < len(reference.instruction_memory) else ""
+    _, errors = probe(high)
+    return {
+        "step": low,  # Ayrışmadan önce çalışmış komut sayısı
+        "pc": pc,
+        "instruction": instruction,
+        "errors": errors,
+        "differences": differences(*machines),
+    }
+
+
+# program'ı engines motorlarının her biriyle çalıştırıp her interval komutta karşılaştırır.
+# Sonuç: motorlar, karşılaştırılan adım sayısı ve (varsa) ilk ayrışmanın raporu.
+def compare(program, engines=DEFAULT_ENGINES, interval=1000, max_steps=None, memory_size=512, paged=False,
+            input_text=""):
+    if "words" in engines and program.errors:  # Hatalı satırların makine kodu yok
+        line, message = min(program.errors.items())
+        raise ExecutionError(f"Assemble hatası (satır {line}): {message}")
+    machines = [new_machine(program, memory_size, paged, input_text) for _ in engines]
+    runners = [ENGINES[name] for name in engines]
+    snapshots = [machine.snapshot() for machine in machines]
+    errors = [None] * len(engines)
+    checked = 0
+    result = {"engines": list(engines), "divergence": None}
+    while True:
+        chunk = interval if max_steps is None else min(interval, max_steps - checked)
+        for i, (machine, run) in enumerate(zip(machines, runners)):
+            if errors[i] is None and not machine.finished:
+                errors[i] = advance(machine, run, chunk)
+        keys = [(state_key(machine), error is not None) for machine, error in zip(machines, errors)]
+        for i in range(1, len(engines)):
+            if keys[i] != keys[0]:
+                pair = [machines[0], machines[i]]
+                divergence = locate(pair, [runners[0], runners[i]], [snapshots[0], snapshots[i]], checked,
+                                    max(machine.steps for machine in pair))
+                divergence["engines"] = [engines[0], engines[i]]
+                result["divergence"] = divergence
+                result["steps"] = checked
+                return result
+        reference = machines[0]
+        done = errors[0] is not None or reference.finished or reference.steps == checked
+        checked = reference.steps
+        if done or (max_steps is not None and checked >= max_steps):
+            break
+        snapshots = [machine.snapshot(snapshot) for machine, snapshot in zip(machines, snapshots)]
+    result["steps"] = checked
+    result["error"] = errors[0]
+    result["finished"] = machines[0].finished
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Aynı programı tüm motorlarla çalıştırıp durumları karşılaştırır.")
+    parser.add_argument("files", nargs="+", help="Karşılaştırılacak .asm ya da .bin dosyaları")
+    parser.add_argument("--engine", action="append", choices=sorted(ENGINES),
+                        help="Karşılaştırılacak motor (tekrarlanabilir); ilki referanstır")
+    parser.add_argument("--interval", type=int, default=1000,
+                        help="Durum özetlerinin karşılaştırılma aralığı (komut)")
+    parser.add_argument("--max-steps", type=int, default=None, help="Program başına en fazla komut sayısı")
+    parser.add_argument("--memory-size", type=int, default=512, help="Veri belleği boyutu (byte)")
+    parser.add_argument("--paged", action="store_true",
+                        help="Tüm 32 bit adres alanını kapsayan sayfalı bellek kullan")
+    parser.add_argument("--input", metavar="PATH", help="read int syscall'larının okuyacağı girdi dosyası")
+    args = parser.parse_args(argv)
+    engines = args.engine or DEFAULT_ENGINES
+    if len(engines) < 2:
+        parser.error("En az iki motor gerekli")
+    if args.interval < 1:
+        parser.error("--interval en az 1 olmalı")
+    input_text = ""
+    if args.input:
+        try:
+            with open(args.input, encoding="utf-8") as f:
+                input_text = f.read()
+        except OSError as e:
+            parser.error(str(e))
+
+    failed = False
+    for path in args.files:
+        try:
+            program = read_program(path, 1 << 20, "words" if "words" in engines else "interp")
+            result = compare(program, engines, args.interval, args.max_steps, args.memory_size, args.paged,
+                             input_text)
+        except (ExecutionError, OSError, ValueError) as e:
+            result = {"error": str(e), "divergence": None}
+        result = dict({"file": path}, **result)
+        failed = failed or result["divergence"] is not None
+        print(json.dumps(result, ensure_ascii=False))  # Dosya başına bir JSON satırı
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,296 @@
+# Rastgele MIPS programı üreteci, fuzzer ve ölçeklenme (stress) ölçümü.
+# generate, tohum (seed) verildiğinde her seferinde aynı, geçerli bir program üretir: R-type, sabit ve değişken
+# kaydırmalar, immediate'lı komutlar (li dahil), HI/LO kullanan çarpma/bölme (bölen $at ile sıfırdan farklı
+# yapılır), $zero tabanlı ve footprint byte içinde kalan word/half/byte erişimleri, ileri dallanmalar ve sayacı
+# ayrılmış register'larda tutulan sınırlı döngüler (bne ile geri dönen ya da beq + j ile çıkan). Döngü
+# sayaçlarına gövde dokunmadığından her program biter.
+# --fuzz N: N program üretir, satırlarını mutate oranında bozar (eksik/fazla operand, geçersiz register,
+#   taşan immediate, bilinmeyen komut...) ve mips_difftest ile tüm motorlarda çalıştırır. ExecutionError
+#   beklenen sonuçtur; başka her istisna "crash", motorlar arası fark "divergence" olarak raporlanır.
+# --stress 100,1000,...: her uzunluktaki program her motorla çalıştırılıp saniyedeki komut sayısı ölçülür.
+# Kullanım: python mips_fuzz.py [--seed 1] [--length 200] [--mix alu=4,mem=2,loop=1] [-o program.asm]
+#           python mips_fuzz.py --fuzz 500 --mutate 0.1
+#           python mips_fuzz.py --stress 100,1000,10000 --engine interp --engine block
+import argparse
+import json
+import random
+import sys
+import time
+import traceback
+
+from mips_assembler import IMM_MAX, IMM_MIN, assemble
+from mips_cli import ENGINES
+from mips_core import ExecutionError
+from mips_difftest import DEFAULT_ENGINES, compare, new_machine
+
+DATA_REGISTERS = ["$t0", "$t1", "$t2", "$t3", "$t4", "$t5", "$t6", "$t7", "$t8", "$t9",
+                  "$s0", "$s1", "$s2", "$s3", "$s4"]
+COUNTER_REGISTERS = ["$s5", "$s6", "$s7"]  # Döngü sayaçları; iç içe döngü derinliği en fazla bu kadar
+DEFAULT_MIX = {"alu": 5, "shift": 1, "imm": 3, "muldiv": 1, "mem": 2, "branch": 1, "loop": 1}
+SIMPLE_KINDS = ["alu", "shift", "imm", "muldiv", "mem"]  # Dallanma ve döngü içermeyen türler
+LOADS = {1: ["lb", "lbu"], 2: ["lh", "lhu"], 4: ["lw"]}  # Erişim genişliği (byte) -> komutlar
+STORES = {1: "sb", 2: "sh", 4: "sw"}
+MUTATIONS = ["drop", "extra", "register", "immediate", "mnemonic", "junk"]
+
+
+# "alu=4,mem=2" biçimindeki komut karışımını DEFAULT_MIX üzerine yazar
+def parse_mix(spec):
+    mix = dict(DEFAULT_MIX)
+    for item in filter(None, spec.split(",")):
+        key, _, value = item.partition("=")
+        if key not in DEFAULT_MIX:
+            raise ValueError(f"Bilinmeyen komut türü: {key}")
+        mix[key] = int(value)
+        if mix[key] < 0:
+            raise ValueError(f"Ağırlık negatif olamaz: {item}")
+    if not any(weight for key, weight in mix.items() if key not in ("branch", "loop")):
+        raise ValueError(f"Düz komut türlerinden ({', '.join(SIMPLE_KINDS)}) en az birinin ağırlığı olmalı")
+    return mix
+
+
+class ProgramGenerator:
+    def __init__(self, seed=0, mix=None, footprint=256, max_depth=2, max_iterations=8):
+        if footprint < 4 or footprint > IMM_MAX + 1:
+            raise ValueError(f"footprint 4 ile {IMM_MAX + 1} byte arasında olmalı")
+        if not 0 <= max_depth <= len(COUNTER_REGISTERS):
+            raise ValueError(f"Döngü derinliği 0 ile {len(COUNTER_REGISTERS)} arasında olmalı")
+        self.rng = random.Random(seed)
+        self.mix = dict(mix or DEFAULT_MIX)
+        self.footprint = footprint
+        self.max_depth = max_depth
+        self.max_iterations = max_iterations
+        self.labels = 0
+
+    def label(self, prefix):
+        self.labels += 1
+        return f"{prefix}{self.labels}"
+
+    def source(self):
+        return self.rng.choice(DATA_REGISTERS + ["$zero"])
+
+    def immediate(self):
+        if self.rng.random() < 0.1:
+            return self.rng.randint(IMM_MIN, IMM_MAX)
+        return self.rng.randint(-64, 64)
+
+    # Dallanma ve döngü içermeyen tek komut
+    def simple(self, kind):
+        rng = self.rng
+        if kind == "alu":
+            op = rng.choice(["add", "addu", "sub", "subu", "and", "or", "xor", "nor", "slt", "sltu", "mul"])
+            return f"{op} {rng.choice(DATA_REGISTERS)}, {self.source()}, {self.source()}"
+        if kind == "shift":
+            op = rng.choice(["sll", "srl", "sra", "sllv", "srlv", "srav"])
+            amount = self.source() if op.endswith("v") else rng.randint(0, 31)
+            return f"{op} {rng.choice(DATA_REGISTERS)}, {self.source()}, {amount}"
+        if kind == "imm":
+            op = rng.choice(["addi", "addiu", "slti", "sltiu", "andi", "ori", "xori", "lui", "li"])
+            if op == "lui":
+                return f"lui {rng.choice(DATA_REGISTERS)}, {rng.randint(0, 0xFFFF)}"
+            if op == "li":
+                return f"li {rng.choice(DATA_REGISTERS)}, {rng.randint(-0x80000000, 0xFFFFFFFF)}"
+            value = rng.randint(0, 0xFFFF) if op in ("andi", "ori", "xori") else self.immediate()
+            return f"{op} {rng.choice(DATA_REGISTERS)}, {self.source()}, {value}"
+        if kind == "muldiv":
+            op = rng.choice(["mult", "multu", "mfhi", "mflo", "mthi", "mtlo"])
+            if op in ("mult", "multu"):
+                return f"{op} {self.source()}, {self.source()}"
+            return f"{op} {rng.choice(DATA_REGISTERS) if op.startswith('mf') else self.source()}"
+        width = rng.choice([1, 2, 4])
+        offset = rng.randrange(0, self.footprint // width) * width  # Erişim genişliğine hizalı
+        if rng.random() < 0.5:
+            return f"{rng.choice(LOADS[width])} {rng.choice(DATA_REGISTERS)}, {offset}($zero)"
+        return f"{STORES[width]} {self.source()}, {offset}($zero)"
+
+    def kind(self, depth):
+        kinds = [kind for kind, weight in self.mix.items() if weight
+                 and (kind != "loop" or depth < self.max_depth)]
+        return self.rng.choices(kinds, [self.mix[kind] for kind in kinds])[0]
+
+    # count satırlık bir kod parçası üretir (döngü ve atlamaların kendi komutları ve etiket satırları da sayılır)
+    def block(self, count, depth=0):
+        rng = self.rng
+        lines = []
+        while len(lines) < count:
+            left = count - len(lines)
+            kind = self.kind(depth)
+            if kind == "branch" and left >= 3:
+                skip = self.label("skip")
+                body = [self.simple(self.kind_simple()) for _ in range(rng.randint(1, min(4, left - 2)))]
+                op = rng.choice(["beq", "bne", "blez", "bgtz", "bltz", "bgez", "beqz", "bnez"])
+                operands = f"{self.source()}, {self.source()}" if op in ("beq", "bne") else self.source()
+                lines += [f"{op} {operands}, {skip}"] + body + [f"{skip}:"]
+            elif kind == "muldiv" and left >= 2 and rng.random() < 0.3:
+                # Bölen $at'a sıfırdan farklı olarak hazırlanır (sıfıra bölme programı hatayla bitirirdi)
+                op = rng.choice(["div", "divu"])
+                lines += [f"ori $at, {self.source()}, 1", f"{op} {self.source()}, $at"]
+            elif kind == "loop" and left >= 6:
+                lines += self.loop(rng.randint(1, min(12, left - 5)), depth)
+            elif kind not in ("branch", "loop"):
+                lines.append(self.simple(kind))
+            else:
+                lines.append(self.simple(self.kind_simple()))
+        return lines
+
+    def kind_simple(self):
+        kinds = [kind for kind in SIMPLE_KINDS if self.mix[kind]]
+        return self.rng.choices(kinds, [self.mix[kind] for kind in kinds])[0]
+
+    # Sayacı COUNTER_REGISTERS[depth] olan sınırlı döngü
+    def loop(self, body_length, depth):
+        rng = self.rng
+        counter = COUNTER_REGISTERS[depth]
+        iterations = rng.randint(1, self.max_iterations)
+        body = self.block(body_length, depth + 1)
+        start = self.label("loop")
+        if rng.random() < 0.5:
+            return ([f"addi {counter}, $zero, {iterations}", f"{start}:"] + body
+                    + [f"addi {counter}, {counter}, -1", f"bne {counter}, $zero, {start}"])
+        end = self.label("end")
+        return ([f"addi {counter}, $zero, {iterations}", f"{start}: beq {counter}, $zero, {end}"] + body
+                + [f"addi {counter}, {counter}, -1", f"j {start}", f"{end}:"])
+
+    def program(self, length):
+        return "\n".join(self.block(length)) + "\n"
+
+
+def generate(seed=0, length=100, mix=None, footprint=256, max_depth=2, max_iterations=8):
+    return ProgramGenerator(seed, mix, footprint, max_depth, max_iterations).program(length)
+
+
+# Kaynağın satırlarını rate olasılığıyla bozar
+def mutate(source, seed=0, rate=0.1):
+    rng = random.Random(seed)
+    lines = source.split("\n")
+    for i, line in enumerate(lines):
+        if not line or rng.random() >= rate:
+            continue
+        label, _, text = line.rpartition(":")
+        parts = text.replace(",", " ").split()
+        if not parts:
+            continue
+        mutation = rng.choice(MUTATIONS)
+        if mutation == "drop":
+            parts = parts[:rng.randrange(len(parts))]
+        elif mutation == "extra":
+            parts.append(rng.choice(["$t0", "4", "x"]))
+        elif mutation == "register":
+            parts[rng.randrange(len(parts))] = rng.choice(["$t10", "$", "t0", "$zero$", "$32"])
+        elif mutation == "immediate":
+            parts[-1] = rng.choice([str(IMM_MAX + 1), str(IMM_MIN - 1), "0x10", "1.5", "-", "(", "4(", "4($t0"])
+        elif mutation == "mnemonic":
+            parts[0] = rng.choice(["muli", "ADD", "lw", "sh", "j", "jr", "jalr", "halt", "syscall", "ll", "sc", "li",
+                                   "blt", ""])
+        else:
+            parts.insert(rng.randrange(len(parts) + 1), rng.choice([",", "#", ":", "()", "$"]))
+        text = " ".join(parts[:1]) + " " + ", ".join(parts[1:])
+        lines[i] = f"{label}: {text}" if label else text
+    return "\n".join(lines)
+
+
+# count program üretip (isteğe bağlı bozup) tüm motorlarda çalıştırır; çöken ve ayrışan programları döndürür
+def fuzz(count, seed=0, length=50, mix=None, footprint=256, max_depth=2, max_iterations=8, rate=0.0,
+         engines=DEFAULT_ENGINES, max_steps=100000):
+    findings = []
+    summary = {"programs": count, "errors": 0, "crashes": 0, "divergences": 0}
+    for i in range(seed, seed + count):
+        source = generate(i, length, mix, footprint, max_depth, max_iterations)
+        if rate:
+            source = mutate(source, i, rate)
+        try:
+            program = assemble(source, max(512, 2 * (source.count("\n") + 1)))  # li iki komuta açılabilir
+            usable = [name for name in engines if name != "words" or not program.errors]
+            result = compare(program, usable, 1000, max_steps, max(512, footprint))
+        except Exception as e:
+            summary["crashes"] += 1
+            findings.append({"seed": i, "kind": "crash", "exception": type(e).__name__, "message": str(e),
+                             "where": traceback.extract_tb(e.__traceback__)[-1][:3], "source": source})
+            continue
+        if result["divergence"] is not None:
+            summary["divergences"] += 1
+            findings.append({"seed": i, "kind": "divergence", "divergence": result["divergence"], "source": source})
+        elif result.get("error"):
+            summary["errors"] += 1  # Programın kendi hatası (beklenen)
+    return {"summary": summary, "findings": findings}
+
+
+# Her uzunluk için üretilen programı her motorla çalıştırıp hızını ölçer (ölçeklenme eğrisi)
+def stress(lengths, engines, seed=0, mix=None, footprint=256, max_depth=2, max_iterations=8, repeat=1):
+    results = []
+    for length in lengths:
+        source = generate(seed, length, mix, footprint, max_depth, max_iterations)
+        start = time.perf_counter()
+        program = assemble(source, 2 * length + 1)
+        assemble_time = time.perf_counter() - start
+        if "words" in engines and program.errors:  # ör. 16 bite sığmayan dallanma uzaklıkları
+            line, message = min(program.errors.items())
+            raise ExecutionError(f"Assemble hatası (satır {line}): {message}")
+        for engine in engines:
+            times = []
+            for _ in range(repeat):
+                machine = new_machine(program, max(512, footprint))
+                start = time.perf_counter()
+                ENGINES[engine](machine)
+                times.append(time.perf_counter() - start)
+            best = min(times)
+            results.append({"length": length, "engine": engine, "assemble_time": assemble_time,
+                            "instructions": machine.steps, "wall_time": best,
+                            "ips": machine.steps / best if best else 0.0})
+    return {"seed": seed, "results": results}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rastgele MIPS programları üretir, fuzz ve stress testi yapar.")
+    parser.add_argument("--seed", type=int, default=0, help="Rastgelelik tohumu (aynı tohum aynı program)")
+    parser.add_argument("--length", type=int, default=100, help="Programdaki komut satırı sayısı")
+    parser.add_argument("--mix", default="", help="Komut karışımı ağırlıkları, ör. alu=4,shift=1,imm=2,muldiv=1,"
+                                                  "mem=2,branch=1,loop=1")
+    parser.add_argument("--footprint", type=int, default=256, help="Load/store'ların kullandığı bellek (byte)")
+    parser.add_argument("--max-depth", type=int, default=2, help="İç içe döngü derinliği (0-3)")
+    parser.add_argument("--max-iterations", type=int, default=8, help="Döngü başına en fazla tur")
+    parser.add_argument("-o", "--output", help="Üretilen programın yazılacağı dosya (varsayılan: standart çıktı)")
+    parser.add_argument("--fuzz", type=int, metavar="N", help="N program üretip tüm motorlarda çalıştır")
+    parser.add_argument("--mutate", type=float, default=0.0, help="Fuzz'da bir satırın bozulma olasılığı")
+    parser.add_argument("--max-steps", type=int, default=100000, help="Fuzz'da program başına en fazla komut")
+    parser.add_argument("--stress", metavar="LENGTHS", help="Virgülle ayrılmış program uzunlukları, ör. 100,1000")
+    parser.add_argument("--engine", action="append", choices=sorted(ENGINES),
+                        help="Kullanılacak motor (tekrarlanabilir); fuzz'da ilki referanstır")
+    parser.add_argument("--repeat", type=int, default=1, help="Stress ölçümlerinin tekrar sayısı (en iyisi)")
+    args = parser.parse_args(argv)
+    if args.fuzz is not None and args.stress:
+        parser.error("--fuzz ve --stress birlikte kullanılamaz")
+    try:
+        mix = parse_mix(args.mix)
+        lengths = [int(value) for value in args.stress.split(",")] if args.stress else []
+        ProgramGenerator(mix=mix, footprint=args.footprint, max_depth=args.max_depth)  # Seçenekleri doğrula
+    except ValueError as e:
+        parser.error(str(e))
+    if args.length < 1 or any(length < 1 for length in lengths):
+        parser.error("Program uzunluğu en az 1 olmalı")
+
+    if args.fuzz is not None:
+        engines = args.engine or DEFAULT_ENGINES
+        report = fuzz(args.fuzz, args.seed, args.length, mix, args.footprint, args.max_depth, args.max_iterations,
+                      args.mutate, engines, args.max_steps)
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return 1 if report["findings"] else 0
+    if lengths:
+        try:
+            report = stress(lengths, args.engine or ["interp", "block", "words"], args.seed, mix, args.footprint,
+                            args.max_depth, args.max_iterations, args.repeat)
+        except ExecutionError as e:
+            print(e, file=sys.stderr)
+            return 1
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return 0
+    source = generate(args.seed, args.length, mix, args.footprint, args.max_depth, args.max_iterations)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(source)
+    else:
+        print(source, end="")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
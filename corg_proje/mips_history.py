@@ -0,0 +1,45 @@
+# Geri adım (Step Back) için çalışma geçmişi.
+# Her interval komutta bir anlık görüntü (Machine.snapshot) alınır. Geri gitmek için hedef adımdan önceki
+# en yakın görüntüye dönülür ve aradaki komutlar yeniden çalıştırılır; çalışma deterministik olduğundan
+# sonuç aynı durumdur. Görüntü sayısı limit'i aşınca her ikinci görüntü atılır ve aralık iki katına çıkar.
+from bisect import bisect_right
+
+
+class History:
+    def __init__(self, machine, interval=1000, limit=64):
+        self.machine = machine
+        self.initial_interval = interval
+        self.limit = limit
+        self.reset()
+
+    # Geçmişi siler ve makinenin şu anki durumunu başlangıç görüntüsü yapar (program yüklenince çağrılır)
+    def reset(self):
+        self.interval = self.initial_interval
+        self.checkpoints = [self.machine.snapshot()]
+        self.steps = [self.checkpoints[0].steps]  # bisect için görüntülerin adım sayıları
+
+    # Son görüntüden bu yana interval komut çalıştıysa yeni görüntü alır
+    def record(self):
+        machine = self.machine
+        if machine.steps - self.steps[-1] < self.interval:  # Geri adımdan sonra da eski görüntüler geçerlidir
+            return
+        self.checkpoints.append(machine.snapshot(self.checkpoints[-1]))
+        self.steps.append(machine.steps)
+        if len(self.checkpoints) > self.limit:
+            self.checkpoints = self.checkpoints[::2]
+            self.steps = self.steps[::2]
+            self.interval *= 2
+
+    # Makineyi steps adımındaki durumuna götürür; mümkün değilse False döner
+    def seek(self, steps):
+        if steps < self.steps[0]:
+            return False
+        index = bisect_right(self.steps, steps) - 1
+        machine = self.machine
+        if not self.steps[index] <= machine.steps <= steps:  # İleri çalıştırmak daha kısa değilse geri dön
+            machine.restore(self.checkpoints[index])
+        machine.run(steps - machine.steps)
+        return machine.steps == steps
+
+    def step_back(self):
+        return self.seek(self.machine.steps - 1)
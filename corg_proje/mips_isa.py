@@ -0,0 +1,316 @@
+# Komut kümesi tablosu (MIPS32 tamsayı alt kümesi).
+# Her komut INSTRUCTIONS tablosunda bir kez tanımlanır: kimliği (OP_*), operand biçimi ve gerçek MIPS32
+# kodlaması (opcode ve R-Type için funct, REGIMM dallanmaları için rt alanı). Kaynak satırlarının çözülmesi
+# (decode_instruction), makine koduna çevirme ve word'lerin çözülmesi (mips_assembler), yorumlayıcının
+# işleyici tablosu (Machine.execute) ve word motorunun opcode/funct tabloları (mips_decoder) bu tablodan kurulur.
+# Sözde komutlar (li, la, move, blt, ...) expand_pseudo ile kaynak satırı aşamasında gerçek komutlara açılır.
+
+# 32 Register tanımı
+register_names = [
+    "$zero", "$at", "$v0", "$v1", "$a0", "$a1", "$a2", "$a3",
+    "$t0", "$t1", "$t2", "$t3", "$t4", "$t5", "$t6", "$t7",
+    "$s0", "$s1", "$s2", "$s3", "$s4", "$s5", "$s6", "$s7",
+    "$t8", "$t9", "$k0", "$k1", "$gp", "$sp", "$fp", "$ra"
+]
+register_index = {name: i for i, name in enumerate(register_names)}  # "$t0" -> 8
+# mult/div sonuçlarının yazıldığı HI/LO, register dizisinin 32 ve 33. elemanlarıdır (operand olarak yazılamaz)
+HI, LO = 32, 33
+REGISTER_COUNT = 34
+RA = register_index["$ra"]
+V0 = register_index["$v0"]
+A0 = register_index["$a0"]
+
+# Çözülmüş komutlarda kullanılan opcode kimlikleri
+(OP_NOP, OP_ADD, OP_SUB, OP_AND, OP_OR, OP_SLT, OP_SLL, OP_SRL, OP_ADDI, OP_SW, OP_LW,
+ OP_BEQ, OP_BNE, OP_J, OP_JAL, OP_JR, OP_HALT, OP_SYSCALL, OP_LL, OP_SC, OP_INVALID,
+ OP_ADDU, OP_SUBU, OP_XOR, OP_NOR, OP_SLTU, OP_MUL, OP_SRA, OP_SLLV, OP_SRLV, OP_SRAV,
+ OP_MULT, OP_MULTU, OP_DIV, OP_DIVU, OP_MFHI, OP_MFLO, OP_MTHI, OP_MTLO, OP_JALR,
+ OP_ADDIU, OP_SLTI, OP_SLTIU, OP_ANDI, OP_ORI, OP_XORI, OP_LUI,
+ OP_LB, OP_LBU, OP_LH, OP_LHU, OP_SB, OP_SH, OP_BLEZ, OP_BGTZ, OP_BLTZ, OP_BGEZ) = range(57)
+OP_COUNT = 57
+
+# Operand biçimleri. Biçim metni aynı zamanda hata mesajlarında ve disassemble'da kullanılır.
+R_FORMAT = "rd, rs, rt"
+SHIFT_FORMAT = "rd, rt, sa"
+SHIFTV_FORMAT = "rd, rt, rs"
+MULDIV_FORMAT = "rs, rt"
+MOVE_FROM_FORMAT = "rd"
+REGISTER_FORMAT = "rs"
+JALR_FORMAT = "rd, rs"
+IMM_FORMAT = "rt, rs, imm"
+UIMM_FORMAT = "rt, rs, uimm"
+LUI_FORMAT = "rt, uimm"
+MEMORY_FORMAT = "rt, offset(rs)"
+BRANCH_FORMAT = "rs, rt, label"
+BRANCHZ_FORMAT = "rs, label"
+JUMP_FORMAT = "label"
+NO_FORMAT = ""
+
+# Biçim -> çözülmüş (op, a, b, c) komutundaki a, b, c alanları (None: kullanılmaz, 0)
+FIELDS = {
+    R_FORMAT: ("rd", "rs", "rt"),
+    SHIFT_FORMAT: ("rd", "rt", "sa"),
+    SHIFTV_FORMAT: ("rd", "rt", "rs"),
+    MULDIV_FORMAT: ("rs", "rt"),
+    MOVE_FROM_FORMAT: ("rd",),
+    REGISTER_FORMAT: ("rs",),
+    JALR_FORMAT: ("rd", "rs"),
+    IMM_FORMAT: ("rt", "rs", "imm"),
+    UIMM_FORMAT: ("rt", "rs", "uimm"),
+    LUI_FORMAT: ("rt", None, "uimm"),
+    MEMORY_FORMAT: ("rt", "rs", "offset"),
+    BRANCH_FORMAT: ("rs", "rt", "label"),
+    BRANCHZ_FORMAT: ("rs", None, "label"),
+    JUMP_FORMAT: ("label",),
+    NO_FORMAT: (),
+}
+# a alanı yalnızca yazılan register olan biçimler: $zero'ya yazan bu komutların etkisi yoktur (nop'a çevrilir)
+PURE_WRITE_FORMATS = {R_FORMAT, SHIFT_FORMAT, SHIFTV_FORMAT, MOVE_FROM_FORMAT, IMM_FORMAT, UIMM_FORMAT, LUI_FORMAT}
+
+SPECIAL, REGIMM, SPECIAL2 = 0x00, 0x01, 0x1C  # funct (ya da REGIMM'de rt) alanıyla ayrılan opcode'lar
+
+# ad -> (op, biçim, opcode, funct). funct SPECIAL/SPECIAL2'de funct alanı, REGIMM'de rt alanıdır.
+# halt simülatöre özgüdür ve break'in kodlamasını kullanır.
+INSTRUCTIONS = {
+    "add": (OP_ADD, R_FORMAT, SPECIAL, 0x20),
+    "addu": (OP_ADDU, R_FORMAT, SPECIAL, 0x21),
+    "sub": (OP_SUB, R_FORMAT, SPECIAL, 0x22),
+    "subu": (OP_SUBU, R_FORMAT, SPECIAL, 0x23),
+    "and": (OP_AND, R_FORMAT, SPECIAL, 0x24),
+    "or": (OP_OR, R_FORMAT, SPECIAL, 0x25),
+    "xor": (OP_XOR, R_FORMAT, SPECIAL, 0x26),
+    "nor": (OP_NOR, R_FORMAT, SPECIAL, 0x27),
+    "slt": (OP_SLT, R_FORMAT, SPECIAL, 0x2A),
+    "sltu": (OP_SLTU, R_FORMAT, SPECIAL, 0x2B),
+    "mul": (OP_MUL, R_FORMAT, SPECIAL2, 0x02),
+    "sll": (OP_SLL, SHIFT_FORMAT, SPECIAL, 0x00),
+    "srl": (OP_SRL, SHIFT_FORMAT, SPECIAL, 0x02),
+    "sra": (OP_SRA, SHIFT_FORMAT, SPECIAL, 0x03),
+    "sllv": (OP_SLLV, SHIFTV_FORMAT, SPECIAL, 0x04),
+    "srlv": (OP_SRLV, SHIFTV_FORMAT, SPECIAL, 0x06),
+    "srav": (OP_SRAV, SHIFTV_FORMAT, SPECIAL, 0x07),
+    "jr": (OP_JR, REGISTER_FORMAT, SPECIAL, 0x08),
+    "jalr": (OP_JALR, JALR_FORMAT, SPECIAL, 0x09),
+    "syscall": (OP_SYSCALL, NO_FORMAT, SPECIAL, 0x0C),
+    "halt": (OP_HALT, NO_FORMAT, SPECIAL, 0x0D),
+    "mfhi": (OP_MFHI, MOVE_FROM_FORMAT, SPECIAL, 0x10),
+    "mthi": (OP_MTHI, REGISTER_FORMAT, SPECIAL, 0x11),
+    "mflo": (OP_MFLO, MOVE_FROM_FORMAT, SPECIAL, 0x12),
+    "mtlo": (OP_MTLO, REGISTER_FORMAT, SPECIAL, 0x13),
+    "mult": (OP_MULT, MULDIV_FORMAT, SPECIAL, 0x18),
+    "multu": (OP_MULTU, MULDIV_FORMAT, SPECIAL, 0x19),
+    "div": (OP_DIV, MULDIV_FORMAT, SPECIAL, 0x1A),
+    "divu": (OP_DIVU, MULDIV_FORMAT, SPECIAL, 0x1B),
+    "bltz": (OP_BLTZ, BRANCHZ_FORMAT, REGIMM, 0x00),
+    "bgez": (OP_BGEZ, BRANCHZ_FORMAT, REGIMM, 0x01),
+    "j": (OP_J, JUMP_FORMAT, 0x02, None),
+    "jal": (OP_JAL, JUMP_FORMAT, 0x03, None),
+    "beq": (OP_BEQ, BRANCH_FORMAT, 0x04, None),
+    "bne": (OP_BNE, BRANCH_FORMAT, 0x05, None),
+    "blez": (OP_BLEZ, BRANCHZ_FORMAT, 0x06, None),
+    "bgtz": (OP_BGTZ, BRANCHZ_FORMAT, 0x07, None),
+    "addi": (OP_ADDI, IMM_FORMAT, 0x08, None),
+    "addiu": (OP_ADDIU, IMM_FORMAT, 0x09, None),
+    "slti": (OP_SLTI, IMM_FORMAT, 0x0A, None),
+    "sltiu": (OP_SLTIU, IMM_FORMAT, 0x0B, None),
+    "andi": (OP_ANDI, UIMM_FORMAT, 0x0C, None),
+    "ori": (OP_ORI, UIMM_FORMAT, 0x0D, None),
+    "xori": (OP_XORI, UIMM_FORMAT, 0x0E, None),
+    "lui": (OP_LUI, LUI_FORMAT, 0x0F, None),
+    "lb": (OP_LB, MEMORY_FORMAT, 0x20, None),
+    "lh": (OP_LH, MEMORY_FORMAT, 0x21, None),
+    "lw": (OP_LW, MEMORY_FORMAT, 0x23, None),
+    "lbu": (OP_LBU, MEMORY_FORMAT, 0x24, None),
+    "lhu": (OP_LHU, MEMORY_FORMAT, 0x25, None),
+    "sb": (OP_SB, MEMORY_FORMAT, 0x28, None),
+    "sh": (OP_SH, MEMORY_FORMAT, 0x29, None),
+    "sw": (OP_SW, MEMORY_FORMAT, 0x2B, None),
+    "ll": (OP_LL, MEMORY_FORMAT, 0x30, None),
+    "sc": (OP_SC, MEMORY_FORMAT, 0x38, None),
+}
+opcode_ids = {name: entry[0] for name, entry in INSTRUCTIONS.items()}  # "add" -> OP_ADD
+op_names = {op: name for name, op in opcode_ids.items()}
+op_names[OP_NOP] = "nop"
+op_formats = {entry[0]: entry[1] for entry in INSTRUCTIONS.values()}
+op_encodings = {entry[0]: (entry[2], entry[3]) for entry in INSTRUCTIONS.values()}
+
+LOAD_OPS = {OP_LB, OP_LBU, OP_LH, OP_LHU, OP_LW, OP_LL}
+STORE_OPS = {OP_SB, OP_SH, OP_SW, OP_SC}
+MEMORY_WIDTHS = {OP_LB: 1, OP_LBU: 1, OP_SB: 1, OP_LH: 2, OP_LHU: 2, OP_SH: 2, OP_LW: 4, OP_SW: 4, OP_LL: 4, OP_SC: 4}
+BRANCH_OPS = {OP_BEQ, OP_BNE, OP_BLEZ, OP_BGTZ, OP_BLTZ, OP_BGEZ}  # Koşullu dallanmalar
+NOP_INSTRUCTION = (OP_NOP, 0, 0, 0)
+
+IMM_MIN, IMM_MAX = -0x8000, 0x7FFF  # İşaretli 16 bitlik immediate ve dallanma uzaklığı aralığı
+UIMM_MAX = 0xFFFF  # andi/ori/xori/lui immediate'ları sıfırla genişletilir
+
+
+# Sayıyı ondalık ya da 0x/0b/0o önekli olarak okur ("010" gibi başında sıfır olanlar ondalıktır)
+def parse_int(text):
+    try:
+        return int(text, 0)
+    except ValueError:
+        return int(text)
+
+
+def _immediate(text, low, high, labels):
+    value = labels[text] if text in labels else parse_int(text)  # la etiketin komut indeksini yükler
+    if not low <= value <= high:
+        raise OverflowError(f"Immediate 16 bite sığmıyor: {value}")
+    return value
+
+
+# Metin halindeki bir komutu (opcode id, a, b, c) biçimine çevirir; alanların sırası FIELDS'dadır.
+# Bulunamayan etiketler -1 hedefi ile çözülür, hata dallanma alındığında verilir.
+def decode_instruction(instruction, labels):
+    parts = instruction.replace(",", " ").split()
+    if not parts:
+        return NOP_INSTRUCTION
+    name, arguments = parts[0], parts[1:]
+    entry = INSTRUCTIONS.get(name)
+    if entry is None:
+        if name in PSEUDO_FORMATS:  # expand_pseudo'nun açamadığı (operandları hatalı) sözde komut
+            return (OP_INVALID, f"Geçersiz {name} komutu (beklenen: {f'{name} {PSEUDO_FORMATS[name]}'.strip()})", 0, 0)
+        return (OP_INVALID, "Geçersiz komut", 0, 0)
+    op, form = entry[0], entry[1]
+    if op == OP_JALR and len(arguments) == 1:
+        arguments = ["$ra"] + arguments  # jalr rs == jalr $ra, rs
+    if len(arguments) != len(form.split(", ")) - (not form):
+        return (OP_INVALID, f"Geçersiz {name} komutu (beklenen: {f'{name} {form}'.strip()})", 0, 0)
+    values = {}
+    try:
+        for kind, text in zip(form.split(", "), arguments):
+            if kind in ("rd", "rs", "rt"):
+                values[kind] = register_index[text]
+            elif kind == "sa":
+                values[kind] = parse_int(text)
+                if not 0 <= values[kind] <= 31:
+                    return (OP_INVALID, f"Kaydırma miktarı 0-31 olmalı: {values[kind]}", 0, 0)
+            elif kind == "imm":
+                values[kind] = _immediate(text, IMM_MIN, IMM_MAX, labels)
+            elif kind == "uimm":
+                values[kind] = _immediate(text, 0, UIMM_MAX, labels)
+            elif kind == "offset(rs)":
+                offset, rs = text.split("(")
+                values["offset"] = _immediate(offset, IMM_MIN, IMM_MAX, labels) if offset else 0
+                values["rs"] = register_index[rs[:-1] if rs.endswith(")") else rs]
+            else:
+                values[kind] = labels.get(text, -1)
+    except (KeyError, IndexError):
+        return (OP_INVALID, "Register hatası", 0, 0)
+    except OverflowError as e:
+        return (OP_INVALID, str(e), 0, 0)
+    except ValueError:
+        return (OP_INVALID, "Geçersiz değer", 0, 0)
+    fields = FIELDS[form]
+    inst = (op,) + tuple(values[field] if field else 0 for field in fields) + (0,) * (3 - len(fields))
+    # $zero donanımsal olarak 0'dır: ona yazan aritmetik/mantık komutlarının etkisi yoktur
+    return NOP_INSTRUCTION if form in PURE_WRITE_FORMATS and inst[1] == 0 else inst
+
+
+# Sonucu a register'ına yazılan biçimler: biçim -> EX'te okunan alanlar (b, c için 1, 2)
+WRITE_FORMATS = {R_FORMAT: (1, 2), SHIFTV_FORMAT: (1, 2), SHIFT_FORMAT: (1,), IMM_FORMAT: (1,), UIMM_FORMAT: (1,),
+                 LUI_FORMAT: ()}
+
+
+# Komutun (EX'te okunan, MEM'de okunan, dallanma aşamasında okunan, hedef register, load mu) bilgisi.
+# HI ve LO birlikte yazılıp okunduğundan bağımlılıklarda tek bir register (HI) olarak izlenir.
+def operands(inst):
+    op, a, b, c = inst
+    form = op_formats.get(op)
+    if form in WRITE_FORMATS:
+        return tuple(inst[1 + i] for i in WRITE_FORMATS[form]), (), (), a, False
+    elif op in LOAD_OPS:
+        return (b,), (), (), a, True
+    elif op == OP_SC:
+        return (b,), (a,), (), a, False  # Başarı bayrağı aynı register'a yazılır
+    elif op in STORE_OPS:
+        return (b,), (a,), (), 0, False  # Saklanacak veri MEM aşamasında gerekir
+    elif form == MULDIV_FORMAT:
+        return (a, b), (), (), HI, False
+    elif form == MOVE_FROM_FORMAT:
+        return (HI,), (), (), a, False
+    elif form == BRANCH_FORMAT:
+        return (), (), (a, b), 0, False
+    elif form == BRANCHZ_FORMAT:
+        return (), (), (a,), 0, False
+    elif op == OP_JR:
+        return (), (), (a,), 0, False
+    elif form == REGISTER_FORMAT:
+        return (a,), (), (), HI, False  # mthi, mtlo
+    elif form == JALR_FORMAT:
+        return (), (), (b,), a, False
+    elif op == OP_JAL:
+        return (), (), (), RA, False
+    elif op == OP_SYSCALL:
+        return (V0, A0), (), (), V0, False  # read int ve sbrk sonucu $v0'a yazar
+    return (), (), (), 0, False  # nop, j, halt
+
+
+# Satırın başvurduğu etiket: dallanma/atlama hedefi ya da _immediate'in etiket olarak çözdüğü immediate veya
+# bellek offset'i (ör. la, "ori $t0, $zero, x", "lw $t1, x($zero)"); yoksa None
+def label_reference(line):
+    parts = line.replace(",", " ").split()
+    entry = INSTRUCTIONS.get(parts[0]) if parts else None
+    if entry is None or len(parts) < 2:
+        return None
+    if entry[1] in (BRANCH_FORMAT, BRANCHZ_FORMAT, JUMP_FORMAT):
+        return parts[-1]
+    if entry[1] in (IMM_FORMAT, UIMM_FORMAT, LUI_FORMAT):
+        text = parts[-1]
+    elif entry[1] == MEMORY_FORMAT:
+        text = parts[-1].split("(")[0]
+    else:
+        return None
+    try:
+        parse_int(text)
+    except ValueError:
+        return text or None
+    return None
+
+
+def _pseudo_li(rt, value):
+    value = parse_int(value)
+    if IMM_MIN <= value <= IMM_MAX:
+        return [f"addiu {rt}, $zero, {value}"]
+    if 0 <= value <= UIMM_MAX:
+        return [f"ori {rt}, $zero, {value}"]
+    if not -0x80000000 <= value <= 0xFFFFFFFF:
+        raise ValueError(value)
+    value &= 0xFFFFFFFF
+    if value & 0xFFFF == 0:
+        return [f"lui {rt}, {value >> 16}"]
+    return [f"lui $at, {value >> 16}", f"ori {rt}, $at, {value & 0xFFFF}"]
+
+
+# Sözde komut -> (biçim, operandlardan gerçek komut satırlarını üreten fonksiyon)
+PSEUDO = {
+    "nop": ("", lambda: ["sll $zero, $zero, 0"]),
+    "move": ("rd, rs", lambda rd, rs: [f"addu {rd}, {rs}, $zero"]),
+    "li": ("rt, value", _pseudo_li),
+    "la": ("rt, label", lambda rt, label: [f"addiu {rt}, $zero, {label}"]),
+    "not": ("rd, rs", lambda rd, rs: [f"nor {rd}, {rs}, $zero"]),
+    "neg": ("rd, rs", lambda rd, rs: [f"sub {rd}, $zero, {rs}"]),
+    "b": ("label", lambda label: [f"beq $zero, $zero, {label}"]),
+    "beqz": ("rs, label", lambda rs, label: [f"beq {rs}, $zero, {label}"]),
+    "bnez": ("rs, label", lambda rs, label: [f"bne {rs}, $zero, {label}"]),
+    "blt": ("rs, rt, label", lambda rs, rt, label: [f"slt $at, {rs}, {rt}", f"bne $at, $zero, {label}"]),
+    "bge": ("rs, rt, label", lambda rs, rt, label: [f"slt $at, {rs}, {rt}", f"beq $at, $zero, {label}"]),
+    "bgt": ("rs, rt, label", lambda rs, rt, label: [f"slt $at, {rt}, {rs}", f"bne $at, $zero, {label}"]),
+    "ble": ("rs, rt, label", lambda rs, rt, label: [f"slt $at, {rt}, {rs}", f"beq $at, $zero, {label}"]),
+}
+PSEUDO_FORMATS = {name: form for name, (form, _) in PSEUDO.items()}
+
+
+# Etiketsiz ve yorumsuz bir komut metni sözde komutsa açılımını (gerçek komut satırları), değilse ya da
+# operandları hatalıysa None döndürür. Hatalı sözde komutlar decode_instruction'da hata olarak çözülür.
+def expand_pseudo(text):
+    parts = text.replace(",", " ").split()
+    if not parts or parts[0] not in PSEUDO:
+        return None
+    form, expand = PSEUDO[parts[0]]
+    if len(parts) - 1 != len(form.split(", ")) - (not form):
+        return None
+    try:
+        return expand(*parts[1:])
+    except ValueError:
+        return None
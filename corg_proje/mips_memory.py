@@ -0,0 +1,183 @@
+# Tüm 32 bitlik adres alanını kapsayan seyrek (sayfalı) veri belleği.
+# 4 KiB'lık sayfalar ilk yazmada ayrılır; hiç yazılmamış adresler 0 okunur ve yer kaplamaz.
+# Arayüz mips_core.Memory ile aynıdır, Machine(memory=PagedMemory()) şeklinde kullanılır.
+import hashlib
+import struct
+import sys
+
+from mips_core import ExecutionError
+
+PAGE_BITS = 12
+PAGE_SIZE = 1 << PAGE_BITS  # 4 KiB
+PAGE_OFFSET_MASK = PAGE_SIZE - 1
+
+# Standart MIPS (SPIM) segment yerleşimi
+TEXT_BASE = 0x00400000
+DATA_BASE = 0x10000000
+GP_ADDRESS = 0x10008000
+HEAP_BASE = 0x10040000
+STACK_TOP = 0x7FFFEFFC  # $sp'nin başlangıç değeri; yığın aşağı doğru büyür
+KERNEL_BASE = 0x80000000
+
+SEGMENTS = [
+    (KERNEL_BASE, "kernel"),
+    (HEAP_BASE, "heap/stack"),
+    (DATA_BASE, "data"),
+    (TEXT_BASE, "text"),
+    (0, "reserved"),
+]
+
+
+# Adresin hangi segmentte olduğunu döndürür
+def segment_name(address):
+    for base, name in SEGMENTS:
+        if address >= base:
+            return name
+
+
+class PagedMemory:
+    # Machine bu register'ları başlangıçta ve reset'te ayarlar
+    initial_registers = {"$gp": GP_ADDRESS, "$sp": STACK_TOP}
+    heap_start = HEAP_BASE  # sbrk ile ayrılan heap buradan yukarı, yığın STACK_TOP'tan aşağı büyür
+    heap_limit = STACK_TOP
+
+    def __init__(self, byteorder="little"):
+        self.byteorder = byteorder
+        self.size = 1 << 32
+        self.pages = {}  # sayfa numarası -> bytearray(PAGE_SIZE)
+        self.native = byteorder == sys.byteorder
+        self.word_struct = struct.Struct("<I" if byteorder == "little" else ">I")
+        # Son kullanılan sayfanın önbelleği: ardışık erişimler sözlüğe bakmadan sonuçlanır
+        self.last_number = -1
+        self.last_page = None
+        self.last_words = None
+        # Son anlık görüntüden (snapshot_base) beri yazılan sayfalar; snapshot_pages yalnızca bunları kopyalar
+        self.dirty = set()
+        self.snapshot_base = None
+
+    def __len__(self):
+        return self.size
+
+    # Ayrılmış sayfaların kapladığı toplam byte
+    @property
+    def resident_bytes(self):
+        return len(self.pages) * PAGE_SIZE
+
+    # Sayfayı önbelleğe alır; create False ise ve sayfa yoksa False döner
+    def select(self, number, create):
+        page = self.pages.get(number)
+        if page is None:
+            if not create:
+                return False
+            page = self.pages[number] = bytearray(PAGE_SIZE)
+        self.last_number = number
+        self.last_page = page
+        self.last_words = memoryview(page).cast("I") if self.native else None
+        return True
+
+    def check(self, address, width):
+        if not 0 <= address <= self.size - width:
+            raise ExecutionError(f"Geçersiz bellek adresi: {address}")
+        if address % width:
+            raise ExecutionError(f"Hizalanmamış bellek adresi: {address}")
+
+    def load_word(self, address):
+        if address & 3 or address >= self.size:
+            self.check(address, 4)
+        number = address >> PAGE_BITS
+        if number != self.last_number and not self.select(number, False):
+            return 0  # Hiç yazılmamış sayfa
+        if self.last_words is not None:
+            return self.last_words[(address & PAGE_OFFSET_MASK) >> 2]
+        return self.word_struct.unpack_from(self.last_page, address & PAGE_OFFSET_MASK)[0]
+
+    def store_word(self, address, value):
+        if address & 3 or address >= self.size:
+            self.check(address, 4)
+        number = address >> PAGE_BITS
+        self.dirty.add(number)
+        if number != self.last_number:
+            self.select(number, True)
+        if self.last_words is not None:
+            self.last_words[(address & PAGE_OFFSET_MASK) >> 2] = value
+        else:
+            self.word_struct.pack_into(self.last_page, address & PAGE_OFFSET_MASK, value)
+
+    def load_byte(self, address):
+        self.check(address, 1)
+        number = address >> PAGE_BITS
+        if number != self.last_number and not self.select(number, False):
+            return 0
+        return self.last_page[address & PAGE_OFFSET_MASK]
+
+    def store_byte(self, address, value):
+        self.check(address, 1)
+        number = address >> PAGE_BITS
+        self.dirty.add(number)
+        if number != self.last_number:
+            self.select(number, True)
+        self.last_page[address & PAGE_OFFSET_MASK] = value & 0xFF
+
+    def clear(self):
+        self.pages = {}
+        self.last_number = -1
+        self.last_page = None
+        self.last_words = None
+        self.snapshot_base = None
+
+    # Ekranlar için byte'ları yan etkisiz okur; ayrılmamış sayfalar 0 okunur
+    def read(self, address, length):
+        result = bytearray(length)
+        end = address + length
+        while address < end:
+            page = self.pages.get(address >> PAGE_BITS)
+            offset = address & PAGE_OFFSET_MASK
+            count = min(PAGE_SIZE - offset, end - address)
+            if page is not None:
+                start = length - (end - address)
+                result[start:start + count] = page[offset:offset + count]
+            address += count
+        return bytes(result)
+
+    # Bellek içeriğinin kısa özeti; tamamen sıfır olan sayfalar hiç ayrılmamış sayılır
+    def digest(self):
+        h = hashlib.blake2b(digest_size=16)
+        empty = bytes(PAGE_SIZE)
+        for number in sorted(self.pages):
+            page = self.pages[number]
+            if page != empty:
+                h.update(number.to_bytes(4, "little"))
+                h.update(page)
+        return h.digest()
+
+    # Ayrılmış sayfaları kopyalar; previous'taki aynı içerikli sayfalar paylaşılır. previous bu belleğin son
+    # görüntüsüyse yazılmamış sayfalar karşılaştırılmadan ondan alınır (bkz. Memory.snapshot_pages).
+    def snapshot_pages(self, previous=None):
+        incremental = previous is not None and previous is self.snapshot_base
+        pages = {}
+        for number, page in self.pages.items():
+            old = previous.get(number) if previous else None
+            if incremental and old is not None and number not in self.dirty:
+                pages[number] = old
+                continue
+            page = bytes(page)
+            pages[number] = old if old == page else page
+        self.dirty = set()
+        self.snapshot_base = pages
+        return pages
+
+    # Görüntüde olmayan sayfalar görüntü alındığında henüz ayrılmamıştı, bu yüzden atılır
+    def restore_pages(self, pages):
+        self.clear()
+        self.pages = {number: bytearray(page) for number, page in pages.items()}
+        self.dirty = set()
+        self.snapshot_base = pages
+
+    # Sıfır olmayan word'leri (adres, değer) olarak adres sırasıyla verir
+    def nonzero_words(self):
+        for number in sorted(self.pages):
+            base = number << PAGE_BITS
+            page = self.pages[number]
+            for offset in range(0, PAGE_SIZE, 4):
+                if page[offset:offset + 4] != b"\0\0\0\0":
+                    yield base + offset, self.word_struct.unpack_from(page, offset)[0]
@@ -0,0 +1,352 @@
+# Çok çekirdekli (multi-hart) simülasyon.
+# Her hart kendi register'ları, pc'si ve adım sayacı olan bir Machine'dir; hepsi aynı programı çalıştırır ve aynı
+# veri belleğini, konsolu ve heap'i paylaşır. Başlangıçta $a0 = hart numarası, $a1 = hart sayısıdır ve her hart
+# kendi yığınıyla ($sp) başlar (bkz. set_hart_registers).
+# Zamanlayıcı deterministiktir: bitmemiş hart'lar sırayla quantum komut çalıştırır (quantum=1: komut komut).
+# ll/sc rezervasyonlarını LinkedMemory izler; rezerve edilmiş word'e herhangi bir hart yazarsa sc başarısız olur.
+# processes=True ile her hart ayrı bir işletim sistemi sürecinde, multiprocessing.shared_memory üzerinde kurulan
+# ortak düz bellekle çalışır. Bu kipte sıralama deterministik değildir, sc bir kilit altında değeri karşılaştırarak
+# yazar, heap hart'lar arasında bölünür ve --max-steps her hart için ayrı sayılır.
+# Kullanım: python mips_multicore.py kernel.asm --harts 4 [--quantum 100] [--processes] [--scaling]
+import argparse
+import json
+import multiprocessing
+import sys
+import time
+from multiprocessing import shared_memory
+
+from mips_cli import ENGINES, read_program
+from mips_core import (A0, HI, LO, Console, ExecutionError, Machine, Memory, decode_instruction, parse_source,
+                       register_index, register_names, to_signed)
+from mips_memory import PagedMemory
+
+A1 = register_index["$a1"]
+SP = register_index["$sp"]
+QUANTUM = 100  # Bir hart'ın sırası gelince çalıştırdığı komut sayısı
+HART_STACK_SIZE = 0x10000  # Hart'ların yığınları arasındaki en büyük uzaklık (sayfalı bellekte hep bu kadar)
+
+
+# Tek süreçte paylaşılan bellek: ll ile rezerve edilmiş word'lere rezervasyon belirteci verir. Rezerve word'e ya da
+# byte'larına yazılınca kaydı silinir, böylece sözlük yalnızca henüz yazılmamış rezervasyonları tutar. Belirteçler
+# ortak yazma sayacından alındığından silinip yeniden açılan kayıt eski belirteçlerle eşleşmez ve sc, ll'den beri
+# araya hiçbir hart o word'e yazmadıysa başarılıdır. Okumalar doğrudan alttaki belleğe gider.
+class LinkedMemory:
+    def __init__(self, memory):
+        self.memory = memory
+        self.versions = {}  # ll ile rezerve edilmiş word adresi -> belirteç
+        self.writes = 0  # Rezerve word'lere yapılan yazma sayısı
+        self.load_word = memory.load_word
+        self.load_byte = memory.load_byte
+
+    def __getattr__(self, name):
+        return getattr(self.memory, name)
+
+    def __len__(self):
+        return len(self.memory)
+
+    def store_word(self, address, value):
+        if address in self.versions:
+            del self.versions[address]
+            self.writes += 1
+        self.memory.store_word(address, value)
+
+    def store_byte(self, address, value):
+        if address & ~3 in self.versions:
+            del self.versions[address & ~3]
+            self.writes += 1
+        self.memory.store_byte(address, value)
+
+    def load_linked(self, address):
+        value = self.memory.load_word(address)
+        return value, self.versions.setdefault(address, self.writes)
+
+    def store_conditional(self, address, value, token):
+        if self.versions.get(address) != token:
+            return False
+        self.store_word(address, value)
+        return True
+
+
+# Süreç kipinde bir hart'ın belleği: ortak tampon üzerindeki düz bellek ve hart'a düşen heap dilimi.
+# Süreçler arası sayaç tutulamadığından sc, kilit altında word hâlâ ll'de okunan değerdeyse yazar.
+class LockedMemory:
+    def __init__(self, memory, lock, heap_start, heap_limit):
+        self.memory = memory
+        self.lock = lock
+        self.heap_start = heap_start
+        self.heap_limit = heap_limit
+        self.load_word = memory.load_word
+        self.store_word = memory.store_word
+        self.load_byte = memory.load_byte
+        self.store_byte = memory.store_byte
+
+    def __getattr__(self, name):
+        return getattr(self.memory, name)
+
+    def __len__(self):
+        return len(self.memory)
+
+    def load_linked(self, address):
+        value = self.memory.load_word(address)
+        return value, value
+
+    def store_conditional(self, address, value, token):
+        with self.lock:
+            if self.memory.load_word(address) != token:
+                return False
+            self.memory.store_word(address, value)
+            return True
+
+
+# Hart'ın numarasını, hart sayısını ve kendi yığınını register'lara yazar. Sayfalı bellekte yığınlar STACK_TOP'tan
+# HART_STACK_SIZE aralıkla, düz bellekte belleğin sonundan son çeyreği hart'lar arasında bölerek aşağı dizilir.
+def set_hart_registers(hart, number, harts):
+    hart.registers[A0] = number
+    hart.registers[A1] = harts
+    memory = hart.memory
+    if "$sp" in memory.initial_registers:
+        top, stack_size = memory.initial_registers["$sp"], HART_STACK_SIZE
+    else:
+        top, stack_size = len(memory) - 4, min(HART_STACK_SIZE, len(memory) // 4 // harts & ~7)
+    hart.registers[SP] = top - number * stack_size
+
+
+def hart_state(hart):
+    return {
+        "registers": dict({name: to_signed(value) for name, value in zip(register_names, hart.registers)},
+                          hi=to_signed(hart.registers[HI]), lo=to_signed(hart.registers[LO])),
+        "pc": hart.pc,
+        "steps": hart.steps,
+    }
+
+
+class MultiCore:
+    def __init__(self, harts=2, memory=None, quantum=QUANTUM, console=None):
+        if harts < 1 or quantum < 1:
+            raise ValueError("Hart sayısı ve quantum en az 1 olmalı")
+        self.memory = LinkedMemory(memory if memory is not None else Memory())
+        self.console = console if console is not None else Console()
+        self.quantum = quantum
+        self.harts = [Machine(memory=self.memory, console=self.console) for _ in range(harts)]
+        self.heap = self.memory.heap_start  # Ortak heap; sırası gelen hart'a verilip geri alınır
+        self.switches = 0  # Zamanlayıcının hart değiştirme sayısı
+
+    def load(self, source):
+        lines, labels = parse_source(source, len(self.harts[0].instruction_memory))
+        self.load_program(lines, labels)
+
+    # Program bir kez çözülür ve tüm hart'lara aynı listelerle yüklenir
+    def load_program(self, lines, labels, decoded=None, words=None):
+        if decoded is None:
+            decoded = [decode_instruction(line, labels) for line in lines]
+        for number, hart in enumerate(self.harts):
+            hart.load_program(lines, labels, decoded, words)
+            set_hart_registers(hart, number, len(self.harts))
+        self.heap = self.memory.heap_start
+        self.switches = 0
+
+    @property
+    def finished(self):
+        return all(hart.finished for hart in self.harts)
+
+    # Round-robin zamanlayıcı: her bitmemiş hart engine ile en fazla quantum komut çalıştırır.
+    # max_steps tüm hart'ların toplam komut sayısıdır; çalışan toplam komut sayısını döndürür.
+    def run(self, max_steps=None, engine=Machine.run):
+        limit = -1 if max_steps is None else max_steps
+        count = 0
+        while count != limit and not self.finished:
+            for number, hart in enumerate(self.harts):
+                if hart.finished:
+                    continue
+                quantum = self.quantum if limit < 0 else min(self.quantum, limit - count)
+                if quantum == 0:
+                    break
+                hart.heap = self.heap
+                try:
+                    count += engine(hart, quantum)
+                except ExecutionError as e:
+                    raise ExecutionError(f"Hart {number}: {e}") from None
+                finally:
+                    self.heap = hart.heap
+                self.switches += 1
+        return count
+
+    # cycles: en çok komut çalıştıran hart'ın komut sayısı (her hart çevrim başına bir komut çalıştırsaydı)
+    def state(self):
+        steps = [hart.steps for hart in self.harts]
+        return {
+            "harts": [hart_state(hart) for hart in self.harts],
+            "memory": {str(address): to_signed(value) for address, value in self.memory.nonzero_words()},
+            "output": self.console.text(),
+            "steps": sum(steps),
+            "cycles": max(steps),
+            "switches": self.switches,
+        }
+
+
+# Süreç kipinde bir hart'ı ortak tampon üzerinde çalıştırır. Bellek görünümleri bu fonksiyondan çıkınca
+# serbest kalır; paylaşılan bellek ancak ondan sonra kapatılabilir.
+def _run_hart(buffer, size, byteorder, program, number, harts, max_steps, engine, input_text, lock):
+    memory = Memory(size, byteorder, buffer[:size])
+    span = (memory.heap_limit - memory.heap_start) // harts & ~7
+    start = memory.heap_start + number * span
+    machine = Machine(memory=LockedMemory(memory, lock, start, start + span), console=Console(input_text))
+    machine.load_program(*program)
+    set_hart_registers(machine, number, harts)
+    result = {"error": None}
+    begin = time.perf_counter()
+    try:
+        ENGINES[engine](machine, max_steps)
+        if not machine.finished:
+            result["error"] = f"Hart {number}: Komut sınırına ulaşıldı: {max_steps}"
+    except ExecutionError as e:
+        result["error"] = f"Hart {number}: {e}"
+    result["wall_time"] = time.perf_counter() - begin
+    result.update(hart_state(machine))
+    result["output"] = machine.console.text()
+    return result
+
+
+def _hart_process(name, size, byteorder, program, number, harts, max_steps, engine, input_text, lock, results):
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        result = _run_hart(shm.buf, size, byteorder, program, number, harts, max_steps, engine, input_text, lock)
+    finally:
+        shm.close()
+    results.put((number, result))
+
+
+# Her hart'ı ayrı bir süreçte, memory_size byte'lık ortak bellek üzerinde çalıştırır
+def run_processes(program, harts, memory_size=4096, byteorder="little", max_steps=None, engine="interp",
+                  input_text=""):
+    if memory_size % 4:
+        raise ValueError("Bellek boyutu 4'ün katı olmalı")
+    program = (program.lines, program.labels, program.decoded, program.words)
+    shm = shared_memory.SharedMemory(create=True, size=memory_size)
+    try:
+        shm.buf[:memory_size] = bytes(memory_size)
+        lock = multiprocessing.Lock()
+        results = multiprocessing.Queue()
+        workers = [multiprocessing.Process(target=_hart_process, args=(
+            shm.name, memory_size, byteorder, program, number, harts, max_steps, engine, input_text, lock, results))
+            for number in range(harts)]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        finished = dict(results.get() for _ in workers)
+        for worker in workers:
+            worker.join()
+        wall_time = time.perf_counter() - start
+        memory = Memory(memory_size, byteorder)
+        memory.data[:] = shm.buf[:memory_size]
+    finally:
+        shm.close()
+        shm.unlink()
+    hart_results = [finished[number] for number in range(harts)]
+    steps = [result["steps"] for result in hart_results]
+    errors = [result["error"] for result in hart_results if result["error"]]
+    return {
+        "error": errors[0] if errors else None,
+        "harts": hart_results,
+        "memory": {str(address): to_signed(value) for address, value in memory.nonzero_words()},
+        "output": "".join(result["output"] for result in hart_results),
+        "steps": sum(steps),
+        "cycles": max(steps),
+        "wall_time": wall_time,
+    }
+
+
+# Programı hart'larla çalıştırır (tek süreçte zamanlayıcıyla ya da süreç kipinde) ve sonucu sözlük olarak döndürür
+def run_file(path, harts=2, quantum=QUANTUM, engine="interp", memory_size=4096, byteorder="little", paged=False,
+             max_steps=None, input_text="", processes=False):
+    result = {"file": path, "error": None}
+    memory = PagedMemory(byteorder) if paged else Memory(memory_size, byteorder)
+    system = MultiCore(harts, memory, quantum, Console(input_text))
+    start = time.perf_counter()
+    try:
+        program = read_program(path, len(system.harts[0].instruction_memory), engine)
+        if processes:
+            result.update(run_processes(program, harts, memory_size, byteorder, max_steps, engine, input_text))
+            return result
+        system.load_program(program.lines, program.labels, program.decoded, program.words)
+        system.console.set_input(input_text)
+        system.run(max_steps, ENGINES[engine])
+        if not system.finished:
+            result["error"] = f"Komut sınırına ulaşıldı: {max_steps}"
+    except (ExecutionError, OSError, ValueError) as e:
+        result["error"] = str(e)
+    result["wall_time"] = time.perf_counter() - start
+    result.update(system.state())
+    return result
+
+
+# 1, 2, 4, ... max_harts hart ile çalıştırıp ölçeklenmeyi raporlar. speedup simüle çevrimlere (cycles),
+# wall_speedup gerçek süreye göredir; ikincisi ancak süreç kipinde anlamlıdır.
+def scaling(path, max_harts, **options):
+    rows = []
+    harts = 1
+    while True:
+        result = run_file(path, harts, **options)
+        if result["error"]:
+            raise ExecutionError(f"{harts} hart: {result['error']}")
+        rows.append({"harts": harts, "steps": result["steps"], "cycles": result["cycles"],
+                     "wall_time": result["wall_time"]})
+        if harts >= max_harts:
+            break
+        harts = min(harts * 2, max_harts)
+    base = rows[0]
+    for row in rows:
+        row["speedup"] = base["cycles"] / row["cycles"] if row["cycles"] else 0.0
+        row["efficiency"] = row["speedup"] / row["harts"]
+        row["wall_speedup"] = base["wall_time"] / row["wall_time"] if row["wall_time"] else 0.0
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Bir MIPS programını paylaşılan bellekli birden çok hart ile çalıştırır.")
+    parser.add_argument("file", help="Çalıştırılacak .asm ya da .bin dosyası")
+    parser.add_argument("--harts", type=int, default=2, help="Hart sayısı ($a0 = hart numarası, $a1 = hart sayısı)")
+    parser.add_argument("--quantum", type=int, default=QUANTUM, help="Hart değiştirmeden önce çalışan komut sayısı")
+    parser.add_argument("--engine", choices=sorted(ENGINES), default="interp", help="Çalıştırma motoru")
+    parser.add_argument("--max-steps", type=int, default=None,
+                        help="En fazla komut sayısı (toplam; --processes ile hart başına)")
+    parser.add_argument("--memory-size", type=int, default=4096, help="Ortak veri belleği boyutu (byte)")
+    parser.add_argument("--big-endian", action="store_true", help="Word'leri big-endian sırayla sakla")
+    parser.add_argument("--paged", action="store_true", help="Sayfalı 32 bit bellek kullan (--processes ile olmaz)")
+    parser.add_argument("--input", metavar="PATH", help="read int syscall'larının okuyacağı girdi dosyası")
+    parser.add_argument("--processes", action="store_true",
+                        help="Her hart'ı ayrı bir süreçte, paylaşılan bellek üzerinde çalıştır")
+    parser.add_argument("--scaling", action="store_true",
+                        help="1, 2, 4, ... --harts hart ile çalıştırıp hızlanmayı raporla")
+    args = parser.parse_args(argv)
+    if args.harts < 1 or args.quantum < 1:
+        parser.error("--harts ve --quantum en az 1 olmalı")
+    if args.paged and args.processes:
+        parser.error("--paged ve --processes birlikte kullanılamaz")
+    input_text = ""
+    if args.input:
+        try:
+            with open(args.input, encoding="utf-8") as f:
+                input_text = f.read()
+        except OSError as e:
+            parser.error(str(e))
+
+    options = {"quantum": args.quantum, "engine": args.engine, "memory_size": args.memory_size,
+               "byteorder": "big" if args.big_endian else "little", "paged": args.paged,
+               "max_steps": args.max_steps, "input_text": input_text, "processes": args.processes}
+    if args.scaling:
+        try:
+            report = scaling(args.file, args.harts, **options)
+        except ExecutionError as e:
+            print(e, file=sys.stderr)
+            return 1
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return 0
+    result = run_file(args.file, args.harts, **options)
+    print(json.dumps(result, ensure_ascii=False))
+    return 1 if result["error"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+# Klasik 5 aşamalı (IF/ID/EX/MEM/WB) pipeline için zamanlama modeli.
+# Komutların anlamı Machine'de çalıştırılır; model yalnızca çalışan komut akışını izleyerek her komutun
+# ID aşamasına hangi çevrimde girdiğini hesaplar. Forwarding, load-use bekletmeleri ve alınan
+# dallanmalardaki flush cezaları modellenir (dallanmaların alınmadığı varsayılarak komut getirilir).
+from mips_isa import BRANCH_OPS, OP_J, OP_JAL, OP_JALR, OP_JR, operands
+
+PIPELINE_DEPTH = 5
+
+
+class PipelineModel:
+    def __init__(self, forwarding=True, branch_in_id=False):
+        self.forwarding = forwarding
+        # Dallanmalar (ve jr) ID'de mi çözülür? Değilse EX'te çözülür.
+        self.branch_in_id = branch_in_id
+        self.reset()
+
+    def reset(self):
+        self.instructions = 0
+        self.last_id_cycle = 0
+        self.next_id_cycle = 2  # İlk komut 1. çevrimde IF, 2. çevrimde ID
+        # register -> tüketici komutun en erken ID çevrimi (EX'te / ID'de okuyan tüketici için)
+        self.ready_for_ex = {}
+        self.ready_for_id = {}
+        self.producer_is_load = {}
+        self.load_use_stalls = 0
+        self.data_stalls = 0
+        self.branch_data_stalls = 0
+        self.flush_cycles = 0
+        self.per_pc = {}  # pc -> [çalışma sayısı, bekleme çevrimi, flush çevrimi]
+
+    # Çalışan bir komutu modele bildirir; next_pc komut sonrası pc'dir (alınan dallanmaları anlamak için)
+    def observe(self, pc, inst, next_pc):
+        op = inst[0]
+        ex_sources, mem_sources, branch_sources, dest, is_load = operands(inst)
+        if not self.branch_in_id:
+            ex_sources, branch_sources = ex_sources + branch_sources, ()  # Karşılaştırma EX'te yapılır
+        earliest = self.next_id_cycle
+        cycle = earliest
+        load_use = False
+        for reg in ex_sources:
+            ready = self.ready_for_ex.get(reg, 0)
+            if ready > cycle:
+                cycle = ready
+                load_use = load_use or self.producer_is_load.get(reg, False)
+        for reg in mem_sources:
+            # Forwarding varken MEM'de gereken veri bir çevrim geç hazır olabilir
+            cycle = max(cycle, self.ready_for_ex.get(reg, 0) - (1 if self.forwarding else 0))
+        branch_cycle = cycle
+        for reg in branch_sources:
+            branch_cycle = max(branch_cycle, self.ready_for_id.get(reg, 0))
+
+        stalls = branch_cycle - earliest
+        if branch_cycle > cycle:
+            self.branch_data_stalls += branch_cycle - cycle
+        if cycle > earliest:
+            if load_use and self.forwarding:
+                self.load_use_stalls += cycle - earliest
+            else:
+                self.data_stalls += cycle - earliest
+        cycle = branch_cycle
+
+        # Sonuçların tüketicilere ne zaman hazır olacağı
+        if dest:
+            if not self.forwarding:
+                ready_ex = ready_id = cycle + 3  # WB'de yazılır, aynı çevrimde ID'de okunur
+            elif is_load:
+                ready_ex, ready_id = cycle + 2, cycle + 3  # MEM sonrası forward
+            else:
+                ready_ex, ready_id = cycle + 1, cycle + 2  # EX sonrası forward
+            self.ready_for_ex[dest] = ready_ex
+            self.ready_for_id[dest] = ready_id
+            self.producer_is_load[dest] = is_load
+
+        # Kontrol akışı: yanlış getirilen komutlar flush edilir
+        flush = 0
+        if op in (OP_J, OP_JAL):
+            flush = 1  # ID'de çözülür
+        elif op == OP_JR or op == OP_JALR or (op in BRANCH_OPS and next_pc != pc + 1):
+            flush = 1 if self.branch_in_id else 2
+        self.flush_cycles += flush
+
+        self.instructions += 1
+        self.last_id_cycle = cycle
+        self.next_id_cycle = cycle + 1 + flush
+        entry = self.per_pc.get(pc)
+        if entry is None:
+            entry = self.per_pc[pc] = [0, 0, 0]
+        entry[0] += 1
+        entry[1] += stalls
+        entry[2] += flush
+
+    @property
+    def cycles(self):
+        if not self.instructions:
+            return 0
+        return self.last_id_cycle + PIPELINE_DEPTH - 2  # Son komutun WB çevrimi
+
+    def report(self, instruction_memory=None):
+        cycles = self.cycles
+        per_instruction = []
+        for pc, (count, stalls, flush) in sorted(self.per_pc.items()):
+            entry = {"pc": pc, "count": count, "stall_cycles": stalls, "flush_cycles": flush}
+            if instruction_memory is not None:
+                entry["instruction"] = instruction_memory[pc]
+            per_instruction.append(entry)
+        return {
+            "cycles": cycles,
+            "instructions": self.instructions,
+            "cpi": cycles / self.instructions if self.instructions else 0.0,
+            "stalls": {
+                "load_use": self.load_use_stalls,
+                "data": self.data_stalls,
+                "branch_data": self.branch_data_stalls,
+                "control_flush": self.flush_cycles,
+            },
+            "per_instruction": per_instruction,
+        }
+
+
+# Programı komut komut çalıştırıp her komutu modele bildirir; çalışan komut sayısını döndürür
+def run_timed(machine, model, max_steps=None):
+    program = machine.decoded_program
+    limit = -1 if max_steps is None else max_steps
+    count = 0
+    while count != limit and not machine.finished:
+        pc = machine.pc
+        inst = program[pc]
+        machine.step()
+        model.observe(pc, inst, machine.pc)
+        count += 1
+    return count
@@ -0,0 +1,128 @@
+# İsteğe bağlı profil çıkarma katmanı.
+# run_profiled programı komut komut çalıştırıp her komutu Profiler'a bildirir: pc başına çalışma sayıları,
+# koşullu dallanmalar için alınan/alınmayan dallanmalar, adres aralıklarına göre load/store sayıları ve jal/jalr/jr
+# çağrı kenarlarından oluşan çağrı yığınları tutulur. Motorların (Machine.run, run_blocks, run_words)
+# döngülerine dokunulmaz; profil açılmadığında hiçbir ek maliyet yoktur.
+from mips_core import MASK, RA
+from mips_isa import BRANCH_OPS, LOAD_OPS, OP_JAL, OP_JALR, OP_JR, STORE_OPS, op_names
+
+ROOT_FRAME = "main"
+
+
+class Profiler:
+    # region_size: load/store sayılarının toplandığı adres aralığının boyutu (byte)
+    def __init__(self, region_size=256, top=20):
+        if region_size <= 0 or region_size & (region_size - 1):
+            raise ValueError("Adres aralığı boyutu 2'nin kuvveti olmalı")
+        self.region_bits = region_size.bit_length() - 1
+        self.top = top
+        self.reset()
+
+    def reset(self):
+        self.instructions = 0
+        self.pc_counts = {}  # pc -> çalışma sayısı
+        self.branches = {}  # pc -> [alınan, alınmayan]
+        self.regions = {}  # aralık başlangıcı -> [load, store]
+        self.frames = [ROOT_FRAME]  # jal ile girilen fonksiyonlar
+        self.stack_key = ROOT_FRAME
+        self.stacks = {}  # "main;f;g" -> o yığında çalışan komut sayısı
+
+    # Çalışan bir komutu bildirir; address load/store'un eriştiği adres, targets (pc -> etiket) çağrı
+    # hedeflerini adlandırır
+    def observe(self, pc, inst, next_pc, address=None, targets=None):
+        op = inst[0]
+        self.instructions += 1
+        self.pc_counts[pc] = self.pc_counts.get(pc, 0) + 1
+        self.stacks[self.stack_key] = self.stacks.get(self.stack_key, 0) + 1
+        if op in BRANCH_OPS:
+            entry = self.branches.get(pc)
+            if entry is None:
+                entry = self.branches[pc] = [0, 0]
+            entry[0 if next_pc != pc + 1 else 1] += 1
+        elif address is not None:
+            region = address >> self.region_bits << self.region_bits
+            entry = self.regions.get(region)
+            if entry is None:
+                entry = self.regions[region] = [0, 0]
+            entry[0 if op in LOAD_OPS else 1] += 1
+        elif op == OP_JAL or op == OP_JALR:
+            self.frames.append(frame_name(next_pc, targets))
+            self.stack_key = ";".join(self.frames)
+        elif op == OP_JR and inst[1] == RA and len(self.frames) > 1:  # Fonksiyondan dönüş
+            self.frames.pop()
+            self.stack_key = ";".join(self.frames)
+
+    # pc'leri en çok çalışandan başlayarak sıralar
+    def hot_spots(self, instruction_memory=None):
+        total = self.instructions or 1
+        spots = []
+        for pc, count in sorted(self.pc_counts.items(), key=lambda item: (-item[1], item[0]))[:self.top]:
+            entry = {"pc": pc, "address": pc * 4, "count": count, "percent": 100.0 * count / total}
+            if instruction_memory is not None:
+                entry["instruction"] = instruction_memory[pc]
+            spots.append(entry)
+        return spots
+
+    # Geriye alınan dallanmalardan döngüleri bulur: [hedef, dallanma] aralığı ve içinde çalışan komutlar
+    def loops(self, decoded_program):
+        loops = []
+        for pc, (taken, not_taken) in self.branches.items():
+            target = decoded_program[pc][3]
+            if taken and 0 <= target <= pc:
+                body = sum(self.pc_counts.get(i, 0) for i in range(target, pc + 1))
+                loops.append({"start": target, "end": pc, "iterations": taken + not_taken,
+                              "instructions": body})
+        loops.sort(key=lambda loop: -loop["instructions"])
+        return loops[:self.top]
+
+    def report(self, decoded_program, instruction_memory=None):
+        opcodes = {}
+        for pc, count in self.pc_counts.items():
+            name = op_names.get(decoded_program[pc][0], "invalid")
+            opcodes[name] = opcodes.get(name, 0) + count
+        branches = []
+        for pc, (taken, not_taken) in sorted(self.branches.items()):
+            entry = {"pc": pc, "taken": taken, "not_taken": not_taken}
+            if instruction_memory is not None:
+                entry["instruction"] = instruction_memory[pc]
+            branches.append(entry)
+        size = 1 << self.region_bits
+        memory = [{"start": region, "end": region + size - 1, "loads": loads, "stores": stores}
+                  for region, (loads, stores) in sorted(self.regions.items())]
+        return {
+            "instructions": self.instructions,
+            "hot_spots": self.hot_spots(instruction_memory),
+            "loops": self.loops(decoded_program),
+            "opcodes": dict(sorted(opcodes.items(), key=lambda item: -item[1])),
+            "branches": branches,
+            "memory": memory,
+        }
+
+    # flamegraph.pl / speedscope ile okunabilen "çerçeve;çerçeve sayı" satırları
+    def folded_stacks(self):
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(self.stacks.items()))
+
+
+# Çağrı hedefini etiket adıyla, etiket yoksa byte adresiyle adlandırır
+def frame_name(pc, targets):
+    label = targets.get(pc) if targets else None
+    return label if label is not None else f"0x{pc * 4:08x}"
+
+
+# Programı komut komut çalıştırıp her komutu profiler'a bildirir; çalışan komut sayısını döndürür
+def run_profiled(machine, profiler, max_steps=None):
+    program = machine.decoded_program
+    registers = machine.registers
+    targets = {index: label for label, index in machine.labels.items()}
+    limit = -1 if max_steps is None else max_steps
+    count = 0
+    while count != limit and not machine.finished:
+        pc = machine.pc
+        inst = program[pc]
+        op = inst[0]
+        # Adres komut çalışmadan önce hesaplanır (lw taban register'ının üzerine yazabilir)
+        address = (registers[inst[2]] + inst[3]) & MASK if op in LOAD_OPS or op in STORE_OPS else None
+        machine.step()
+        profiler.observe(pc, inst, machine.pc, address, targets)
+        count += 1
+    return count
@@ -1,637 +1,436 @@
+import queue
 import tkinter as tk
 
-# 32 Register tanımı ve başlangıç değerleri
-register_names = [
-    "$zero", "$at", "$v0", "$v1", "$a0", "$a1", "$a2", "$a3",
-    "$t0", "$t1", "$t2", "$t3", "$t4", "$t5", "$t6", "$t7",
-    "$s0", "$s1", "$s2", "$s3", "$s4", "$s5", "$s6", "$s7",
-    "$t8", "$t9", "$k0", "$k1", "$gp", "$sp", "$fp", "$ra"
-]
-registers = {name: 0 for name in register_names}
-memory = [0] * 512  # 512 byte'lık bellek
-instruction_memory = [""] * 512  # 512 byte'lık Instruction Memory
-labels = {}  # Label'ların satır numaralarını tutar
-pc = 0  # Program Counter (Global olarak tanımlandı)
-realistic_pc = 0  # Donanımsal PC
-commands = []  # Komut listesi
-
-
-# Machine Code alanını güncelleyen fonksiyon
-def update_machine_code_display():
-    machine_code_text.delete("1.0", tk.END)
-    for i, instruction in enumerate(instruction_memory):
-        if instruction.strip():
-            binary_code = convert_to_machine_code(instruction)
-            machine_code_text.insert(tk.END, f"{i:03}: {binary_code}\n")  # Ok eklenmedi
-
-
-def convert_to_machine_code(instruction):
-    try:
-        parts = instruction.strip().split()
-        if not parts:
-            return "0000000000000000"  # Boş satırı varsayılan kod
-
-        opcode_map = {
-            "add": "000000",
-            "sub": "000001",
-            "and": "000010",
-            "or": "000011",
-            "slt": "000100",
-            "sll": "000101",
-            "srl": "000110",
-            "addi": "001000",
-            "sw": "001001",
-            "lw": "001010",
-            "beq": "001011",
-            "bne": "001100",
-            "j": "001101",
-            "jal": "001110",
-            "jr": "001111",
-        }
-
-        opcode = opcode_map.get(parts[0], "??????")
-        if opcode == "??????":
-            return f"INVALID ({parts[0]})"  # Geçersiz komut
-
-        if parts[0] in ["add", "sub", "and", "or", "slt", "sll", "srl"]:
-            rd, rs, rt = parts[1].rstrip(","), parts[2].rstrip(","), parts[3]
-            return f"{opcode}{register_names.index(rs):05b}{register_names.index(rt):05b}{register_names.index(rd):05b}00000"
-        elif parts[0] in ["addi"]:
-            rt, rs, imm = parts[1].rstrip(","), parts[2].rstrip(","), int(parts[3])
-            return f"{opcode}{register_names.index(rs):05b}{register_names.index(rt):05b}{imm & 0xFFFF:016b}"
-        elif parts[0] in {"lw", "sw"}:  # I-Type lw ve sw
-            try:
-                rt = format(register_names.index(parts[1].rstrip(",")), "05b")
-                offset, rs = parts[2].split("(")
-                rs = rs.rstrip(")")
-                rs = format(register_names.index(rs), "05b")
-                imm = format(int(offset), "016b")
-                return f"{opcode}{rs}{rt}{imm}"
-            except (ValueError, IndexError, KeyError):
-                return f"ERROR ({instruction}): Invalid memory access or format"
-
-        elif parts[0] in ["beq", "bne"]:
-            rs, rt, label = parts[1].rstrip(","), parts[2].rstrip(","), parts[3]
-            address = labels.get(label, 0)
-            return f"{opcode}{register_names.index(rs):05b}{register_names.index(rt):05b}{address:016b}"
-        elif parts[0] in ["j", "jal"]:
-            label = parts[1]
-            address = labels.get(label, 0)
-            return f"{opcode}{address:026b}"
-        elif parts[0] == "jr":
-            rs = parts[1]
-            return f"{opcode}{register_names.index(rs):05b}0000000000000000"
-
-        return "INVALID"  # Geçersiz komutlar için
-    except (ValueError, IndexError, KeyError) as e:
-        return f"ERROR ({instruction}): {e}"
-
-
-# Komutları yükleyen fonksiyon
-def load_commands():
-    global commands, labels, pc, realistic_pc
-    commands = input_text.get("1.0", tk.END).strip().split("\n")  # Çok satırlı input
-    labels = {}
-    pc = 0
-    realistic_pc = 0
-    cleaned_commands = []
-
-    for i, command in enumerate(commands):
-        command = command.strip()
-        if ":" in command:  # Etiket var mı kontrol et
-            parts = command.split(":")
-            label = parts[0].strip()
-            labels[label] = len(cleaned_commands)  # Etiketi geçerli komut satırına bağla
-            # Eğer ":" sonrası komut varsa, bunu da komut olarak ekle
-            if len(parts) > 1 and parts[1].strip():
-                cleaned_commands.append(parts[1].strip())
-        else:
-            cleaned_commands.append(command)
-
-    commands = cleaned_commands
-    result_label.config(text="Komutlar yüklendi! Step veya Run ile çalıştırabilirsiniz.", fg="blue")
-
-
-def process_labels():
-    global labels
-    for i, command in enumerate(commands):
-        command = command.strip()
-        if command and command[-1] == ":":  # Etiket satırı
-            label = command[:-1]  # ":" işaretini kaldır
-            labels[label] = i  # Etiketi labels sözlüğüne ekle
-
-
-# Tek bir komutu işleyen fonksiyon
-def step_command():
-    global pc, realistic_pc
-    instruction = fetch_instruction(pc)  # Instruction Memory'den komut al
-    if instruction is None or instruction.strip() == "":
-        result_label.config(text="Program sonlandı.", fg="green")
-        return
-
-    parts = instruction.strip().split()  # Komut parçalarını ayır
-
-    if not parts:  # Eğer boş bir satırsa, bir sonraki komuta geç
-        pc += 1
-        realistic_pc += 4
-        update_pc_display()
-        return
-
-    update_machine_code_display()
-
-    try:
-        if parts[0] == "add":  # R-Type add
-            rd, rs, rt = parts[1].rstrip(","), parts[2].rstrip(","), parts[3]
-            registers[rd] = registers[rs] + registers[rt]
-        elif parts[0] == "sub":  # R-Type sub
-            rd, rs, rt = parts[1].rstrip(","), parts[2].rstrip(","), parts[3]
-            registers[rd] = registers[rs] - registers[rt]
-        elif parts[0] == "and":  # R-Type and
-            rd, rs, rt = parts[1].rstrip(","), parts[2].rstrip(","), parts[3]
-            registers[rd] = registers[rs] & registers[rt]
-        elif parts[0] == "or":  # R-Type or
-            rd, rs, rt = parts[1].rstrip(","), parts[2].rstrip(","), parts[3]
-            registers[rd] = registers[rs] | registers[rt]
-        elif parts[0] == "slt":  # R-Type slt
-            rd, rs, rt = parts[1].rstrip(","), parts[2].rstrip(","), parts[3]
-            registers[rd] = 1 if registers[rs] < registers[rt] else 0
-        elif parts[0] == "sll":  # R-Type sll
-            rd, rt, shamt = parts[1].rstrip(","), parts[2].rstrip(","), int(parts[3])
-            registers[rd] = registers[rt] << shamt
-        elif parts[0] == "srl":  # R-Type srl
-            rd, rt, shamt = parts[1].rstrip(","), parts[2].rstrip(","), int(parts[3])
-            registers[rd] = registers[rt] >> shamt
-        elif parts[0] == "addi":  # I-Type addi
-            if len(parts) != 4:
-                result_label.config(text=f"Geçersiz addi komutu: {instruction}", fg="red")
-                return
-            try:
-                rt, rs, imm = parts[1].rstrip(","), parts[2].rstrip(","), int(parts[3])
-                if rt not in registers or rs not in registers:
-                    result_label.config(text=f"Geçersiz register: {rt} veya {rs}", fg="red")
-                    return
-                registers[rt] = registers[rs] + imm
-            except ValueError:
-                result_label.config(text=f"Geçersiz immediate değer: {parts[3]}", fg="red")
-                return
-        elif parts[0] == "sw":  # I-Type sw
-            rt, offset_rs = parts[1].rstrip(","), parts[2]
-            offset, rs = offset_rs.split("(")
-            rs = rs.rstrip(")")
-            address = registers[rs] + int(offset)
-            if 0 <= address < len(memory):  # Bellek sınırı kontrolü
-                memory[address] = registers[rt]
-                update_memory_display()  # Belleği güncelle
-            else:
-                result_label.config(text=f"Geçersiz bellek adresi: {address}", fg="red")
-                return
-
-        elif parts[0] == "lw":  # I-Type lw
-            rt, offset_rs = parts[1].rstrip(","), parts[2]
-            offset, rs = offset_rs.split("(")
-            rs = rs.rstrip(")")
-            address = registers[rs] + int(offset)
-            if 0 <= address < len(memory):  # Bellek sınırı kontrolü
-                registers[rt] = memory[address]
-            else:
-                result_label.config(text=f"Geçersiz bellek adresi: {address}", fg="red")
-                return
-
-        elif parts[0] == "beq":  # I-Type beq
-            rs, rt, label = parts[1].rstrip(","), parts[2].rstrip(","), parts[3]
-            if registers[rs] == registers[rt]:
-                if label in labels:
-                    pc = labels[label]  # Etiketle yönlendir
-                    realistic_pc = pc * 4  # Realistic PC'yi güncelle
-                    update_pc_display()
-                    update_instruction_memory_display()  # Dinamik olarak Instruction Memory'yi güncelle
-                    update_register_display()
-                    update_machine_code_display()  # Machine Code alanını güncelle
-                    return
-                else:
-                    result_label.config(text=f"Etiket bulunamadı: {label}", fg="red")
-                    return
-            else:
-                pc += 1
-                realistic_pc += 4
-                update_pc_display()
-                return
-
-        elif parts[0] == "bne":  # I-Type bne
-            rs, rt, label = parts[1].rstrip(","), parts[2].rstrip(","), parts[3]
-            if registers[rs] != registers[rt]:
-                if label in labels:
-                    pc = labels[label]  # Etiketle yönlendir
-                    realistic_pc = pc * 4  # Realistic PC'yi güncelle
-                    update_pc_display()
-                    update_instruction_memory_display()  # Instruction Memory'yi güncelle
-                    update_register_display()
-                    update_machine_code_display()  # Machine Code alanını güncelle
-                    return
-                else:
-                    result_label.config(text=f"Etiket bulunamadı: {label}", fg="red")
-                    return
-            pc += 1
-            realistic_pc += 1
-            update_memory_display()
-
-        elif parts[0] == "j":  # J-Type j
-            label = parts[1]
-            if label in labels:
-                pc = labels[label]
-                realistic_pc = pc * 4  # Realistic PC'yi güncelle
-                update_pc_display()
-                update_register_display()
-                update_machine_code_display()  # Machine Code alanını güncelle
-                return
-            else:
-                result_label.config(text=f"Etiket bulunamadı: {label}", fg="red")
-                return
-
-        elif parts[0] == "jal":  # J-Type jal
-            label = parts[1]
-            if label in labels:
-                registers["$ra"] = pc + 1  # Return Address
-                pc = labels[label]
-                realistic_pc = pc * 4  # Realistic PC'yi güncelle
-                update_pc_display()
-                update_register_display()
-                update_machine_code_display()  # Machine Code alanını güncelle
-                return
-            else:
-                result_label.config(text=f"Etiket bulunamadı: {label}", fg="red")
-                return
-
-        elif parts[0] == "jr":  # J-Type jr
-            rs = parts[1]
-            pc = registers[rs]
-            realistic_pc = pc * 4  # Realistic PC'yi güncelle
-            update_pc_display()
-            update_instruction_memory_display()
-            update_register_display()
-            update_machine_code_display()  # Machine Code alanını güncelle
-            result_label.config(text=f"Komut işlendi: jr {rs} (Realistic PC: {realistic_pc})",
-                                fg="blue")  # Doğru değeri yazdır
+from mips_assembler import format_machine_code, reassemble
+from mips_core import REGISTER_COUNT, ExecutionError, Machine, register_names, to_signed
+from mips_debug import Debugger, debug_engine
+from mips_history import History
+from mips_views import VirtualListView
+from mips_watchdog import Watchdog
+from mips_worker import RunWorker
+
+FRAME_MS = 33  # Run sırasında işçi kuyruğunun okunma ve ekranın boyanma aralığı (~30 FPS)
+DEFAULT_MAX_STEPS = 10000000  # Run başına varsayılan komut bütçesi
+DEFAULT_TIME_LIMIT = 60  # Run başına varsayılan süre sınırı (saniye)
+RECENT_REFRESHES = 3  # Yazılan bellek satırı bu kadar boyama boyunca vurgulu kalır
+CONSOLE_MAX_LINES = 1000  # Konsol panelinde tutulan en fazla satır (eskiler silinir)
+LIVE_DELAY_MS = 300  # Canlı assemble'da son tuş vuruşundan sonra yüklemeden önce beklenen süre
+
+
+# Machine nesnesi üzerinde ince bir Tkinter görünümü; tüm simülasyon durumu machine içindedir
+class SimulatorApp:
+    def __init__(self, root, machine):
+        self.root = root
+        self.machine = machine
+        self.running = False  # Run işçisi çalışıyor mu
+        self.worker = None  # Run sırasında programı çalıştıran RunWorker
+        self.debugger = None  # Son Run'daki breakpoint/watchpoint'ler
+        self.shown_registers = [None] * REGISTER_COUNT  # Ekranda en son gösterilen değerler
+        self.instruction_rows = []  # Görünümdeki satır -> komut indeksi (boş satırlar gösterilmez)
+        self.instruction_lines = {}  # komut indeksi -> görünümdeki satır
+        self.refresh_count = 0
+        self.recent_writes = {}  # bellek satırı -> yazıldığının görüldüğü boyama
+        self.console_chunks = None  # Konsol panelinin gösterdiği çıktı listesi (machine.console.chunks)
+        self.console_shown = 0  # Bu listeden panele yazılmış parça sayısı
+        self.program = None  # Son yüklenen assemble edilmiş program (mips_assembler önbelleğinden)
+        self.live_job = None  # Canlı kipte bekleyen yükleme (root.after kimliği)
+        self.history = History(machine)  # Step Back için periyodik anlık görüntüler
+        self.watchdog = Watchdog(machine)  # Run'ın komut bütçesi, süre sınırı ve sonsuz döngü tespiti
+        self.build_widgets()
+        self.update_register_display()
+        self.update_memory_display()
+
+    # Machine Code satırları yalnızca görünür oldukları zaman kodlanmış word'den biçimlenir
+    def machine_code_row(self, row):
+        i = self.instruction_rows[row]
+        return f"{i:03}: {format_machine_code(self.program, i)}"
+
+    # Tek bir komutu işleyen fonksiyon
+    def step_command(self):
+        machine = self.machine
+        if self.running:
             return
-
-        else:
-            result_label.config(text=f"Geçersiz komut: {instruction}", fg="red")
+        if machine.finished:
+            self.result_label.config(text="Program sonlandı.", fg="green")
             return
-    except KeyError:
-        result_label.config(text=f"Register hatası: {instruction}", fg="red")
-        return
-    except ValueError:
-        result_label.config(text=f"Geçersiz değer: {instruction}", fg="red")
-        return
-
-    pc += 1  # Bir sonraki komuta geç
-    realistic_pc += 4
-    update_pc_display()
-    update_register_display()
-    update_machine_code_display()  # Machine Code alanını güncelle
-    result_label.config(text=f"Komut işlendi: {instruction}", fg="blue")
-
-
-def run_command():
-    global pc, realistic_pc
-    while pc < len(instruction_memory):  # Program Counter, komut belleğinin sınırları içinde
-        instruction = fetch_instruction(pc)  # Komutu al
-        if instruction is None or instruction.strip() == "":  # Eğer komut yoksa programı sonlandır
-            break
-
-        parts = instruction.strip().split()  # Komut parçalarına ayır
-        if not parts:  # Eğer boş bir komutsa bir sonraki komuta geç
-            pc += 1
-            realistic_pc += 4
-            update_pc_display()
-            continue
 
+        instruction = machine.instruction_memory[machine.pc]
         try:
-            if parts[0] == "add":  # R-Type add
-                rd, rs, rt = parts[1].rstrip(","), parts[2].rstrip(","), parts[3]
-                registers[rd] = registers[rs] + registers[rt]
-            elif parts[0] == "sub":  # R-Type sub
-                rd, rs, rt = parts[1].rstrip(","), parts[2].rstrip(","), parts[3]
-                registers[rd] = registers[rs] - registers[rt]
-
-            elif parts[0] == "and":  # R-Type and
-                rd, rs, rt = parts[1].rstrip(","), parts[2].rstrip(","), parts[3]
-                registers[rd] = registers[rs] & registers[rt]
-            elif parts[0] == "or":  # R-Type or
-                rd, rs, rt = parts[1].rstrip(","), parts[2].rstrip(","), parts[3]
-                registers[rd] = registers[rs] | registers[rt]
-            elif parts[0] == "slt":  # R-Type slt
-                rd, rs, rt = parts[1].rstrip(","), parts[2].rstrip(","), parts[3]
-                registers[rd] = 1 if registers[rs] < registers[rt] else 0
-            elif parts[0] == "sll":  # R-Type sll
-                rd, rt, shamt = parts[1].rstrip(","), parts[2].rstrip(","), int(parts[3])
-                registers[rd] = registers[rt] << shamt
-            elif parts[0] == "srl":  # R-Type srl
-                rd, rt, shamt = parts[1].rstrip(","), parts[2].rstrip(","), int(parts[3])
-                registers[rd] = registers[rt] >> shamt
-
-            elif parts[0] == "addi":  # I-Type addi
-                rt, rs, imm = parts[1].rstrip(","), parts[2].rstrip(","), int(parts[3])
-                if rt in registers and rs in registers:
-                    registers[rt] = registers[rs] + imm
-                else:
-                    result_label.config(text=f"Geçersiz register: {rt} veya {rs}", fg="red")
-                    return
-
-            elif parts[0] == "sw":  # I-Type sw
-                rt, offset_rs = parts[1].rstrip(","), parts[2]
-                offset, rs = offset_rs.split("(")
-                rs = rs.rstrip(")")
-                address = registers[rs] + int(offset)
-                if 0 <= address < len(memory):  # Bellek sınırı kontrolü
-                    memory[address] = registers[rt]
-                    update_memory_display()  # Belleği güncelle
-                else:
-                    result_label.config(text=f"Geçersiz bellek adresi: {address}", fg="red")
-                    return
-
-            elif parts[0] == "lw":  # I-Type lw
-                rt, offset_rs = parts[1].rstrip(","), parts[2]
-                offset, rs = offset_rs.split("(")
-                rs = rs.rstrip(")")
-                address = registers[rs] + int(offset)
-                if 0 <= address < len(memory):  # Bellek sınırı kontrolü
-                    registers[rt] = memory[address]
-                else:
-                    result_label.config(text=f"Geçersiz bellek adresi: {address}", fg="red")
-                    return
-
-            elif parts[0] == "beq":  # I-Type beq
-                rs, rt, label = parts[1].rstrip(","), parts[2].rstrip(","), parts[3]
-                if rs in registers and rt in registers:
-                    if registers[rs] == registers[rt]:  # Dallanma
-                        if label in labels:
-                            pc = labels[label]
-                            realistic_pc = pc * 4
-                            update_instruction_memory_display()  # Dallanma sonrası komutları göster
-                            continue
-                        else:
-                            result_label.config(text=f"Etiket bulunamadı: {label}", fg="red")
-                            return
-            elif parts[0] == "bne":  # I-Type bne
-                rs, rt, label = parts[1].rstrip(","), parts[2].rstrip(","), parts[3]
-                if rs in registers and rt in registers:
-                    if registers[rs] != registers[rt]:  # Dallanma
-                        if label in labels:
-                            pc = labels[label]
-                            realistic_pc = pc * 4
-                            update_instruction_memory_display()  # Dallanma sonrası komutları göster
-                            continue
-                        else:
-                            result_label.config(text=f"Etiket bulunamadı: {label}", fg="red")
-                            return
-
-            elif parts[0] == "j":  # J-Type j
-                label = parts[1]
-                if label in labels:
-                    pc = labels[label]
-                    realistic_pc = pc * 4
-                    update_register_display()
-                    update_machine_code_display()  # Machine Code alanını güncelle
-                    return
-                else:
-                    result_label.config(text=f"Etiket bulunamadı: {label}", fg="red")
-                    return
-
-            elif parts[0] == "jal":  # J-Type jal
-                label = parts[1]
-                if label in labels:
-                    registers["$ra"] = pc + 1  # Return Address
-                    pc = labels[label]
-                    realistic_pc = pc * 4
-                    update_register_display()
-                    update_machine_code_display()  # Machine Code alanını güncelle
-                    return
-                else:
-                    result_label.config(text=f"Etiket bulunamadı: {label}", fg="red")
-                    return
-
-            elif parts[0] == "jr":  # J-Type jr
-                rs = parts[1]
-                pc = registers[rs]
-                realistic_pc = pc * 4
-                update_instruction_memory_display()
-                update_register_display()
-                update_machine_code_display()  # Machine Code alanını güncelle
-                return
-
-            elif parts[0] == "halt":  # Halt komutu
-                result_label.config(text="Program sonlandı.", fg="green")
-                break
-            else:
-                result_label.config(text=f"Geçersiz komut: {instruction}", fg="red")
-                return
-        except KeyError:
-            result_label.config(text=f"Register hatası: {instruction}", fg="red")
-            return
-        except ValueError:
-            result_label.config(text=f"Geçersiz değer: {instruction}", fg="red")
+            machine.step()
+        except ExecutionError as e:
+            self.result_label.config(text=str(e), fg="red")
             return
 
-        pc += 1  # Bir sonraki komuta geç
-        realistic_pc += 4
-        update_pc_display()
-
-    # İşlem tamamlandıktan sonra tüm ekranları güncelle
-    update_register_display()  # Register'ları güncelle
-    update_memory_display()  # Belleği güncelle
-    update_machine_code_display()
-    result_label.config(text="Program sonlandı.", fg="green")
-
+        self.history.record()
+        self.refresh()
+        self.result_label.config(text=f"Komut işlendi: {instruction} (Realistic PC: {machine.realistic_pc})",
+                                 fg="blue")
 
-# Register ekranını güncelleyen fonksiyon
-def update_register_display():
-    for i, name in enumerate(register_names):
-        register_labels[i][1].config(text=str(registers[name]))
-
-
-# Register ekranını güncelleyen fonksiyon
-def update_memory_display():
-    memory_text.delete("1.0", tk.END)
-    for i in range(0, len(memory), 4):  # 4 byte'lık bloklar halinde göster
-        values = " ".join(f"{val:03}" for val in memory[i:i + 4])
-        memory_text.insert(tk.END, f"{i:03}: {values}\n")
-
-
-def load_instruction_memory():
-    global instruction_memory
-    commands = input_text.get("1.0", tk.END).strip().split("\n")
-    for i, command in enumerate(commands):
-        if i < len(instruction_memory):
-            instruction_memory[i] = command.strip()
-        else:
-            result_label.config(text="Instruction Memory kapasitesini aştınız!", fg="red")
+    # Son komutu geri alır: en yakın anlık görüntüye dönülüp bir önceki adıma kadar yeniden çalıştırılır
+    def step_back_command(self):
+        if self.running:
             return
-    result_label.config(text="Instruction Memory yüklendi!", fg="blue")
-    update_instruction_memory_display()
-
-
-def fetch_instruction(pc):
-    if 0 <= pc < len(instruction_memory):
-        return instruction_memory[pc]
-    else:
-        result_label.config(text="Instruction Memory sınırını aştınız!", fg="red")
-        return None
-
-
-def update_pc_display():
-    realistic_pc_value_label.config(text=f"Realistic PC: {realistic_pc:03}")  # Realistic PC'yi göster
-
-
-def update_instruction_memory_display():
-    instruction_memory_text.delete("1.0", tk.END)
-    for i in range(pc, len(instruction_memory)):  # Yalnızca PC sonrası komutları göster
-        instruction = instruction_memory[i]
-        if instruction.strip():
-            instruction_memory_text.insert(tk.END, f"{i:03}: {instruction}\n")
-
-
-def load_all():
-    global labels, instruction_memory, pc
-    # Komutları çok satırlı girişten alın
-    instructions = input_text.get("1.0", tk.END).strip().split("\n")  # Input alanından komutlar
-    labels = {}  # Etiketleri sıfırla
-    pc = 0  # Program Counter'ı sıfırla
-    realistic_pc = 0
-    instruction_memory = [""] * 512  # Instruction Memory'yi sıfırla
-
-    # Komutları Instruction Memory'ye yükle
-    for i, instruction in enumerate(instructions):
-        instruction = instruction.strip()
-        if i < len(instruction_memory):
-            if ":" in instruction:  # Eğer bir etiket varsa
-                parts = instruction.split(":")
-                label = parts[0].strip()  # Etiket ismini al
-                labels[label] = i  # Etiketin bulunduğu satırı kaydet
-                if len(parts) > 1 and parts[1].strip():  # Etiket sonrası komut varsa
-                    instruction_memory[i] = parts[1].strip()  # Komut kısmını yükle
-                else:
-                    instruction_memory[i] = ""  # Sadece etiket varsa komut boş
+        if not self.history.step_back():
+            self.result_label.config(text="Geri alınacak komut yok.", fg="green")
+            return
+        self.refresh()
+        instruction = self.machine.instruction_memory[self.machine.pc]
+        self.result_label.config(text=f"Geri alındı: {instruction} (Realistic PC: {self.machine.realistic_pc})",
+                                 fg="blue")
+
+    # Run, programı bir işçi iş parçacığına (mips_worker) verir; Tk olay döngüsü serbest kalır.
+    # Çalışma sırasında ekran poll_worker ile FRAME_MS aralıklarla boyanır.
+    def run_command(self):
+        if self.running:
+            return
+        if self.machine.finished:
+            self.result_label.config(text="Program sonlandı.", fg="green")
+            return
+        try:
+            self.watchdog.max_steps = self.read_limit(self.max_steps_entry, int)
+            self.watchdog.time_limit = self.read_limit(self.time_limit_entry, float)
+        except ValueError:
+            self.result_label.config(text="Geçersiz sınır değeri", fg="red")
+            return
+        try:
+            debugger = Debugger.parse(self.breakpoints_entry.get(), self.watch_entry.get())
+            debugger.breakpoint_pcs(self.machine.labels)  # Bilinmeyen etiketleri çalıştırmadan önce yakala
+        except ValueError as e:
+            self.result_label.config(text=str(e), fg="red")
+            return
+        if debugger:
+            # Aynı breakpoint'te tekrar durmamak için önceki durma noktası korunur
+            debugger.resume_at = self.debugger.resume_at if self.debugger is not None else None
+            self.debugger = debugger
+        engine = debug_engine(debugger) if debugger else Machine.run
+        self.watchdog.start()
+        self.running = True
+        self.worker = RunWorker(self.machine, engine, self.watchdog, self.history)
+        self.worker.start()
+        self.result_label.config(text="Çalışıyor...", fg="blue")
+        self.root.after(FRAME_MS, self.poll_worker, self.worker)
+
+    # Boş bırakılan sınır None (sınırsız) demektir
+    def read_limit(self, entry, kind):
+        text = entry.get().strip()
+        if not text:
+            return None
+        value = kind(text)
+        if value <= 0:
+            raise ValueError(text)
+        return value
+
+    def pause_command(self):
+        if self.running and not self.worker.paused:
+            self.worker.pause()
+            self.result_label.config(text="Duraklatıldı.", fg="blue")
+
+    def resume_command(self):
+        if self.running and self.worker.paused:
+            self.worker.resume()
+            self.result_label.config(text="Çalışıyor...", fg="blue")
+
+    def stop_command(self):
+        if self.running:
+            self.worker.stop()  # İşçi bir sonraki parça sınırında durur ve "stopped" mesajı yazar
+
+    # İşçinin kuyruğundaki mesajları işler ve ekranı boyar; işçi bitene kadar kendini yeniden planlar
+    def poll_worker(self, worker):
+        if worker is not self.worker:  # Load ile durdurulmuş eski bir işçi
+            return
+        done = None
+        while True:
+            try:
+                message = worker.messages.get_nowait()
+            except queue.Empty:
+                break
+            if message[0] == "progress":
+                self.ips_label.config(text=f"IPS: {message[3]:,.0f}")
             else:
-                instruction_memory[i] = instruction  # Komutu doğrudan yükle
-        else:
-            result_label.config(text="Instruction Memory kapasitesini aştınız!", fg="red")
+                done = message
+        self.refresh()
+        if done is None:
+            self.root.after(FRAME_MS, self.poll_worker, worker)
             return
-
-    # Yükleme işlemi tamamlandı
-    result_label.config(text="Komutlar ve Instruction Memory yüklendi!", fg="blue")
-    update_instruction_memory_display()
-    update_machine_code_display()
-
-    # Komutları Instruction Memory'ye ve gerekli yapıya yükle
-    for i, command in enumerate(commands):
-        command = command.strip()
-        if i < len(instruction_memory):
-            instruction_memory[i] = command  # Instruction Memory'ye ekle
+        self.running = False
+        self.worker = None
+        kind = done[0]
+        if kind == "finished":
+            self.result_label.config(text="Program sonlandı.", fg="green")
+        elif kind == "stopped":
+            self.result_label.config(text=f"Durduruldu ({done[1]}. komut).", fg="green")
+        elif kind == "break":
+            self.result_label.config(text=done[1], fg="blue")
         else:
-            result_label.config(text="Instruction Memory kapasitesini aştınız!", fg="red")
+            self.result_label.config(text=done[1], fg="red")
+
+    # İşçiyi durdurur ve bitmesini bekler (makine başka bir iş parçacığında değiştirilmeden önce)
+    def stop_worker(self):
+        if self.worker is not None:
+            self.worker.stop()
+            self.worker.join()
+            self.worker = None
+        self.running = False
+
+    # Sadece son boyamadan beri değişen register, bellek satırı ve PC vurgusunu günceller
+    def refresh(self):
+        self.update_pc_display()
+        self.update_instruction_memory_display()
+        self.update_register_display()
+        self.update_memory_display()
+        self.update_console_display()
+
+    # Register ekranını güncelleyen fonksiyon
+    def update_register_display(self):
+        shown = self.shown_registers
+        for i, value in enumerate(self.machine.registers):
+            if shown[i] != value:
+                shown[i] = value
+                self.register_labels[i][1].config(text=str(to_signed(value)))
+
+    # Bellek ekranı sanal görünümdür: sadece görünen satırlar okunur, değişenler yamalanır ve kısa bir süre
+    # "written" ile vurgulanır
+    def update_memory_display(self):
+        view = self.memory_view
+        view.set_row_count(len(self.machine.memory) // 4)  # 4 byte'lık bloklar halinde göster
+        self.refresh_count += 1
+        for row in view.render():
+            self.recent_writes[row] = self.refresh_count
+        for row, seen in list(self.recent_writes.items()):
+            if self.refresh_count - seen >= RECENT_REFRESHES:
+                del self.recent_writes[row]
+        view.set_tag("written", self.recent_writes)
+
+    # Konsola yalnızca son boyamadan beri yazılan parçalar tek seferde eklenir. Konsol temizlenince ya da
+    # Step Back çıktıyı kısaltınca parça listesi yenilendiğinden panel baştan yazılır.
+    def update_console_display(self):
+        chunks = self.machine.console.chunks
+        text = self.console_text
+        if chunks is not self.console_chunks:
+            text.delete("1.0", tk.END)
+            self.console_chunks = chunks
+            self.console_shown = 0
+        if len(chunks) == self.console_shown:
             return
-
-        # Etiketleri ayıkla ve komutları işle
-        if ":" in command:  # Label kontrolü
-            parts = command.split(":")
-            label = parts[0].strip()
-            labels[label] = i  # Etiketin bulunduğu satırı kaydet
-            if len(parts) > 1 and parts[1].strip():  # Etiket sonrası komut varsa
-                commands[i] = parts[1].strip()
+        new = chunks[self.console_shown:]  # İşçi bu arada ekleyebilir; sadece alınan parçalar sayılır
+        self.console_shown += len(new)
+        text.insert(tk.END, "".join(new))
+        lines = int(text.index("end-1c").split(".")[0])
+        if lines > CONSOLE_MAX_LINES:
+            text.delete("1.0", f"{lines - CONSOLE_MAX_LINES + 1}.0")
+        text.see(tk.END)
+
+    def memory_row(self, row):
+        i = row * 4
+        values = " ".join(f"{val:03}" for val in self.machine.memory.read(i, 4))
+        return f"{i:03}: {values}"
+
+    def update_pc_display(self):
+        self.realistic_pc_value_label.config(
+            text=f"Realistic PC: {self.machine.realistic_pc:03}")  # Realistic PC'yi göster
+
+    # Sıradaki komutun satırı vurgulanır ve görünür tutulur
+    def update_instruction_memory_display(self):
+        row = self.instruction_lines.get(self.machine.pc)
+        view = self.instruction_view
+        if row is not None:
+            view.see(row)
+        view.set_tag("pc", () if row is None else (row,))
+
+    def instruction_row(self, row):
+        i = self.instruction_rows[row]
+        return f"{i:03}: {self.machine.instruction_memory[i]}"
+
+    # Yüklemeden sonra komut ve makine kodu görünümlerinin satırlarını hazırlar. Artımlı yüklemede dolu satırlar
+    # aynı kaldıysa görünümler baştan kurulmaz, sadece metni değişen görünür satırlar yamalanır.
+    def fill_instruction_memory_display(self, changed=None):
+        rows = [i for i, line in enumerate(self.machine.instruction_memory) if line.strip()]
+        if changed is not None and rows == self.instruction_rows:
+            self.instruction_view.render()
+            self.machine_code_view.render()
+            return
+        self.instruction_rows = rows
+        self.instruction_lines = {i: row for row, i in enumerate(self.instruction_rows)}
+        self.instruction_view.reset(len(self.instruction_rows))
+        self.machine_code_view.reset(len(self.instruction_rows))
+
+    # Canlı kipte her tuş vuruşu yüklemeyi LIVE_DELAY_MS erteler; yazmaya ara verilince Load yapılır
+    def input_changed(self, event=None):
+        if not self.live.get():
+            return
+        if self.live_job is not None:
+            self.root.after_cancel(self.live_job)
+        self.live_job = self.root.after(LIVE_DELAY_MS, self.live_load)
+
+    def live_load(self):
+        self.live_job = None
+        if not self.running:  # Çalışan (ya da duraklatılmış) bir Run yazarken kesilmez
+            self.load_all()
+
+    def load_all(self):
+        self.stop_worker()
+        machine = self.machine
+        try:
+            # Kaynak son yüklenen programa göre artımlı assemble edilir: yalnızca değişen satırlar (ve yeri
+            # değişen etiketlere başvuranlar) yeniden çözülüp kodlanır
+            program, changed = reassemble(self.program, self.input_text.get("1.0", tk.END),
+                                          len(machine.instruction_memory))
+            if changed is None:
+                machine.load_program(program.lines, program.labels, program.decoded, program.words)
             else:
-                commands[i] = ""  # Etiketi temizle
-        else:
-            commands[i] = command
-
-    result_label.config(text="Komutlar ve Instruction Memory yüklendi!", fg="blue")
-    update_instruction_memory_display()
-
-
-# Tkinter ana penceresi
-root = tk.Tk()
-root.title("MIPS Komut Simülatörü")
-
-# Ana çerçeve
-main_frame = tk.Frame(root)
-main_frame.pack(padx=10, pady=10)
-
-# Input alanı (çok satırlı)
-input_frame = tk.Frame(main_frame)
-input_frame.grid(row=0, column=0, padx=10)
-tk.Label(input_frame, text="Input:").pack(anchor="w")
-input_text = tk.Text(input_frame, width=40, height=20)
-input_text.pack()
-run_button = tk.Button(input_frame, text="Run", command=run_command)
-run_button.pack(pady=5)
-step_button = tk.Button(input_frame, text="Step", command=step_command)
-step_button.pack(pady=5)
-# Tek bir buton tanımlayın
-load_button = tk.Button(input_frame, text="Load", command=load_all)
-load_button.pack(pady=5)
-
-# Register alanı için kaydırılabilir pencere
-register_frame = tk.Frame(main_frame)
-register_frame.grid(row=0, column=1, padx=10)
-
-# Canvas ve Scrollbar ekleme
-canvas = tk.Canvas(register_frame)
-scrollbar = tk.Scrollbar(register_frame, orient="vertical", command=canvas.yview)
-scrollable_frame = tk.Frame(canvas)
-
-# Canvas ayarları
-canvas.configure(yscrollcommand=scrollbar.set)
-
-# Scrollable Frame içinde register'ları göster
-register_labels = []
-for i, name in enumerate(register_names):
-    reg_label = tk.Label(scrollable_frame, text=name, width=20, anchor="w")
-    reg_label.grid(row=i + 1, column=0, padx=5, pady=2)
-    value_label = tk.Label(scrollable_frame, text="0", width=10, anchor="w")
-    value_label.grid(row=i + 1, column=1, padx=5, pady=2)
-    register_labels.append((reg_label, value_label))
-
-# Memory alanı
-memory_frame = tk.Frame(main_frame)
-memory_frame.grid(row=0, column=2, padx=10)
-tk.Label(memory_frame, text=" Data Memory (512 bytes):").pack(anchor="w")
-memory_text = tk.Text(memory_frame, width=30, height=20)
-memory_text.pack()
-
-# Instruction Memory alanı
-instruction_memory_frame = tk.Frame(main_frame)
-instruction_memory_frame.grid(row=0, column=3, padx=10)
-tk.Label(instruction_memory_frame, text="Instruction Memory (512 bytes):").pack(anchor="w")
-instruction_memory_text = tk.Text(instruction_memory_frame, width=30, height=20)
-instruction_memory_text.pack()
-
-# Realistic PC alanı (Bellek alanlarının altında)
-pc_frame = tk.Frame(main_frame)
-pc_frame.grid(row=1, column=2, columnspan=2, pady=10)  # 2 sütuna yayılacak şekilde ayarlandı
-tk.Label(pc_frame, text="Realistic Program Counter:").grid(row=0, column=0, sticky="w")
-realistic_pc_value_label = tk.Label(pc_frame, text="Realistic PC: 000", width=15, anchor="w")
-realistic_pc_value_label.grid(row=0, column=1, sticky="w")
-
-# Machine Code ekranı (input'un altına eklenir)
-machine_code_frame = tk.Frame(main_frame)
-machine_code_frame.grid(row=1, column=0, padx=10, pady=10)
-
-tk.Label(machine_code_frame, text="Machine Code:").pack(anchor="w")
-machine_code_text = tk.Text(machine_code_frame, width=60, height=10)
-machine_code_text.pack()
-
-# Canvas ve Scrollbar yerleştir
-canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-scrollbar.pack(side="right", fill="y")
-canvas.pack(side="left", fill="both", expand=True)
-
-# Scrollable Frame boyutlarını ayarlama
-scrollable_frame.update_idletasks()  # Frame boyutlarını güncelle
-canvas.config(scrollregion=canvas.bbox("all"))  # Scrollregion'ı ayarla
-
-# Sonuç mesajı
-result_label = tk.Label(root, text="", fg="green")
-result_label.pack(pady=5)
-
-# Ana döngü
-root.mainloop()
+                machine.patch_program(program.lines, program.labels, program.decoded, program.words, changed)
+            machine.console.set_input(self.stdin_entry.get())  # read int syscall'larının girdisi
+        except ExecutionError as e:
+            self.result_label.config(text=str(e), fg="red")
+            return
+
+        # Yükleme işlemi tamamlandı
+        self.program = program
+        self.debugger = None
+        self.history.reset()
+        message = "Komutlar ve Instruction Memory yüklendi!"
+        if changed is not None:
+            message += f" ({len(changed)} satır yeniden assemble edildi)"
+        self.result_label.config(text=message, fg="blue")
+        self.fill_instruction_memory_display(changed)
+        self.refresh()
+
+    def build_widgets(self):
+        root = self.root
+        root.title("MIPS Komut Simülatörü")
+
+        # Ana çerçeve
+        main_frame = tk.Frame(root)
+        main_frame.pack(padx=10, pady=10)
+
+        # Input alanı (çok satırlı)
+        input_frame = tk.Frame(main_frame)
+        input_frame.grid(row=0, column=0, padx=10)
+        tk.Label(input_frame, text="Input:").pack(anchor="w")
+        self.input_text = tk.Text(input_frame, width=40, height=20)
+        self.input_text.pack()
+        self.input_text.bind("<KeyRelease>", self.input_changed)
+        run_button = tk.Button(input_frame, text="Run", command=self.run_command)
+        run_button.pack(pady=5)
+        pause_button = tk.Button(input_frame, text="Pause", command=self.pause_command)
+        pause_button.pack(pady=5)
+        resume_button = tk.Button(input_frame, text="Resume", command=self.resume_command)
+        resume_button.pack(pady=5)
+        stop_button = tk.Button(input_frame, text="Stop", command=self.stop_command)
+        stop_button.pack(pady=5)
+        step_button = tk.Button(input_frame, text="Step", command=self.step_command)
+        step_button.pack(pady=5)
+        step_back_button = tk.Button(input_frame, text="Step Back", command=self.step_back_command)
+        step_back_button.pack(pady=5)
+        # Tek bir buton tanımlayın
+        load_button = tk.Button(input_frame, text="Load", command=self.load_all)
+        load_button.pack(pady=5)
+        self.live = tk.BooleanVar(value=False)  # Yazarken otomatik yükle
+        tk.Checkbutton(input_frame, text="Live", variable=self.live).pack()
+
+        # Run sınırları (boş bırakılırsa sınırsız)
+        limits_frame = tk.Frame(input_frame)
+        limits_frame.pack(pady=5)
+        tk.Label(limits_frame, text="Max Steps:").grid(row=0, column=0, sticky="w")
+        self.max_steps_entry = tk.Entry(limits_frame, width=12)
+        self.max_steps_entry.insert(0, str(DEFAULT_MAX_STEPS))
+        self.max_steps_entry.grid(row=0, column=1)
+        tk.Label(limits_frame, text="Time Limit (s):").grid(row=1, column=0, sticky="w")
+        self.time_limit_entry = tk.Entry(limits_frame, width=12)
+        self.time_limit_entry.insert(0, str(DEFAULT_TIME_LIMIT))
+        self.time_limit_entry.grid(row=1, column=1)
+        tk.Label(limits_frame, text="Breakpoints:").grid(row=2, column=0, sticky="w")
+        self.breakpoints_entry = tk.Entry(limits_frame, width=12)  # ör. "12, loop"
+        self.breakpoints_entry.grid(row=2, column=1)
+        tk.Label(limits_frame, text="Watch:").grid(row=3, column=0, sticky="w")
+        self.watch_entry = tk.Entry(limits_frame, width=12)  # ör. "mem[0x10], $t0 == 10"
+        self.watch_entry.grid(row=3, column=1)
+        tk.Label(limits_frame, text="Stdin:").grid(row=4, column=0, sticky="w")
+        self.stdin_entry = tk.Entry(limits_frame, width=12)  # ör. "3 4" (Load sırasında okunur)
+        self.stdin_entry.grid(row=4, column=1)
+
+        # Register alanı için kaydırılabilir pencere
+        register_frame = tk.Frame(main_frame)
+        register_frame.grid(row=0, column=1, padx=10)
+
+        # Canvas ve Scrollbar ekleme
+        canvas = tk.Canvas(register_frame)
+        scrollbar = tk.Scrollbar(register_frame, orient="vertical", command=canvas.yview)
+        scrollable_frame = tk.Frame(canvas)
+
+        # Canvas ayarları
+        canvas.configure(yscrollcommand=scrollbar.set)
+
+        # Scrollable Frame içinde register'ları göster
+        self.register_labels = []
+        for i, name in enumerate(register_names + ["hi", "lo"]):  # register dizisinin sonunda HI ve LO
+            reg_label = tk.Label(scrollable_frame, text=name, width=20, anchor="w")
+            reg_label.grid(row=i + 1, column=0, padx=5, pady=2)
+            value_label = tk.Label(scrollable_frame, text="0", width=10, anchor="w")
+            value_label.grid(row=i + 1, column=1, padx=5, pady=2)
+            self.register_labels.append((reg_label, value_label))
+
+        # Memory alanı
+        memory_frame = tk.Frame(main_frame)
+        memory_frame.grid(row=0, column=2, padx=10)
+        tk.Label(memory_frame, text=f" Data Memory ({len(self.machine.memory)} bytes):").pack(anchor="w")
+        self.memory_view = VirtualListView(memory_frame, 30, 20, self.memory_row)
+        self.memory_view.tag_configure("written", background="light blue")  # Son yazılan satırlar
+        self.memory_view.pack()
+
+        # Instruction Memory alanı
+        instruction_memory_frame = tk.Frame(main_frame)
+        instruction_memory_frame.grid(row=0, column=3, padx=10)
+        tk.Label(instruction_memory_frame, text="Instruction Memory (512 bytes):").pack(anchor="w")
+        self.instruction_view = VirtualListView(instruction_memory_frame, 30, 20, self.instruction_row)
+        self.instruction_view.tag_configure("pc", background="yellow")  # Sıradaki komut
+        self.instruction_view.pack()
+
+        # Realistic PC alanı (Bellek alanlarının altında)
+        pc_frame = tk.Frame(main_frame)
+        pc_frame.grid(row=1, column=2, columnspan=2, pady=10)  # 2 sütuna yayılacak şekilde ayarlandı
+        tk.Label(pc_frame, text="Realistic Program Counter:").grid(row=0, column=0, sticky="w")
+        self.realistic_pc_value_label = tk.Label(pc_frame, text="Realistic PC: 000", width=15, anchor="w")
+        self.realistic_pc_value_label.grid(row=0, column=1, sticky="w")
+        self.ips_label = tk.Label(pc_frame, text="IPS: -", width=20, anchor="w")  # Run sırasında komut/saniye
+        self.ips_label.grid(row=0, column=2, sticky="w")
+
+        # Machine Code ekranı (input'un altına eklenir)
+        machine_code_frame = tk.Frame(main_frame)
+        machine_code_frame.grid(row=1, column=0, padx=10, pady=10)
+
+        tk.Label(machine_code_frame, text="Machine Code:").pack(anchor="w")
+        self.machine_code_view = VirtualListView(machine_code_frame, 60, 10, self.machine_code_row)
+        self.machine_code_view.pack()
+
+        # Konsol (syscall çıktısı, register alanının altında)
+        console_frame = tk.Frame(main_frame)
+        console_frame.grid(row=1, column=1, padx=10, pady=10)
+        tk.Label(console_frame, text="Console:").pack(anchor="w")
+        self.console_text = tk.Text(console_frame, width=40, height=10)
+        self.console_text.pack()
+
+        # Canvas ve Scrollbar yerleştir
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        scrollbar.pack(side="right", fill="y")
+        canvas.pack(side="left", fill="both", expand=True)
+
+        # Scrollable Frame boyutlarını ayarlama
+        scrollable_frame.update_idletasks()  # Frame boyutlarını güncelle
+        canvas.config(scrollregion=canvas.bbox("all"))  # Scrollregion'ı ayarla
+
+        # Sonuç mesajı
+        self.result_label = tk.Label(root, text="", fg="green")
+        self.result_label.pack(pady=5)
+
+
+def main():
+    # Tkinter ana penceresi
+    root = tk.Tk()
+    SimulatorApp(root, Machine())
+    # Ana döngü
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
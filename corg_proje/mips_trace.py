@@ -0,0 +1,208 @@
+# Çalışan her komut için diske sabit boyutlu bir ikili kayıt yazan iz (trace) kaydedici.
+# Kayıtlar bellekteki bir tampona paketlenir ve tampon dolunca tek seferde yazılır; dosya isteğe bağlı
+# olarak gzip, bz2 ya da lzma ile sıkıştırılır. read_trace kayıtları tembel (generator) olarak okur, böylece
+# milyonlarca komutluk izler sabit bellekle okunup karşılaştırılabilir.
+# Kullanım: python mips_trace.py iz.trc [--limit N]     (kayıtları yazdırır)
+#           python mips_trace.py eski.trc yeni.trc      (ilk farklı kaydı bulur)
+import argparse
+import bz2
+import gzip
+import lzma
+import struct
+import sys
+from collections import namedtuple
+
+from mips_core import MASK, OP_SC, ExecutionError
+from mips_isa import LOAD_OPS, MEMORY_WIDTHS, STORE_OPS, operands
+
+TRACE_MAGIC = b"MIPSTRC1"
+TRACE_HEADER = struct.Struct("<8sI")  # magic, kayıt boyutu
+# pc, word, hedef register, bayraklar, (2 byte boşluk), register değeri, bellek adresi, bellek değeri
+RECORD = struct.Struct("<IIBBxxIII")
+
+FLAG_REGISTER = 1  # Komut bir register'a yazdı
+FLAG_STORE = 2  # Komut belleğe yazdı (sw, sh, sb, sc)
+FLAG_LOAD = 4  # Komut bellekten okudu (lw, lh, lhu, lb, lbu, ll)
+
+COMPRESSIONS = {None: open, "gzip": gzip.open, "lzma": lzma.open, "bz2": bz2.open}
+EXTENSIONS = {".gz": "gzip", ".xz": "lzma", ".lzma": "lzma", ".bz2": "bz2"}
+
+TraceRecord = namedtuple("TraceRecord", "pc word register flags value address memory_value")
+
+
+# Dosya uzantısından sıkıştırma türünü tahmin eder (.gz, .xz, .bz2; diğerleri sıkıştırmasız)
+def compression_for(path):
+    for extension, compression in EXTENSIONS.items():
+        if path.endswith(extension):
+            return compression
+    return None
+
+
+class TraceWriter:
+    def __init__(self, path, compression="auto", buffer_records=8192):
+        if compression == "auto":
+            compression = compression_for(path)
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Geçersiz sıkıştırma: {compression}")
+        self.file = COMPRESSIONS[compression](path, "wb")
+        self.file.write(TRACE_HEADER.pack(TRACE_MAGIC, RECORD.size))
+        self.buffer = bytearray(RECORD.size * buffer_records)
+        self.offset = 0
+        self.records = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write(self, pc, word, register, flags, value, address, memory_value):
+        if self.offset == len(self.buffer):
+            self.flush()
+        RECORD.pack_into(self.buffer, self.offset, pc, word, register, flags, value, address, memory_value)
+        self.offset += RECORD.size
+        self.records += 1
+
+    def flush(self):
+        self.file.write(memoryview(self.buffer)[:self.offset])
+        self.offset = 0
+
+    def close(self):
+        if self.file is not None:
+            self.flush()
+            self.file.close()
+            self.file = None
+
+
+# Kayıtları sırayla üretir; sıkıştırma türü dosyanın ilk byte'larından anlaşılır
+def read_trace(path, chunk_records=8192):
+    with open(path, "rb") as f:
+        signature = f.read(6)
+    if signature.startswith(b"\x1f\x8b"):
+        opener = gzip.open
+    elif signature.startswith(b"\xfd7zXZ\x00"):
+        opener = lzma.open
+    elif signature.startswith(b"BZh"):
+        opener = bz2.open
+    else:
+        opener = open
+    with opener(path, "rb") as f:
+        header = f.read(TRACE_HEADER.size)
+        if len(header) != TRACE_HEADER.size:
+            raise ExecutionError(f"Geçersiz iz dosyası: {path}")
+        magic, record_size = TRACE_HEADER.unpack(header)
+        if magic != TRACE_MAGIC or record_size != RECORD.size:
+            raise ExecutionError(f"Geçersiz iz dosyası: {path}")
+        rest = b""
+        while True:
+            data = f.read(RECORD.size * chunk_records)
+            if not data:
+                break
+            data = rest + data
+            usable = len(data) - len(data) % RECORD.size
+            for fields in RECORD.iter_unpack(data[:usable]):
+                yield TraceRecord._make(fields)
+            rest = data[usable:]
+        if rest:
+            raise ExecutionError(f"Eksik iz kaydı: {path}")
+
+
+# Programı komut komut çalıştırıp her komut için bir kayıt yazar; çalışan komut sayısını döndürür.
+# word alanı, program makine koduyla yüklenmediyse 0'dır.
+def run_traced(machine, writer, max_steps=None):
+    program = machine.decoded_program
+    registers = machine.registers
+    memory = machine.memory
+    words = machine.text_words
+    write = writer.write
+    destinations = [operands(inst)[3] for inst in program]  # pc -> yazılan register (0: yok)
+    limit = -1 if max_steps is None else max_steps
+    count = 0
+    while count != limit and not machine.finished:
+        pc = machine.pc
+        inst = program[pc]
+        op = inst[0]
+        flags = address = memory_value = 0
+        if op in LOAD_OPS or op in STORE_OPS:
+            address = (registers[inst[2]] + inst[3]) & MASK  # Taban register'ı lw ile değişebilir
+            flags = FLAG_LOAD if op in LOAD_OPS else FLAG_STORE
+            stored = registers[inst[1]]  # sc bu register'a başarı bayrağını yazar
+        machine.step()
+        register = destinations[pc]
+        if register:
+            flags |= FLAG_REGISTER
+        if op == OP_SC:
+            if inst[1] and not registers[inst[1]]:  # Başarısız sc belleğe yazmaz
+                flags &= ~FLAG_STORE
+            memory_value = stored if flags & FLAG_STORE else 0
+        elif flags & FLAG_STORE:
+            memory_value = stored & ((1 << 8 * MEMORY_WIDTHS[op]) - 1)  # sb/sh register'ın alt byte'larını yazar
+        elif flags & FLAG_LOAD:
+            # Değer register'dan alınır (lb/lh'de işaret genişletilmiş); bellekten okumak önbellek istatistiklerini
+            # bozardı
+            if inst[1]:
+                memory_value = registers[inst[1]]
+            elif MEMORY_WIDTHS[op] == 4:
+                memory_value = memory.load_word(address)
+        write(pc, words[pc] if words is not None else 0, register, flags, registers[register], address,
+              memory_value)
+        count += 1
+    return count
+
+
+def format_record(record):
+    text = f"{record.pc:6} 0x{record.word:08x}"
+    if record.flags & FLAG_REGISTER:
+        text += f"  r{record.register}=0x{record.value:08x}"
+    if record.flags & FLAG_STORE:
+        text += f"  [0x{record.address:08x}]<-0x{record.memory_value:08x}"
+    elif record.flags & FLAG_LOAD:
+        text += f"  [0x{record.address:08x}]->0x{record.memory_value:08x}"
+    return text
+
+
+# İki izi kayıt kayıt karşılaştırır; ilk farkı (indeks, kayıt, kayıt) olarak, fark yoksa None döndürür.
+# İzlerden biri erken biterse eksik taraf None olur.
+def first_difference(path_a, path_b):
+    records_a, records_b = read_trace(path_a), read_trace(path_b)
+    index = 0
+    while True:
+        a, b = next(records_a, None), next(records_b, None)
+        if a != b:
+            return index, a, b
+        if a is None:
+            return None
+        index += 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="İkili iz dosyalarını okur ya da karşılaştırır.")
+    parser.add_argument("traces", nargs="+", help="Bir iz dosyası (yazdır) ya da iki iz dosyası (karşılaştır)")
+    parser.add_argument("--limit", type=int, default=None, help="Yazdırılacak en fazla kayıt sayısı")
+    args = parser.parse_args(argv)
+    if len(args.traces) > 2:
+        parser.error("En fazla iki iz dosyası verilebilir")
+
+    try:
+        if len(args.traces) == 2:
+            difference = first_difference(*args.traces)
+            if difference is None:
+                print("İzler aynı")
+                return 0
+            index, a, b = difference
+            print(f"İlk fark: kayıt {index}")
+            for path, record in zip(args.traces, (a, b)):
+                print(f"  {path}: {format_record(record) if record else 'iz bitti'}")
+            return 1
+        for index, record in enumerate(read_trace(args.traces[0])):
+            if index == args.limit:
+                break
+            print(format_record(record))
+    except (ExecutionError, OSError, EOFError, lzma.LZMAError) as e:
+        print(e, file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+# Basic-block çeviri motoru.
+# Yüklü program etiketlerde, dallanmalarda ve atlamalarda temel bloklara bölünür; her blok
+# register listesini güncelleyip bir sonraki pc'yi döndüren tek bir Python fonksiyonuna çevrilir.
+# Bloklar başlangıç pc'sine göre machine.block_cache içinde tutulur ve Machine.load ile temizlenir.
+from mips_core import MASK, SIGN, ExecutionError, RA
+from mips_isa import (BRANCH_OPS, HI, LO, OP_ADD, OP_ADDI, OP_ADDIU, OP_ADDU, OP_AND, OP_ANDI, OP_BEQ, OP_BGEZ,
+                      OP_BGTZ, OP_BLEZ, OP_BLTZ, OP_BNE, OP_J, OP_JAL, OP_JALR, OP_JR, OP_LB, OP_LBU, OP_LUI, OP_LW,
+                      OP_MFHI, OP_MFLO, OP_MTHI, OP_MTLO, OP_MUL, OP_MULT, OP_MULTU, OP_NOP, OP_NOR, OP_OR, OP_ORI,
+                      OP_SB, OP_SLL, OP_SLLV, OP_SLT, OP_SLTI, OP_SLTIU, OP_SLTU, OP_SRA, OP_SRAV, OP_SRL, OP_SRLV,
+                      OP_SUB, OP_SUBU, OP_SW, OP_XOR, OP_XORI)
+
+
+def _signed(operand):
+    return f"((r[{operand}] ^ {SIGN}) - {SIGN})"
+
+
+# Sonucu a register'ına yazılan komutlar: op -> (b, c) alanlarından değer ifadesini üreten fonksiyon
+EXPRESSIONS = {
+    OP_ADD: lambda b, c: f"(r[{b}] + r[{c}]) & {MASK}",
+    OP_ADDU: lambda b, c: f"(r[{b}] + r[{c}]) & {MASK}",
+    OP_SUB: lambda b, c: f"(r[{b}] - r[{c}]) & {MASK}",
+    OP_SUBU: lambda b, c: f"(r[{b}] - r[{c}]) & {MASK}",
+    OP_AND: lambda b, c: f"r[{b}] & r[{c}]",
+    OP_OR: lambda b, c: f"r[{b}] | r[{c}]",
+    OP_XOR: lambda b, c: f"r[{b}] ^ r[{c}]",
+    OP_NOR: lambda b, c: f"~(r[{b}] | r[{c}]) & {MASK}",
+    OP_SLT: lambda b, c: f"1 if r[{b}] ^ {SIGN} < r[{c}] ^ {SIGN} else 0",
+    OP_SLTU: lambda b, c: f"1 if r[{b}] < r[{c}] else 0",
+    OP_MUL: lambda b, c: f"({_signed(b)} * {_signed(c)}) & {MASK}",
+    OP_SLL: lambda b, c: f"(r[{b}] << {c}) & {MASK}",
+    OP_SRL: lambda b, c: f"r[{b}] >> {c}",
+    OP_SRA: lambda b, c: f"({_signed(b)} >> {c}) & {MASK}",
+    OP_SLLV: lambda b, c: f"(r[{b}] << (r[{c}] & 31)) & {MASK}",
+    OP_SRLV: lambda b, c: f"r[{b}] >> (r[{c}] & 31)",
+    OP_SRAV: lambda b, c: f"({_signed(b)} >> (r[{c}] & 31)) & {MASK}",
+    OP_MFHI: lambda b, c: f"r[{HI}]",
+    OP_MFLO: lambda b, c: f"r[{LO}]",
+    OP_ADDI: lambda b, c: f"(r[{b}] + {c}) & {MASK}",
+    OP_ADDIU: lambda b, c: f"(r[{b}] + {c}) & {MASK}",
+    OP_SLTI: lambda b, c: f"1 if r[{b}] ^ {SIGN} < {(c & MASK) ^ SIGN} else 0",
+    OP_SLTIU: lambda b, c: f"1 if r[{b}] < {c & MASK} else 0",
+    OP_ANDI: lambda b, c: f"r[{b}] & {c}",
+    OP_ORI: lambda b, c: f"r[{b}] | {c}",
+    OP_XORI: lambda b, c: f"r[{b}] ^ {c}",
+    OP_LUI: lambda b, c: f"{c << 16}",
+}
+# Koşullu dallanmalar: op -> (a, b) alanlarından koşul ifadesini üreten fonksiyon
+CONDITIONS = {
+    OP_BEQ: lambda a, b: f"r[{a}] == r[{b}]",
+    OP_BNE: lambda a, b: f"r[{a}] != r[{b}]",
+    OP_BLEZ: lambda a, b: f"r[{a}] & {SIGN} or not r[{a}]",
+    OP_BGTZ: lambda a, b: f"r[{a}] and not r[{a}] & {SIGN}",
+    OP_BLTZ: lambda a, b: f"r[{a}] & {SIGN}",
+    OP_BGEZ: lambda a, b: f"not r[{a}] & {SIGN}",
+}
+# Bellek erişimleri: op -> blok fonksiyonunun erişim parametresi
+ACCESSES = {OP_LW: "load_word", OP_LB: "load_byte", OP_LBU: "load_byte", OP_SW: "store_word", OP_SB: "store_byte"}
+
+JUMP_OPS = {OP_J, OP_JAL, OP_JR, OP_JALR}  # Bloktan düz devam etmeyen komutlar
+# Bloğu sonlandıran (kontrol akışını değiştiren) komutlar
+BLOCK_END_OPS = BRANCH_OPS | JUMP_OPS
+# Çevrilebilen komutlar; halt, syscall, ll/sc, div/divu, yarım word erişimleri, geçersiz komutlar ve bulunamayan
+# etiketler yorumlayıcıya bırakılır
+TRANSLATABLE_OPS = ({OP_NOP, OP_MULT, OP_MULTU, OP_MTHI, OP_MTLO} | EXPRESSIONS.keys() | ACCESSES.keys() |
+                    BLOCK_END_OPS)
+
+
+# Blok içinde bir komut hata verdiğinde, o komutun pc'si ve bloğun o ana kadar çalıştırdığı komut sayısı ile atılır
+class BlockFault(Exception):
+    def __init__(self, pc, executed, message):
+        super().__init__(message)
+        self.pc = pc
+        self.executed = executed
+
+
+def _translatable(inst):
+    op, a, b, c = inst
+    if op not in TRANSLATABLE_OPS:
+        return False
+    if op in BRANCH_OPS:
+        return c >= 0
+    if op in (OP_J, OP_JAL):
+        return a >= 0
+    return True
+
+
+# Tek bir komut için Python kaynak satırlarını üretir
+def _emit(pc, inst, executed):
+    op, a, b, c = inst
+    if op in EXPRESSIONS:
+        return [f"r[{a}] = {EXPRESSIONS[op](b, c)}"]
+    elif op in ACCESSES:
+        # Bellek hataları komutun pc'si ve bloğun o ana kadar çalıştırdığı komut sayısıyla yeniden atılır
+        address = f"(r[{b}] + {c}) & {MASK}"
+        if ACCESSES[op].startswith("load"):
+            access = f"value = {ACCESSES[op]}({address})"
+        else:
+            access = f"{ACCESSES[op]}({address}, r[{a}])"
+        lines = ["try:",
+                 f"    {access}",
+                 "except ExecutionError as e:",
+                 f"    raise BlockFault({pc}, {executed}, str(e))"]
+        if op == OP_LB and a:
+            lines.append(f"r[{a}] = ((value ^ 128) - 128) & {MASK}")
+        elif ACCESSES[op].startswith("load") and a:
+            lines.append(f"r[{a}] = value")
+        return lines
+    elif op in CONDITIONS:
+        return [f"if {CONDITIONS[op](a, b)}:", f"    return {c}"]
+    elif op == OP_MULT:
+        return [f"product = {_signed(a)} * {_signed(b)}", f"r[{HI}] = (product >> 32) & {MASK}",
+                f"r[{LO}] = product & {MASK}"]
+    elif op == OP_MULTU:
+        return [f"product = r[{a}] * r[{b}]", f"r[{HI}] = product >> 32", f"r[{LO}] = product & {MASK}"]
+    elif op == OP_MTHI:
+        return [f"r[{HI}] = r[{a}]"]
+    elif op == OP_MTLO:
+        return [f"r[{LO}] = r[{a}]"]
+    elif op == OP_J:
+        return [f"return {a}"]
+    elif op == OP_JAL:
+        return [f"r[{RA}] = {pc + 1}", f"return {a}"]
+    elif op == OP_JR:
+        return [f"return r[{a}]"]
+    elif op == OP_JALR:
+        return [f"target = r[{b}]"] + ([f"r[{a}] = {pc + 1}"] if a else []) + ["return target"]
+    return []  # nop
+
+
+# pc'den başlayan temel bloğu bulur ve (fonksiyon, komut sayısı) döndürür.
+# İlk komut çevrilemiyorsa komut sayısı 0'dır ve çağıran yorumlayıcıya düşer.
+def translate_block(machine, start):
+    program = machine.decoded_program
+    block_starts = set(machine.labels.values())
+    body = []
+    pc = start
+    while pc < machine.program_length:
+        inst = program[pc]
+        if pc != start and pc in block_starts:  # Etiketler yeni blok başlatır
+            break
+        if not _translatable(inst):
+            break
+        body.extend(_emit(pc, inst, pc - start))
+        pc += 1
+        if inst[0] in BLOCK_END_OPS:
+            break
+    length = pc - start
+    if length == 0:
+        return None, 0
+    if program[pc - 1][0] not in JUMP_OPS:
+        body.append(f"return {pc}")  # Blok sonundan düz devam
+
+    header = f"def block_{start}(r, load_word, store_word, load_byte, store_byte):\n"
+    source = header + "".join(f"    {line}\n" for line in body)
+    namespace = {"BlockFault": BlockFault, "ExecutionError": ExecutionError}
+    exec(compile(source, f"<mips block {start}>", "exec"), namespace)
+    return namespace[f"block_{start}"], length
+
+
+# Programı çevrilmiş bloklarla çalıştırır; Machine.run ile aynı sözleşme (çalışan komut sayısını döndürür).
+# max_steps'i aşacak bloklar ve çevrilemeyen komutlar tek tek yorumlayıcıda çalıştırılır.
+def run_blocks(machine, max_steps=None):
+    cache = machine.block_cache
+    registers = machine.registers
+    load_word = machine.memory.load_word
+    store_word = machine.memory.store_word
+    load_byte = machine.memory.load_byte
+    store_byte = machine.memory.store_byte
+    program_length = machine.program_length
+    limit = -1 if max_steps is None else max_steps
+    pc = machine.pc
+    count = 0
+    try:
+        while count != limit and 0 <= pc < program_length:
+            entry = cache.get(pc)
+            if entry is None:
+                entry = cache[pc] = translate_block(machine, pc)
+            block, length = entry
+            if length and (limit < 0 or count + length <= limit):
+                pc = block(registers, load_word, store_word, load_byte, store_byte)
+                count += length
+                continue
+            # Yorumlayıcıya düş: tek komut
+            machine.pc = pc
+            if machine.finished:
+                break
+            pc = machine.execute(pc, machine.decoded_program[pc])
+            count += 1
+    except BlockFault as e:
+        pc = e.pc
+        count += e.executed
+        raise ExecutionError(str(e)) from None
+    finally:
+        machine.pc = pc
+        machine.realistic_pc = pc * 4
+        machine.steps += count
+    return count
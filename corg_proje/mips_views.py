@@ -0,0 +1,111 @@
+# Sanal (virtualized) liste görünümü.
+# Text widget'ında yalnızca görünen pencere kadar satır tutulur; satır metinleri row_text(i) ile istenerek
+# üretilir. Kaydırma çubuğu tüm satır sayısına göre ayarlanır, kaydırınca sadece pencere yeniden çizilir.
+# Her render'da sadece metni değişen görünür satırlar yamalanır, böylece megabaytlarca bellek ya da uzun
+# programlar da sabit maliyetle gösterilir. Vurgular (tag) satır numarasıyla verilir ve görünürse uygulanır.
+import tkinter as tk
+
+WHEEL_ROWS = 3  # Fare tekerleğinin bir adımında kayan satır sayısı
+
+
+class VirtualListView:
+    def __init__(self, parent, width, height, row_text):
+        self.height = height
+        self.row_text = row_text  # satır numarası -> gösterilecek metin
+        self.row_count = 0
+        self.top = 0  # Penceredeki ilk satırın numarası
+        self.shown = []  # Ekrandaki satır metinleri
+        self.tags = {}  # tag -> vurgulanan satır numaraları
+
+        self.frame = tk.Frame(parent)
+        self.text = tk.Text(self.frame, width=width, height=height, wrap="none")
+        self.scrollbar = tk.Scrollbar(self.frame, orient="vertical", command=self.scroll)
+        self.scrollbar.pack(side="right", fill="y")
+        self.text.pack(side="left", fill="both", expand=True)
+        self.text.bind("<MouseWheel>", self.wheel)
+        self.text.bind("<Button-4>", self.wheel)  # X11 tekerlek olayları
+        self.text.bind("<Button-5>", self.wheel)
+
+    def pack(self, **options):
+        self.frame.pack(**options)
+
+    def tag_configure(self, tag, **options):
+        self.text.tag_configure(tag, **options)
+
+    # İçerik tamamen değiştiğinde (ör. yeni program) pencereyi başa alıp baştan çizer
+    def reset(self, count):
+        self.row_count = count
+        self.top = 0
+        self.shown = []
+        self.render()
+
+    def set_row_count(self, count):
+        if count == self.row_count:
+            return
+        self.row_count = count
+        self.top = max(0, min(self.top, count - self.height))
+        self.shown = []
+        self.render()
+
+    # Görünen satırları çizer; kaydırma olmadan metni değişen satırların numaralarını döndürür
+    def render(self):
+        last = min(self.top + self.height, self.row_count)
+        lines = [self.row_text(row) for row in range(self.top, last)]
+        changed = []
+        if len(lines) != len(self.shown):
+            self.text.delete("1.0", tk.END)
+            self.text.insert("1.0", "\n".join(lines))
+        else:
+            for n, (old, new) in enumerate(zip(self.shown, lines)):
+                if old != new:
+                    self.text.delete(f"{n + 1}.0", f"{n + 1}.end")
+                    self.text.insert(f"{n + 1}.0", new)
+                    changed.append(self.top + n)
+        self.shown = lines
+        self.apply_tags()
+        if self.row_count:
+            self.scrollbar.set(self.top / self.row_count, last / self.row_count)
+        else:
+            self.scrollbar.set(0, 1)
+        return changed
+
+    def set_tag(self, tag, rows):
+        rows = set(rows)
+        if rows != self.tags.get(tag):
+            self.tags[tag] = rows
+            self.apply_tags()
+
+    def apply_tags(self):
+        for tag, rows in self.tags.items():
+            self.text.tag_remove(tag, "1.0", tk.END)
+            for row in rows:
+                if self.top <= row < self.top + len(self.shown):
+                    line = row - self.top + 1
+                    self.text.tag_add(tag, f"{line}.0", f"{line}.end")
+
+    def scroll_to(self, top):
+        top = max(0, min(top, self.row_count - self.height))
+        if top != self.top:
+            self.top = top
+            self.shown = []  # Pencere kaydı, satırların hepsi yeniden yazılır
+            self.render()
+
+    # Satır görünmüyorsa pencereyi onu gösterecek kadar kaydırır
+    def see(self, row):
+        if row < self.top:
+            self.scroll_to(row)
+        elif row >= self.top + self.height:
+            self.scroll_to(row - self.height + 1)
+
+    # Kaydırma çubuğunun komutu: ("moveto", oran) ya da ("scroll", adım, "units"/"pages")
+    def scroll(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * self.row_count))
+        elif action == "scroll":
+            step = int(amount) * (self.height if unit == "pages" else 1)
+            self.scroll_to(self.top + step)
+
+    def wheel(self, event):
+        up = event.num == 4 or getattr(event, "delta", 0) > 0
+        self.scroll_to(self.top + (-WHEEL_ROWS if up else WHEEL_ROWS))
+        return "break"
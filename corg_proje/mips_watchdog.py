@@ -0,0 +1,76 @@
+# Run için bekçi: komut bütçesi, süre sınırı ve sonsuz döngü tespiti.
+# Motorlar parçalar (chunk) halinde çalıştırılır ve her parçadan sonra check() çağrılır; motorların iç
+# döngülerine ek maliyet binmez. Döngü tespiti parça sınırlarında (pc, register'lar, bellek özeti) üçlüsünün
+# özetini saklar: aynı tam durum ikinci kez görülürse program deterministik olduğundan sonsuza dek aynı
+# yolu izleyecektir. Bellek özeti durumun parçası olduğundan araya giren her sw tespiti sıfırlamış olur.
+import hashlib
+import time
+
+from mips_core import ExecutionError
+
+MAX_SEEN_STATES = 100000  # Saklanan durum özeti sayısı bunu aşınca liste temizlenir
+
+
+class Watchdog:
+    def __init__(self, machine, max_steps=None, time_limit=None, detect_loops=True):
+        self.machine = machine
+        self.max_steps = max_steps  # Bu çalıştırmada en fazla komut sayısı (None: sınırsız)
+        self.time_limit = time_limit  # Saniye (None: sınırsız)
+        self.detect_loops = detect_loops
+        self.start()
+
+    # Sayaçları şimdiki adım ve zamandan başlatır (her Run başında çağrılır)
+    def start(self):
+        self.start_steps = self.machine.steps
+        self.start_time = time.perf_counter()
+        self.seen = {}  # durum özeti -> ilk görüldüğü adım
+        self.reason = None  # Durdurma nedeni: "budget", "timeout" ya da "loop"
+
+    # Bütçeyi aşmamak için bir sonraki parçada çalıştırılabilecek en fazla komut
+    def chunk(self, size):
+        if self.max_steps is None:
+            return size
+        return max(0, min(size, self.start_steps + self.max_steps - self.machine.steps))
+
+    def state_key(self):
+        machine = self.machine
+        h = hashlib.blake2b(machine.registers.tobytes(), digest_size=16)
+        h.update(machine.pc.to_bytes(4, "little"))
+        h.update(machine.memory.digest())
+        # Girdi okuyan ya da heap ayıran bir döngü her turda farklı durumdadır
+        h.update(repr((machine.heap, machine.console.position)).encode())
+        return h.digest()
+
+    # Bir parça çalıştıktan sonra çağrılır; çalışma durdurulmalıysa nedeni açıklayan mesajı döndürür
+    def check(self):
+        machine = self.machine
+        executed = machine.steps - self.start_steps
+        if self.max_steps is not None and executed >= self.max_steps:
+            self.reason = "budget"
+            return f"Komut sınırına ulaşıldı: {self.max_steps}"
+        if self.time_limit is not None and time.perf_counter() - self.start_time > self.time_limit:
+            self.reason = "timeout"
+            return f"Süre sınırına ulaşıldı: {self.time_limit} s"
+        if self.detect_loops and not machine.finished:
+            key = self.state_key()
+            first = self.seen.get(key)
+            if first is not None:
+                self.reason = "loop"
+                return (f"Sonsuz döngü: {first}. ve {machine.steps}. komutlarda makine durumu aynı "
+                        f"(pc {machine.pc}: {machine.instruction_memory[machine.pc]})")
+            if len(self.seen) >= MAX_SEEN_STATES:
+                self.seen = {}
+            self.seen[key] = machine.steps
+        return None
+
+
+# Programı engine ile parçalar halinde çalıştırır; watchdog durdurursa ExecutionError verir
+def run_guarded(machine, engine, watchdog, chunk=20000):
+    watchdog.start()
+    count = 0
+    while not machine.finished:
+        count += engine(machine, watchdog.chunk(chunk))
+        reason = None if machine.finished else watchdog.check()
+        if reason is not None:
+            raise ExecutionError(reason)
+    return count
@@ -0,0 +1,79 @@
+# Programı Tk olay döngüsünden ayrı bir iş parçacığında (thread) çalıştıran işçi.
+# İşçi motoru parçalar halinde çalıştırır, her parçadan sonra bekçiyi (mips_watchdog) kontrol eder ve
+# ilerlemesini thread-safe bir kuyruğa yazar; GUI bu kuyruğu root.after ile okur ve widget'lara yalnızca
+# kendi iş parçacığından dokunur. Pause/Resume bir Event ile, Stop bir bayrakla parça sınırlarında işlenir.
+# Kuyruk mesajları: ("progress", adım, pc, ips), ("finished", adım), ("stopped", adım), ("break", mesaj),
+# ("error", mesaj)
+import queue
+import threading
+import time
+
+from mips_core import ExecutionError
+from mips_debug import BreakpointHit
+
+PROGRESS_SECONDS = 0.1  # İlerleme mesajları arasındaki en kısa süre
+CHUNK = 2000  # Pause/Stop ve bekçi kontrolleri arasında çalıştırılan komut sayısı
+
+
+class RunWorker(threading.Thread):
+    def __init__(self, machine, engine, watchdog, history=None, chunk=CHUNK):
+        super().__init__(daemon=True)
+        self.machine = machine
+        self.engine = engine  # Machine.run, run_blocks ya da run_words gibi
+        self.watchdog = watchdog
+        self.history = history
+        self.chunk = chunk
+        self.messages = queue.Queue()
+        self.resumed = threading.Event()
+        self.resumed.set()
+        self.stopped = False
+        self.paused_at = None
+
+    def pause(self):
+        if self.paused_at is None:
+            self.paused_at = time.perf_counter()
+            self.resumed.clear()
+
+    def resume(self):
+        if self.paused_at is not None:
+            self.watchdog.start_time += time.perf_counter() - self.paused_at  # Beklenen süre sınıra sayılmaz
+            self.paused_at = None
+            self.resumed.set()
+
+    @property
+    def paused(self):
+        return self.paused_at is not None
+
+    def stop(self):
+        self.stopped = True
+        self.resumed.set()  # Duraklatılmışsa uyandır
+
+    def run(self):
+        machine = self.machine
+        watchdog = self.watchdog
+        last_time = time.perf_counter()
+        last_steps = machine.steps
+        try:
+            while not machine.finished:
+                self.resumed.wait()
+                if self.stopped:
+                    self.messages.put(("stopped", machine.steps))
+                    return
+                self.engine(machine, watchdog.chunk(self.chunk))
+                if self.history is not None:
+                    self.history.record()
+                if machine.finished:
+                    break
+                reason = watchdog.check()
+                if reason is not None:
+                    raise ExecutionError(reason)
+                now = time.perf_counter()
+                if now - last_time >= PROGRESS_SECONDS:
+                    ips = (machine.steps - last_steps) / (now - last_time)
+                    self.messages.put(("progress", machine.steps, machine.pc, ips))
+                    last_time, last_steps = now, machine.steps
+            self.messages.put(("finished", machine.steps))
+        except BreakpointHit as e:
+            self.messages.put(("break", str(e)))
+        except ExecutionError as e:
+            self.messages.put(("error", str(e)))
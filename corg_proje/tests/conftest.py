@@ -0,0 +1,5 @@
+# Modüller corg_proje/ içinde düz olarak durur (paket değil); testler onları doğrudan import eder
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
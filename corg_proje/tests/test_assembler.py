@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+import mips_assembler
+from mips_assembler import assemble, reassemble
+from mips_fuzz import generate
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    mips_assembler._cache.clear()
+    yield
+    mips_assembler._cache.clear()
+
+
+# Artımlı sonuç, aynı kaynağın sıfırdan assemble edilmesiyle aynı olmalı
+def assert_same(program, source):
+    mips_assembler._cache.clear()
+    full = assemble(source)
+    assert program.lines == full.lines
+    assert program.labels == full.labels
+    assert program.decoded == full.decoded
+    assert list(program.words) == list(full.words)
+    assert program.errors == full.errors
+
+
+@pytest.mark.parametrize("line", [
+    "beq $t0, $zero, x",
+    "bgez $t0, x",
+    "j x",
+    "la $t0, x",
+    "addiu $t0, $zero, x",
+    "ori $t0, $zero, x",
+    "lui $t0, x",
+    "lw $t1, x($zero)",
+    "sb $t1, x($t2)",
+])
+def test_reassemble_follows_moved_label(line):
+    source = f"{line}\nnop\nnop\nx: nop\n"
+    previous = assemble(source)
+    edited = f"{line}\nnop\nnop\nnop\nx: nop\n"  # x 3'ten 4'e kayar
+    program, changed = reassemble(previous, edited)
+    assert 0 in changed
+    assert_same(program, edited)
+    # Önbelleğe yanlış program yazılmamalı
+    mips_assembler._cache.clear()
+    reassemble(previous, edited)
+    assert_same(assemble(edited), edited)
+
+
+def test_reassemble_shifted_branch_back_into_prefix():
+    source = "top: addiu $t0, $t0, 1\nnop\nbne $t0, $zero, top\n"
+    edited = "top: addiu $t0, $t0, 1\nnop\nli $t1, 0x12345678\nbne $t0, $zero, top\n"
+    program, _ = reassemble(assemble(source), edited)
+    assert_same(program, edited)
+
+
+def test_reassemble_random_edits():
+    rng = random.Random(1)
+    edits = ["li $t0, 0x12345678", "addiu $t1, $t1, 1", "nop", "bad instruction"]
+    for seed in range(40):
+        lines = generate(seed, 40).split("\n")
+        previous = assemble("\n".join(lines))
+        for _ in range(5):
+            i = rng.randrange(len(lines))
+            if rng.random() < 0.4 and len(lines) > 2:
+                del lines[i]
+            else:
+                lines.insert(i, rng.choice(edits))
+            source = "\n".join(lines)
+            previous, _ = reassemble(previous, source)
+            assert_same(previous, source)
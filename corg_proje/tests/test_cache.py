@@ -0,0 +1,65 @@
+import pytest
+
+from mips_cache import Cache, build_hierarchy, cache_report, parse_cache_spec
+from mips_core import Memory
+
+
+@pytest.mark.parametrize("spec", [
+    "block=0",
+    "block=2",
+    "block=24",
+    "ways=0",
+    "ways=-1",
+    "size=0",
+    "size=-16",
+    "size=8,block=16",
+    "size=48,block=16,ways=2",
+    "replacement=mru",
+    "write=write-around",
+])
+def test_rejects_invalid_config(spec):
+    with pytest.raises(ValueError):
+        Cache(Memory(), **parse_cache_spec(spec))
+
+
+def test_repeated_load_hits_one_block():
+    cache = Cache(Memory(), size=64, block_size=16)
+    for _ in range(10):
+        cache.load_word(4)
+    stats = cache.stats()
+    assert (stats["misses"], stats["hits"]) == (1, 9)
+
+
+# Tek kümeli 2 yollu önbellek: A, B, A, C, A. LRU'da C, B'yi atar; FIFO'da en eski olan A'yı atar.
+@pytest.mark.parametrize("replacement, misses, hits", [("lru", 3, 2), ("fifo", 4, 1)])
+def test_replacement_policy(replacement, misses, hits):
+    cache = Cache(Memory(), size=32, block_size=16, ways=2, replacement=replacement)
+    for address in (0, 16, 0, 32, 0):
+        cache.load_word(address)
+    stats = cache.stats()
+    assert (stats["misses"], stats["hits"]) == (misses, hits)
+
+
+# Tek satırlık önbellekte 0'a yazıp aynı satıra düşen 16'yı okur
+@pytest.mark.parametrize("spec, evictions, writebacks", [
+    ("write=write-back", 1, 1),
+    ("write=write-through", 0, 0),  # no-write-allocate: yazma satır ayırmaz
+    ("write=write-through,allocate=1", 1, 0),  # Temiz satır atılır, geri yazma olmaz
+])
+def test_write_policy_evictions(spec, evictions, writebacks):
+    cache = Cache(Memory(), size=16, block_size=16, **parse_cache_spec(spec))
+    cache.store_word(0, 1)
+    cache.load_word(16)
+    stats = cache.stats()
+    assert (stats["evictions"], stats["writebacks"]) == (evictions, writebacks)
+    assert cache.load_word(0) == 1  # Veri her zaman arkadaki bellekte
+
+
+def test_l1_misses_and_writebacks_reach_l2():
+    l1 = build_hierarchy(Memory(), "size=16,block=16", "size=256,block=16,ways=4")
+    l1.store_word(0, 1)  # L1 ıskası: L2'den 0 okunur (ıska)
+    l1.load_word(16)  # Kirli 0 L2'ye yazılır (isabet), 16 okunur (ıska)
+    l1.load_word(0)  # Temiz 16 atılır, 0 L2'den okunur (isabet)
+    first, second = cache_report(l1)
+    assert (first["misses"], first["writebacks"]) == (3, 1)
+    assert (second["reads"], second["writes"], second["misses"], second["hits"]) == (3, 1, 2, 2)
@@ -0,0 +1,17 @@
+import pytest
+
+from mips_assembler import assemble
+from mips_benchmark import read_workload, run_once, state_digest, workload_names
+from mips_cli import ENGINES
+
+
+# Her motor hazır iş yükünü bitirmeli ve referans motorla (step) aynı son duruma ulaşmalı
+@pytest.mark.parametrize("name", workload_names())
+def test_engines_reach_same_state(name):
+    program = assemble(read_workload(name))
+    assert not program.errors
+    digests = {}
+    for engine in ENGINES:
+        machine, _ = run_once(program, engine)
+        digests[engine] = state_digest(machine)
+    assert len(set(digests.values())) == 1, digests
@@ -0,0 +1,46 @@
+from mips_core import Memory
+from mips_memory import PagedMemory
+from mips_multicore import SP, LinkedMemory, MultiCore
+
+# Her hart yığınına kendi numarasını yazıp geri okur; yığınlar çakışırsa okunan değer başka hart'ınki olur
+STACK_PROGRAM = """
+        addi $sp, $sp, -4
+        sw $a0, 0($sp)
+        addi $t0, $zero, 0
+wait:   addi $t0, $t0, 1
+        slti $t1, $t0, 10
+        bne $t1, $zero, wait
+        lw $s0, 0($sp)
+        halt
+"""
+
+
+def test_harts_get_separate_stacks():
+    for memory in (Memory(), PagedMemory()):
+        multicore = MultiCore(4, memory, quantum=1)
+        multicore.load(STACK_PROGRAM)
+        assert len({hart.registers[SP] for hart in multicore.harts}) == 4
+        multicore.run(10000)
+        assert [hart.registers[16] for hart in multicore.harts] == [0, 1, 2, 3]
+
+
+def test_reservations_are_pruned_on_write():
+    memory = LinkedMemory(Memory())
+    for address in range(0, 64, 4):
+        _, token = memory.load_linked(address)
+        assert memory.store_conditional(address, 1, token)
+    memory.load_linked(0)
+    memory.store_byte(1, 5)
+    assert memory.versions == {}
+
+
+# Silinip yeniden açılan rezervasyon, silinmeden önce alınmış belirteçle eşleşmemeli
+def test_stale_reservation_fails_after_reopen():
+    memory = LinkedMemory(Memory())
+    _, first = memory.load_linked(0)
+    _, second = memory.load_linked(0)
+    assert memory.store_conditional(0, 1, second)
+    _, third = memory.load_linked(0)
+    assert not memory.store_conditional(0, 2, first)
+    assert memory.store_conditional(0, 3, third)
+    assert memory.load_word(0) == 3
@@ -0,0 +1,85 @@
+import random
+
+import pytest
+
+from mips_core import SNAPSHOT_PAGE_SIZE, Memory, store_half
+from mips_memory import PAGE_SIZE, STACK_TOP, PagedMemory
+
+
+def new_memory(kind):
+    return Memory(4 * SNAPSHOT_PAGE_SIZE) if kind == "flat" else PagedMemory()
+
+
+# Rastgele word/byte/half yazmaları; flat bellekte tüm alana, sayfalıda birkaç segmente dağılır
+def scribble(memory, rng, count):
+    bases = [0] if isinstance(memory, Memory) else [0x10000000, 0x10040000, STACK_TOP & ~(PAGE_SIZE - 1)]
+    span = 4 * SNAPSHOT_PAGE_SIZE if isinstance(memory, Memory) else 2 * PAGE_SIZE
+    for _ in range(count):
+        address = rng.choice(bases) + rng.randrange(0, span - 4, 4)
+        kind = rng.randrange(3)
+        if kind == 0:
+            memory.store_word(address, rng.getrandbits(32))
+        elif kind == 1:
+            memory.store_byte(address + rng.randrange(4), rng.getrandbits(8))
+        else:
+            store_half(memory, address + rng.choice((0, 2)), rng.getrandbits(16))
+
+
+def contents(memory):
+    return list(memory.nonzero_words())
+
+
+@pytest.mark.parametrize("kind", ["flat", "paged"])
+def test_snapshot_restore_round_trip(kind):
+    rng = random.Random(kind)
+    memory = new_memory(kind)
+    snapshots = []
+    expected = []
+    previous = None
+    for _ in range(20):
+        scribble(memory, rng, rng.randrange(1, 50))
+        previous = memory.snapshot_pages(previous)
+        snapshots.append(previous)
+        expected.append(contents(memory))
+    # Eski görüntülere rastgele sırayla dönülür; araya yazma ve yeni görüntü alma da girer
+    for _ in range(20):
+        index = rng.randrange(len(snapshots))
+        memory.restore_pages(snapshots[index])
+        assert contents(memory) == expected[index]
+        scribble(memory, rng, 10)
+        snapshot = memory.snapshot_pages(snapshots[rng.randrange(len(snapshots))])
+        state = contents(memory)
+        scribble(memory, rng, 10)
+        memory.restore_pages(snapshot)
+        assert contents(memory) == state
+
+
+@pytest.mark.parametrize("kind", ["flat", "paged"])
+def test_snapshot_shares_unwritten_pages(kind):
+    memory = new_memory(kind)
+    memory.store_word(0, 1)
+    memory.store_word(PAGE_SIZE, 2)
+    first = memory.snapshot_pages()
+    memory.store_word(PAGE_SIZE + 4, 3)
+    second = memory.snapshot_pages(first)
+    assert second[0] is first[0]
+    assert second[1] is not first[1]
+    # Yazılan ama içeriği değişmeyen sayfa da paylaşılır
+    memory.store_word(0, 1)
+    third = memory.snapshot_pages(second)
+    assert third[0] is first[0]
+    assert third[1] is second[1]
+
+
+@pytest.mark.parametrize("kind", ["flat", "paged"])
+def test_clear_then_snapshot(kind):
+    memory = new_memory(kind)
+    memory.store_word(8, 7)
+    first = memory.snapshot_pages()
+    memory.clear()
+    second = memory.snapshot_pages(first)
+    memory.store_word(8, 9)
+    memory.restore_pages(second)
+    assert contents(memory) == []
+    memory.restore_pages(first)
+    assert contents(memory) == [(8, 7)]